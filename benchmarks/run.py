@@ -0,0 +1,236 @@
+"""Run the aws-vibe-guru benchmarks offline and compare them with the stored baseline.
+
+Every scenario runs against the in-memory AWS stand-in (see ``standin.py``) with
+synthetic fixtures: a 1M-key bucket, 5k queues and 90 days of hourly datapoints. For
+each one the runner reports the best wall time of ``--repeat`` runs, the peak Python
+memory of a separate run traced with ``tracemalloc`` and the number of AWS API calls per
+operation.
+
+Results are compared with ``benchmarks/baseline.json`` when it exists (and was recorded
+at the same scale): more API calls than the baseline, or a wall time or peak memory
+above it by more than the tolerance, is a regression and makes the run exit with 1.
+Wall times depend on the machine, so record the baseline on the machine that checks it.
+
+Usage:
+    python benchmarks/run.py [--scale 0.1] [--only s3-] [--repeat 3]
+    python benchmarks/run.py --update-baseline
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCHMARKS_DIR), "src"))
+
+from scenarios import build_fixtures, build_scenarios  # noqa: E402
+from standin import AWSStandIn  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+DEFAULT_TIME_TOLERANCE = 0.25
+DEFAULT_MEMORY_TOLERANCE = 0.10
+# Differences below these are noise whatever the tolerance
+MIN_TIME_DIFFERENCE = 0.02
+MIN_MEMORY_DIFFERENCE = 1024 * 1024
+
+SERVICES = ("s3", "sqs", "cloudwatch", "sts")
+
+
+def _configure_environment(work_dir):
+    os.environ["AWS_VIBE_GURU_CACHE_DIR"] = os.path.join(work_dir, "cache")
+    os.environ["AWS_VIBE_GURU_METRIC_CACHE"] = "0"
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+
+def _attach_clients(standin):
+    """Route the shared clients every command uses to the stand-in."""
+    from aws_vibe_guru import aws_clients
+
+    aws_clients.clear_client_cache()
+    for service in SERVICES:
+        standin.attach(aws_clients.get_client(service))
+    # The account id is remembered per access key after the first run on a machine, so the
+    # scenarios start with it known instead of whichever one runs first paying the STS call
+    aws_clients.get_account_id()
+
+
+def _prepare(standin, cache_dir, setup=None):
+    """Start a run from an empty cache directory, like a first run on a new machine."""
+    from aws_vibe_guru.metric_store import close_metric_store
+
+    close_metric_store()
+    if os.path.isdir(cache_dir):
+        for name in os.listdir(cache_dir):
+            os.remove(os.path.join(cache_dir, name))
+    if setup:
+        setup()
+    standin.reset_calls()
+    gc.collect()
+
+
+def run_scenario(standin, func, repeat, cache_dir, setup=None):
+    """Measure one scenario.
+
+    ``setup``, when given, runs before every measured run and is neither timed nor
+    counted (e.g. a first run filling the metric store).
+
+    Returns:
+        dict: 'wall_seconds' (best of ``repeat`` runs), 'peak_memory_bytes' (tracemalloc
+              peak of one more run) and 'api_calls' (calls per operation of one run)
+    """
+    wall_times = []
+    api_calls = None
+    for _ in range(repeat):
+        _prepare(standin, cache_dir, setup)
+        start = time.perf_counter()
+        func()
+        wall_times.append(time.perf_counter() - start)
+        if api_calls is None:
+            api_calls = dict(sorted(standin.calls.items()))
+
+    _prepare(standin, cache_dir, setup)
+    tracemalloc.start()
+    try:
+        func()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"wall_seconds": min(wall_times), "peak_memory_bytes": peak_memory, "api_calls": api_calls}
+
+
+def _exceeds(value, reference, tolerance, min_difference):
+    return value - reference > max(reference * tolerance, min_difference)
+
+
+def compare(result, baseline, time_tolerance, memory_tolerance):
+    """List the regressions of a scenario result against its baseline entry."""
+    regressions = []
+    for operation, count in result["api_calls"].items():
+        expected = baseline["api_calls"].get(operation, 0)
+        if count > expected:
+            regressions.append(f"{operation} calls {expected} → {count}")
+    if _exceeds(result["wall_seconds"], baseline["wall_seconds"], time_tolerance, MIN_TIME_DIFFERENCE):
+        regressions.append(f"wall time {baseline['wall_seconds']:.3f}s → {result['wall_seconds']:.3f}s")
+    if _exceeds(result["peak_memory_bytes"], baseline["peak_memory_bytes"], memory_tolerance, MIN_MEMORY_DIFFERENCE):
+        regressions.append(
+            f"peak memory {_format_mb(baseline['peak_memory_bytes'])} → {_format_mb(result['peak_memory_bytes'])}"
+        )
+    return regressions
+
+
+def _format_mb(value):
+    return f"{value / (1024 * 1024):.1f} MB"
+
+
+def _format_change(value, reference):
+    if not reference:
+        return ""
+    return f" ({(value - reference) / reference * 100:+.0f}%)"
+
+
+def _print_result(name, result, baseline, regressions):
+    calls = ", ".join(f"{operation} {count:,}" for operation, count in result["api_calls"].items()) or "none"
+    wall = f"{result['wall_seconds']:.3f}s"
+    memory = _format_mb(result["peak_memory_bytes"])
+    if baseline:
+        wall += _format_change(result["wall_seconds"], baseline["wall_seconds"])
+        memory += _format_change(result["peak_memory_bytes"], baseline["peak_memory_bytes"])
+
+    status = "❌" if regressions else ("✅" if baseline else "•")
+    print(f"{status} {name:<38} {wall:>16} {memory:>18}")
+    print(f"    API calls: {calls}")
+    for regression in regressions:
+        print(f"    ❌ regression: {regression}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="Fixture size multiplier (default: 1.0)")
+    parser.add_argument("--only", action="append", help="Run only the scenarios whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per scenario, the best one is kept")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline file to compare with or update")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    parser.add_argument("--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE)
+    parser.add_argument("--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="aws-vibe-guru-bench-") as work_dir:
+        _configure_environment(work_dir)
+        cache_dir = os.environ["AWS_VIBE_GURU_CACHE_DIR"]
+
+        standin = AWSStandIn(os.environ["AWS_DEFAULT_REGION"])
+        start = time.perf_counter()
+        fixtures = build_fixtures(standin, args.scale)
+        _attach_clients(standin)
+        print(
+            f"Fixtures (scale {args.scale:g}): {fixtures['listing_keys']:,} keys, {len(fixtures['queue_names']):,} "
+            f"queues, {fixtures['text_files']:,} text files, {_format_mb(fixtures['large_text_bytes'])} text and "
+            f"{_format_mb(fixtures['large_object_bytes'])} binary objects "
+            f"(built in {time.perf_counter() - start:.1f}s)"
+        )
+
+        scenarios = build_scenarios(fixtures, os.path.join(work_dir, "downloads"))
+        if args.only:
+            scenarios = [scenario for scenario in scenarios if any(text in scenario[0] for text in args.only)]
+
+        baseline = {}
+        if os.path.exists(args.baseline) and not args.update_baseline:
+            with open(args.baseline, encoding="utf-8") as f:
+                stored = json.load(f)
+            if stored.get("scale") == args.scale:
+                baseline = stored["scenarios"]
+            else:
+                print(f"Baseline recorded at scale {stored.get('scale')}, not comparing")
+
+        print(f"  {'scenario':<38} {'wall time':>16} {'peak memory':>18}")
+        results = {}
+        failed = []
+        for name, func, *setup in scenarios:
+            results[name] = run_scenario(standin, func, max(args.repeat, 1), cache_dir, *setup)
+            regressions = (
+                compare(results[name], baseline[name], args.time_tolerance, args.memory_tolerance)
+                if name in baseline
+                else []
+            )
+            if regressions:
+                failed.append(name)
+            _print_result(name, results[name], baseline.get(name), regressions)
+
+    report = {
+        "scale": args.scale,
+        "recorded_at": datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "scenarios": results,
+    }
+    for path in filter(None, [args.json, args.baseline if args.update_baseline else None]):
+        if path == args.baseline and args.only and os.path.exists(path):
+            # Keep the baseline of the scenarios that were not run
+            with open(path, encoding="utf-8") as f:
+                report["scenarios"] = {**json.load(f)["scenarios"], **results}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"Results written to {path}")
+
+    if failed:
+        print(f"❌ {len(failed)} scenario(s) regressed: {', '.join(failed)}")
+        return 1
+    if baseline:
+        print("✅ No regression against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""Synthetic fixtures and the benchmark scenarios run against them.
+
+Every CLI command has a scenario (``s3-list-objects``, ``sqs-analyze-volume``, ...) that
+runs it in-process with its output discarded, and the library functions whose speed
+matters on their own have one as well (``aws_s3.list_bucket_objects``, ...). The metric
+store is disabled, except in the ``(warm)`` scenarios, which measure a second run after a
+first one filled it. Fixture sizes are the full-scale ones below multiplied by ``--scale``.
+"""
+
+import contextlib
+import datetime
+import os
+import shutil
+
+LISTING_KEYS = 1_000_000
+KEYS_PER_PREFIX = 5000
+QUEUES = 5000
+METRIC_DAYS = 90
+TEXT_FILES = 2000
+TEXT_FILE_LINES = 100
+LARGE_OBJECT_BYTES = 64 * 1024 * 1024
+LARGE_TEXT_BYTES = 8 * 1024 * 1024
+# Commands render every result, so they get as many names as a user would type; the
+# library scenarios cover the full fixtures
+CLI_QUEUES = 100
+CLI_FILES = 50
+WATCHED_QUEUES = 200
+CHART_WIDTH = 120
+
+LISTING_BUCKET = "bench-listing"
+DATA_BUCKET = "bench-data"
+TEXT_PREFIX = "logs/"
+LARGE_TEXT_KEY = "exports/events.log"
+LARGE_BINARY_KEY = "exports/dump.bin"
+
+
+def _scaled(value, scale, minimum=1):
+    return max(int(value * scale), minimum)
+
+
+def _log_lines(seed, count):
+    levels = ("INFO", "INFO", "INFO", "DEBUG", "WARN", "INFO", "INFO", "ERROR")
+    return "".join(
+        f"2024-01-01T{line % 24:02d}:{line % 60:02d}:00Z {levels[(seed + line) % len(levels)]} "
+        f"worker-{seed % 16} request_id={seed:05d}-{line:04d} processed batch of {(seed * line) % 500} records\n"
+        for line in range(count)
+    )
+
+
+def build_fixtures(standin, scale=1.0):
+    """Load the synthetic buckets, objects and queues into ``standin``.
+
+    Returns:
+        dict: Fixture sizes and names used by the scenarios
+    """
+    listing_keys = _scaled(LISTING_KEYS, scale)
+    text_files = _scaled(TEXT_FILES, scale)
+    queues = _scaled(QUEUES, scale)
+    large_bytes = _scaled(LARGE_OBJECT_BYTES, scale, minimum=1024 * 1024)
+    text_bytes = _scaled(LARGE_TEXT_BYTES, scale, minimum=1024 * 1024)
+
+    s3 = standin.s3
+    s3.add_bucket(LISTING_BUCKET)
+    s3.add_listing(
+        LISTING_BUCKET,
+        (
+            f"events/{index // KEYS_PER_PREFIX:03d}/{index % KEYS_PER_PREFIX:05d}.json"
+            for index in range(listing_keys)
+        ),
+    )
+
+    s3.add_bucket(DATA_BUCKET)
+    for index in range(text_files):
+        s3.add_object(DATA_BUCKET, f"{TEXT_PREFIX}app-{index:05d}.log", _log_lines(index, TEXT_FILE_LINES).encode())
+
+    text = _log_lines(0, 1000).encode()
+    s3.add_object(DATA_BUCKET, LARGE_TEXT_KEY, (text * (text_bytes // len(text) + 1))[:text_bytes])
+    pattern = bytes(range(256)) * 4096
+    s3.add_object(
+        DATA_BUCKET,
+        LARGE_BINARY_KEY,
+        (pattern * (large_bytes // len(pattern) + 1))[:large_bytes],
+        content_type="application/octet-stream",
+    )
+
+    queue_names = [f"queue-{index:05d}" for index in range(queues)]
+    standin.sqs.add_queues(queue_names)
+
+    return {
+        "listing_keys": listing_keys,
+        "text_files": text_files,
+        "large_object_bytes": large_bytes,
+        "large_text_bytes": text_bytes,
+        "queue_names": queue_names,
+        "queue_urls": [standin.sqs.url(name) for name in queue_names],
+    }
+
+
+def _run_cli(*args):
+    from aws_vibe_guru.cli import app
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        exit_code = app(list(args), prog_name="aws-vibe-guru", standalone_mode=False)
+    if exit_code:
+        raise RuntimeError(f"aws-vibe-guru {' '.join(args[:3])} ... exited with {exit_code}")
+
+
+def _with_metric_store(func):
+    """Run ``func`` with the metric store enabled (the runner disables it for the other scenarios)."""
+
+    def run():
+        previous = os.environ.get("AWS_VIBE_GURU_METRIC_CACHE")
+        os.environ["AWS_VIBE_GURU_METRIC_CACHE"] = "1"
+        try:
+            func()
+        finally:
+            if previous is None:
+                del os.environ["AWS_VIBE_GURU_METRIC_CACHE"]
+            else:
+                os.environ["AWS_VIBE_GURU_METRIC_CACHE"] = previous
+
+    return run
+
+
+def _warm(func):
+    """Return the (func, setup) of a scenario measuring ``func`` once a first run filled the metric store."""
+    run = _with_metric_store(func)
+    return run, run
+
+
+def _hourly_points():
+    start = datetime.datetime(2024, 1, 1)
+    return [
+        {
+            "timestamp": (start + datetime.timedelta(hours=hour)).strftime("%Y-%m-%d %H:%M UTC"),
+            "value": (hour * 2654435761) % 7200 + (3600 if hour % 24 > 8 else 0),
+        }
+        for hour in range(METRIC_DAYS * 24)
+    ]
+
+
+def build_scenarios(fixtures, work_dir):
+    """Return the scenarios as a list of (name, callable) pairs, or (name, callable, setup)
+    triples for the scenarios whose ``setup`` runs untimed before each measured run.
+
+    Args:
+        fixtures: Result of ``build_fixtures``
+        work_dir: Directory the download scenarios write into (emptied before each run)
+    """
+    from aws_vibe_guru import aws_s3, aws_sqs, cli_helpers
+
+    queue_names = fixtures["queue_names"]
+    queue_urls = fixtures["queue_urls"]
+    hourly_points = _hourly_points()
+
+    def get_metrics():
+        _run_cli("sqs-get-metrics", queue_names[0], "--days", "7")
+
+    def analyze_queues_volume():
+        aws_sqs.analyze_queues_volume(queue_urls, days=METRIC_DAYS)
+
+    def download_path(name):
+        shutil.rmtree(work_dir, ignore_errors=True)
+        os.makedirs(work_dir)
+        return os.path.join(work_dir, name)
+
+    return [
+        # CLI commands
+        ("sqs-list-queues", lambda: _run_cli("sqs-list-queues")),
+        ("sqs-get-attributes", lambda: _run_cli("sqs-get-attributes", queue_names[0])),
+        ("sqs-get-metrics", get_metrics),
+        ("sqs-get-metrics (warm)", *_warm(get_metrics)),
+        (
+            "sqs-get-oldest-message",
+            lambda: _run_cli(
+                "sqs-get-oldest-message", queue_names[0], "--days", str(METRIC_DAYS), "--period", "3600"
+            ),
+        ),
+        (
+            "sqs-analyze-volume",
+            lambda: _run_cli(
+                "sqs-analyze-volume", *queue_names[:CLI_QUEUES], "--days", str(METRIC_DAYS), "--concurrency", "8"
+            ),
+        ),
+        (
+            "sqs-watch",
+            lambda: _run_cli("sqs-watch", *queue_names[:WATCHED_QUEUES], "--iterations", "1"),
+        ),
+        ("s3-list-buckets", lambda: _run_cli("s3-list-buckets")),
+        ("s3-list-objects", lambda: _run_cli("s3-list-objects", LISTING_BUCKET)),
+        ("s3-list-objects --summary", lambda: _run_cli("s3-list-objects", LISTING_BUCKET, "--summary")),
+        (
+            "s3-list-objects --summary --workers 8",
+            lambda: _run_cli("s3-list-objects", LISTING_BUCKET, "--summary", "--workers", "8"),
+        ),
+        ("s3-get-object", lambda: _run_cli("s3-get-object", DATA_BUCKET, LARGE_BINARY_KEY)),
+        ("s3-read-object", lambda: _run_cli("s3-read-object", DATA_BUCKET, LARGE_TEXT_KEY)),
+        ("s3-read-folder", lambda: _run_cli("s3-read-folder", DATA_BUCKET, TEXT_PREFIX, "--max", str(CLI_FILES))),
+        ("s3-grep", lambda: _run_cli("s3-grep", DATA_BUCKET, TEXT_PREFIX, r"ERROR worker-3 .* of 4\d\d")),
+        (
+            "s3-download",
+            lambda: _run_cli("s3-download", DATA_BUCKET, LARGE_BINARY_KEY, download_path("dump.bin"), "--no-resume"),
+        ),
+        # Library functions
+        ("aws_s3.list_bucket_objects", lambda: aws_s3.list_bucket_objects(LISTING_BUCKET)),
+        ("aws_s3.read_folder_contents", lambda: aws_s3.read_folder_contents(DATA_BUCKET, TEXT_PREFIX)),
+        ("aws_sqs.list_sqs_queues", lambda: aws_sqs.list_sqs_queues()),
+        ("aws_sqs.analyze_queue_volume", lambda: aws_sqs.analyze_queue_volume(queue_urls[0], days=METRIC_DAYS)),
+        ("aws_sqs.analyze_queues_volume", analyze_queues_volume),
+        ("aws_sqs.analyze_queues_volume (warm)", *_warm(analyze_queues_volume)),
+        (
+            "cli_helpers.create_bar_chart",
+            lambda: cli_helpers.create_bar_chart(hourly_points, label_key="timestamp", max_width=CHART_WIDTH),
+        ),
+    ]
@@ -0,0 +1,378 @@
+"""Offline stand-in for the S3, SQS, CloudWatch and STS APIs used by aws-vibe-guru.
+
+``AWSStandIn.attach(client)`` registers two handlers on a real botocore client, the same
+hooks ``botocore.stub.Stubber`` relies on: ``before-parameter-build`` keeps the request
+parameters and ``before-call`` answers the request from in-memory backends, so every call
+still goes through parameter validation, serialization and endpoint resolution but never
+reaches the network. Each answered call is counted per ``service.Operation``.
+"""
+
+import bisect
+import calendar
+import collections
+import datetime
+import hashlib
+import io
+import threading
+import zlib
+
+from botocore.awsrequest import AWSResponse
+from botocore.response import StreamingBody
+
+ACCOUNT_ID = "123456789012"
+EPOCH = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+MAX_KEYS_PER_PAGE = 1000
+MAX_QUEUES_PER_PAGE = 1000
+# GetMetricData returns at most this many datapoints per response
+MAX_DATAPOINTS_PER_RESPONSE = 100800
+STORAGE_CLASSES = ("STANDARD", "STANDARD", "STANDARD", "STANDARD_IA", "GLACIER")
+
+
+class StandInError(Exception):
+    """Raised by a backend to answer a call with an AWS error response."""
+
+    def __init__(self, code, message, status_code=400):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status_code = status_code
+
+
+def _to_epoch(value):
+    return calendar.timegm(value.utctimetuple())
+
+
+def _parse_range(value, size):
+    start, _, end = value[len("bytes=") :].partition("-")
+    if not start:
+        start, end = max(size - int(end), 0), size - 1
+    else:
+        start, end = int(start), min(int(end), size - 1) if end else size - 1
+    if start >= size or end < start:
+        raise StandInError("InvalidRange", "The requested range is not satisfiable", 416)
+    return start, end
+
+
+class S3Backend:
+    def __init__(self):
+        self.buckets = {}
+
+    def add_bucket(self, name):
+        self.buckets[name] = {"keys": [], "objects": {}, "created": EPOCH}
+
+    def add_listing(self, bucket_name, keys):
+        """Add objects that are only listed (their content is never read)."""
+        bucket = self.buckets[bucket_name]
+        bucket["keys"].extend(keys)
+        bucket["keys"].sort()
+
+    def add_object(self, bucket_name, key, content, content_type="text/plain"):
+        bucket = self.buckets[bucket_name]
+        bisect.insort(bucket["keys"], key)
+        bucket["objects"][key] = {
+            "content": content,
+            "etag": hashlib.md5(content).hexdigest(),
+            "content_type": content_type,
+        }
+
+    def _bucket(self, params):
+        bucket = self.buckets.get(params["Bucket"])
+        if bucket is None:
+            raise StandInError("NoSuchBucket", "The specified bucket does not exist", 404)
+        return bucket
+
+    def _entry(self, bucket, key):
+        index = bisect.bisect_left(bucket["keys"], key)
+        if index == len(bucket["keys"]) or bucket["keys"][index] != key:
+            return None, None
+        stored = bucket["objects"].get(key)
+        size = len(stored["content"]) if stored else zlib.crc32(key.encode()) % 4_000_000 + 100
+        entry = {
+            "Key": key,
+            "Size": size,
+            "LastModified": EPOCH + datetime.timedelta(seconds=index * 7),
+            "ETag": f'"{stored["etag"]}"' if stored else f'"{index:032x}"',
+            "StorageClass": STORAGE_CLASSES[index % len(STORAGE_CLASSES)],
+        }
+        return entry, stored
+
+    def ListBuckets(self, params):
+        return {
+            "Buckets": [{"Name": name, "CreationDate": bucket["created"]} for name, bucket in self.buckets.items()],
+            "Owner": {"ID": ACCOUNT_ID},
+        }
+
+    def ListObjectsV2(self, params):
+        keys = self._bucket(params)["keys"]
+        prefix = params.get("Prefix", "")
+        delimiter = params.get("Delimiter")
+        max_keys = min(params.get("MaxKeys", MAX_KEYS_PER_PAGE), MAX_KEYS_PER_PAGE)
+
+        after = params.get("ContinuationToken") or params.get("StartAfter")
+        index = bisect.bisect_right(keys, after) if after else 0
+        index = max(index, bisect.bisect_left(keys, prefix))
+
+        contents = []
+        common_prefixes = []
+        last = None
+        while index < len(keys) and len(contents) + len(common_prefixes) < max_keys:
+            key = keys[index]
+            if not key.startswith(prefix):
+                break
+            rest = key[len(prefix) :]
+            if delimiter and delimiter in rest:
+                common_prefix = prefix + rest[: rest.index(delimiter) + len(delimiter)]
+                common_prefixes.append({"Prefix": common_prefix})
+                index = bisect.bisect_left(keys, common_prefix + "\U0010ffff")
+                last = keys[index - 1]
+                continue
+            contents.append(self._entry(self.buckets[params["Bucket"]], key)[0])
+            last = key
+            index += 1
+
+        truncated = index < len(keys) and keys[index].startswith(prefix)
+        response = {
+            "Name": params["Bucket"],
+            "Prefix": prefix,
+            "KeyCount": len(contents) + len(common_prefixes),
+            "MaxKeys": max_keys,
+            "IsTruncated": truncated,
+        }
+        if contents:
+            response["Contents"] = contents
+        if common_prefixes:
+            response["CommonPrefixes"] = common_prefixes
+        if truncated:
+            response["NextContinuationToken"] = last
+        return response
+
+    def _object(self, params):
+        entry, stored = self._entry(self._bucket(params), params["Key"])
+        if entry is None:
+            raise StandInError("NoSuchKey", "The specified key does not exist", 404)
+        if stored is None:
+            # Listing-only objects have no content; reading one is a fixture mistake
+            raise StandInError("AccessDenied", f"No content stored for {params['Key']}", 403)
+        if "IfMatch" in params and params["IfMatch"] != entry["ETag"]:
+            raise StandInError("PreconditionFailed", "At least one of the preconditions did not hold", 412)
+        return entry, stored
+
+    def HeadObject(self, params):
+        entry, stored = self._object(params)
+        return {
+            "ContentLength": entry["Size"],
+            "LastModified": entry["LastModified"],
+            "ETag": entry["ETag"],
+            "ContentType": stored["content_type"],
+            "StorageClass": entry["StorageClass"],
+            "Metadata": {},
+        }
+
+    def GetObject(self, params):
+        entry, stored = self._object(params)
+        content = stored["content"]
+        response = {
+            "LastModified": entry["LastModified"],
+            "ETag": entry["ETag"],
+            "ContentType": stored["content_type"],
+        }
+        if "Range" in params:
+            start, end = _parse_range(params["Range"], len(content))
+            content = content[start : end + 1]
+            response["ContentRange"] = f"bytes {start}-{end}/{entry['Size']}"
+        response["ContentLength"] = len(content)
+        response["Body"] = StreamingBody(io.BytesIO(content), len(content))
+        return response
+
+
+class SQSBackend:
+    def __init__(self, region):
+        self.region = region
+        self.names = []
+
+    def add_queues(self, names):
+        self.names.extend(names)
+        self.names.sort()
+
+    def url(self, name):
+        return f"https://sqs.{self.region}.amazonaws.com/{ACCOUNT_ID}/{name}"
+
+    def _index(self, name):
+        index = bisect.bisect_left(self.names, name)
+        if index == len(self.names) or self.names[index] != name:
+            raise StandInError("AWS.SimpleQueueService.NonExistentQueue", "The specified queue does not exist")
+        return index
+
+    def ListQueues(self, params):
+        prefix = params.get("QueueNamePrefix", "")
+        max_results = min(params.get("MaxResults", MAX_QUEUES_PER_PAGE), MAX_QUEUES_PER_PAGE)
+        start = int(params["NextToken"]) if "NextToken" in params else bisect.bisect_left(self.names, prefix)
+
+        names = []
+        index = start
+        while index < len(self.names) and len(names) < max_results and self.names[index].startswith(prefix):
+            names.append(self.names[index])
+            index += 1
+
+        response = {"QueueUrls": [self.url(name) for name in names]}
+        if index < len(self.names) and self.names[index].startswith(prefix):
+            response["NextToken"] = str(index)
+        return response
+
+    def GetQueueUrl(self, params):
+        self._index(params["QueueName"])
+        return {"QueueUrl": self.url(params["QueueName"])}
+
+    def GetQueueAttributes(self, params):
+        name = params["QueueUrl"].rsplit("/", 1)[-1]
+        index = self._index(name)
+        attributes = {
+            "ApproximateNumberOfMessages": str(index * 37 % 5000),
+            "ApproximateNumberOfMessagesNotVisible": str(index * 11 % 300),
+            "ApproximateNumberOfMessagesDelayed": str(index % 7),
+            "CreatedTimestamp": str(_to_epoch(EPOCH)),
+            "LastModifiedTimestamp": str(_to_epoch(EPOCH)),
+            "MessageRetentionPeriod": "345600",
+            "MaximumMessageSize": "262144",
+            "VisibilityTimeout": "30",
+            "ReceiveMessageWaitTimeSeconds": "20",
+            "DelaySeconds": "0",
+            "QueueArn": f"arn:aws:sqs:{self.region}:{ACCOUNT_ID}:{name}",
+        }
+        requested = params.get("AttributeNames", [])
+        if "All" not in requested:
+            attributes = {key: value for key, value in attributes.items() if key in requested}
+        return {"Attributes": attributes}
+
+
+class CloudWatchBackend:
+    """Synthetic metrics: a per-series level with a daily and weekly shape and some gaps."""
+
+    @staticmethod
+    def _value(seed, bucket, period):
+        step = bucket // period
+        hour = bucket // 3600 % 24
+        weekday = bucket // 86400 % 7
+        level = seed % 5000 + 10
+        shape = (1.5 if 8 <= hour < 20 else 0.6) * (0.5 if weekday in (2, 3) else 1.0)
+        noise = (seed + step * 2654435761) % 1000 / 1000
+        return float(int(level * shape * (0.8 + 0.4 * noise) * period / 3600))
+
+    def _series(self, query, start, end):
+        stat = query["MetricStat"]
+        dimensions = ",".join(f"{d['Name']}={d['Value']}" for d in stat["Metric"]["Dimensions"])
+        seed = zlib.crc32(f"{stat['Metric']['MetricName']}|{dimensions}".encode())
+        period = stat["Period"]
+
+        timestamps = []
+        values = []
+        for bucket in range(start - start % period, end, period):
+            # Every tenth series misses one bucket in thirteen, like an idle queue
+            if seed % 10 == 0 and bucket // period % 13 == 0:
+                continue
+            timestamps.append(bucket)
+            values.append(self._value(seed, bucket, period))
+        return timestamps, values
+
+    def GetMetricData(self, params):
+        start = _to_epoch(params["StartTime"])
+        end = _to_epoch(params["EndTime"])
+        query_index, offset = map(int, params.get("NextToken", "0:0").split(":"))
+
+        results = []
+        budget = MAX_DATAPOINTS_PER_RESPONSE
+        next_token = None
+        queries = params["MetricDataQueries"]
+        while query_index < len(queries):
+            query = queries[query_index]
+            timestamps, values = self._series(query, start, end)
+            taken = min(budget, len(timestamps) - offset)
+            results.append(
+                {
+                    "Id": query["Id"],
+                    "Label": query["MetricStat"]["Metric"]["MetricName"],
+                    "Timestamps": [
+                        datetime.datetime.fromtimestamp(t, tz=datetime.timezone.utc)
+                        for t in timestamps[offset : offset + taken]
+                    ],
+                    "Values": values[offset : offset + taken],
+                    "StatusCode": "Complete",
+                }
+            )
+            budget -= taken
+            if offset + taken < len(timestamps):
+                next_token = f"{query_index}:{offset + taken}"
+                break
+            query_index += 1
+            offset = 0
+            if budget == 0 and query_index < len(queries):
+                next_token = f"{query_index}:0"
+                break
+
+        response = {"MetricDataResults": results, "Messages": []}
+        if next_token:
+            response["NextToken"] = next_token
+        return response
+
+
+class STSBackend:
+    def GetCallerIdentity(self, params):
+        return {"Account": ACCOUNT_ID, "Arn": f"arn:aws:iam::{ACCOUNT_ID}:user/benchmark", "UserId": "BENCHMARK"}
+
+
+class AWSStandIn:
+    """In-memory S3, SQS, CloudWatch and STS answering the calls of attached botocore clients."""
+
+    def __init__(self, region="us-east-1"):
+        self.region = region
+        self.backends = {
+            "s3": S3Backend(),
+            "sqs": SQSBackend(region),
+            "cloudwatch": CloudWatchBackend(),
+            "sts": STSBackend(),
+        }
+        self.calls = collections.Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def s3(self):
+        return self.backends["s3"]
+
+    @property
+    def sqs(self):
+        return self.backends["sqs"]
+
+    def attach(self, client):
+        """Answer every call of ``client`` from the stand-in instead of AWS."""
+        events = client.meta.events
+        events.register_first("before-parameter-build.*.*", self._keep_params, unique_id="benchmark-standin-params")
+        events.register("before-call.*.*", self._respond, unique_id="benchmark-standin-call")
+
+    def reset_calls(self):
+        with self._lock:
+            self.calls.clear()
+
+    @staticmethod
+    def _keep_params(params, context, **kwargs):
+        context["standin_params"] = dict(params)
+
+    def _respond(self, model, context, **kwargs):
+        service = model.service_model.service_name
+        operation = model.name
+        with self._lock:
+            self.calls[f"{service}.{operation}"] += 1
+
+        handler = getattr(self.backends.get(service), operation, None)
+        if handler is None:
+            raise NotImplementedError(f"The benchmark stand-in does not implement {service}.{operation}")
+
+        try:
+            parsed = handler(context["standin_params"])
+            status_code = 200
+        except StandInError as e:
+            parsed = {"Error": {"Code": e.code, "Message": e.message}}
+            status_code = e.status_code
+
+        headers = {"content-length": str(parsed["ContentLength"])} if "Body" in parsed else {}
+        parsed["ResponseMetadata"] = {"HTTPStatusCode": status_code, "HTTPHeaders": headers, "RetryAttempts": 0}
+        return AWSResponse(f"https://{service}.{self.region}.amazonaws.com/", status_code, headers, None), parsed
@@ -0,0 +1,121 @@
+"""Check that the aws-vibe-guru entry point starts within its time budget.
+
+Imports the CLI and runs ``aws-vibe-guru --help`` in fresh interpreters, takes the best
+of several runs (minus the bare interpreter startup) and fails when either exceeds its
+budget or when a module that should stay lazy was imported: the AWS SDK and the command
+modules in both runs, Rich tables until the help is rendered.
+
+Usage:
+    python scripts/check_startup.py [--import-budget-ms 250] [--help-budget-ms 500] [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+DEFAULT_IMPORT_BUDGET_MS = 250
+DEFAULT_HELP_BUDGET_MS = 500
+DEFAULT_RUNS = 5
+
+# Modules that must only be imported once a command that needs them runs
+LAZY_MODULES = (
+    "boto3",
+    "botocore",
+    "aws_vibe_guru.aws_async",
+    "aws_vibe_guru.aws_clients",
+    "aws_vibe_guru.aws_cloudwatch",
+    "aws_vibe_guru.aws_s3",
+    "aws_vibe_guru.aws_s3_inventory",
+    "aws_vibe_guru.aws_sqs",
+    "aws_vibe_guru.metric_store",
+    "aws_vibe_guru.stats",
+    "aws_vibe_guru.tracing",
+    "numpy",
+    "rich.live",
+    "rich.progress",
+)
+
+# Modules that rendering the help needs, but importing the CLI does not
+HELP_MODULES = ("rich.table",)
+
+IMPORT_PROGRAM = """
+import json, sys
+import aws_vibe_guru.cli
+print(json.dumps(sorted(sys.modules)))
+"""
+
+HELP_PROGRAM = """
+import contextlib, io, json, sys
+from aws_vibe_guru.cli import app
+with contextlib.redirect_stdout(io.StringIO()):
+    try:
+        app(["--help"])
+    except SystemExit:
+        pass
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def _run(program):
+    env = dict(os.environ)
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", program], env=env, capture_output=True, text=True, check=False)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        sys.exit(f"Startup check failed to run:\n{result.stderr}")
+    return elapsed, result.stdout
+
+
+def imported_lazy_modules(output, lazy_modules):
+    """Return the lazy modules found in the ``sys.modules`` listing printed by a program."""
+    loaded = set(json.loads(output))
+    return [name for name in lazy_modules if name in loaded]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--import-budget-ms", type=float, default=DEFAULT_IMPORT_BUDGET_MS, help="Allowed CLI import time in ms"
+    )
+    parser.add_argument(
+        "--help-budget-ms", type=float, default=DEFAULT_HELP_BUDGET_MS, help="Allowed time to render --help in ms"
+    )
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="Number of runs (the best one is kept)")
+    args = parser.parse_args()
+
+    interpreter = min(_run("pass")[0] for _ in range(args.runs))
+    import_runs = [_run(IMPORT_PROGRAM) for _ in range(args.runs)]
+    import_ms = (min(elapsed for elapsed, _ in import_runs) - interpreter) * 1000
+    help_runs = [_run(HELP_PROGRAM) for _ in range(args.runs)]
+    help_ms = (min(elapsed for elapsed, _ in help_runs) - interpreter) * 1000
+
+    eager = imported_lazy_modules(import_runs[0][1], LAZY_MODULES + HELP_MODULES)
+    eager += [name for name in imported_lazy_modules(help_runs[0][1], LAZY_MODULES) if name not in eager]
+
+    failed = False
+    for label, elapsed_ms, budget_ms in (
+        ("import aws_vibe_guru.cli", import_ms, args.import_budget_ms),
+        ("aws-vibe-guru --help", help_ms, args.help_budget_ms),
+    ):
+        print(f"{label}: {elapsed_ms:.0f} ms (budget {budget_ms:.0f} ms, best of {args.runs})")
+        if elapsed_ms > budget_ms:
+            print(f"❌ {label} is over budget by {elapsed_ms - budget_ms:.0f} ms")
+            failed = True
+    if eager:
+        print(f"❌ Imported at startup but should be lazy: {', '.join(eager)}")
+        failed = True
+    if failed:
+        return 1
+
+    print("✅ Startup time within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,335 @@
+import asyncio
+import contextlib
+
+from botocore.exceptions import ClientError
+
+from aws_vibe_guru.aws_clients import get_account_id, read_aws_credentials
+from aws_vibe_guru.aws_cloudwatch import (
+    add_metric_data_results,
+    from_epoch,
+    merge_metric_data,
+    metric_data_requests,
+    plan_metric_data,
+)
+from aws_vibe_guru.aws_s3 import format_object_record, object_content_result, object_record
+from aws_vibe_guru.aws_sqs import QUEUE_COUNT_ATTRIBUTES, friendly_queue_attributes, queue_counts
+from aws_vibe_guru.metric_store import get_metric_store
+
+DEFAULT_ASYNC_POOL_CONNECTIONS = 100
+
+
+class AsyncClientPool:
+    """aiobotocore clients shared by every coroutine running on one event loop.
+
+    Each service gets a single client whose connection pool holds up to
+    ``max_pool_connections`` keep-alive connections, so hundreds of concurrent calls
+    (e.g. with ``asyncio.gather``) reuse the same connections instead of opening new
+    ones. Use it as ``async with AsyncClientPool() as pool:``; clients are closed on exit.
+
+    Requires the optional ``aiobotocore`` dependency (``pip install 'aws-vibe-guru[async]'``).
+    """
+
+    def __init__(self, region=None, max_pool_connections=DEFAULT_ASYNC_POOL_CONNECTIONS, **config_options):
+        try:
+            from aiobotocore.config import AioConfig
+            from aiobotocore.session import get_session
+        except ImportError as e:
+            raise ValueError("The async API requires aiobotocore: pip install 'aws-vibe-guru[async]'") from e
+
+        credentials = read_aws_credentials()
+        self.region = region or credentials["region"]
+        self._access_key = credentials["access_key"] or None
+        self._secret_key = credentials["secret_key"] or None
+        self._session = get_session()
+        self._config = AioConfig(
+            max_pool_connections=max_pool_connections, retries={"mode": "standard"}, **config_options
+        )
+        self._clients = {}
+        self._exit_stack = contextlib.AsyncExitStack()
+        self._lock = None
+
+    async def get_client(self, service_name):
+        """Return the pool's client for a service, creating it on first use.
+
+        Args:
+            service_name: AWS service name (e.g. "sqs", "s3", "cloudwatch")
+
+        Returns:
+            aiobotocore client for the service
+        """
+        client = self._clients.get(service_name)
+        if client is not None:
+            return client
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            client = self._clients.get(service_name)
+            if client is None:
+                client = await self._exit_stack.enter_async_context(
+                    self._session.create_client(
+                        service_name,
+                        region_name=self.region,
+                        aws_access_key_id=self._access_key,
+                        aws_secret_access_key=self._secret_key,
+                        config=self._config,
+                    )
+                )
+                self._clients[service_name] = client
+        return client
+
+    async def close(self):
+        """Close every client of the pool."""
+        self._clients.clear()
+        await self._exit_stack.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+async def iter_sqs_queues(pool, queue_name_prefix=None, page_size=1000):
+    """Async counterpart of ``aws_sqs.iter_sqs_queues``.
+
+    Args:
+        pool: AsyncClientPool
+        queue_name_prefix: Optional prefix to filter queue names
+        page_size: Number of queues requested per ListQueues call (max 1000)
+
+    Yields:
+        dict: Queue information with keys 'name', 'url'
+
+    Raises:
+        ValueError: When AWS API call fails
+    """
+    sqs_client = await pool.get_client("sqs")
+    kwargs = {"MaxResults": min(page_size, 1000)}
+    if queue_name_prefix:
+        kwargs["QueueNamePrefix"] = queue_name_prefix
+
+    try:
+        while True:
+            response = await sqs_client.list_queues(**kwargs)
+
+            for url in response.get("QueueUrls", []):
+                yield {"name": url.split("/")[-1], "url": url}
+
+            next_token = response.get("NextToken")
+            if not next_token:
+                break
+            kwargs["NextToken"] = next_token
+
+    except ClientError as e:
+        raise ValueError(f"Failed to list SQS queues: {e}") from e
+
+
+async def list_sqs_queues(pool, queue_name_prefix=None, max_results=None):
+    """Async counterpart of ``aws_sqs.list_sqs_queues``.
+
+    Returns:
+        list: List of dictionaries with keys 'name', 'url'
+
+    Raises:
+        ValueError: When AWS API call fails
+    """
+    queues = []
+    async for queue in iter_sqs_queues(pool, queue_name_prefix):
+        queues.append(queue)
+        if max_results and len(queues) >= max_results:
+            break
+
+    return queues
+
+
+async def get_queue_attributes(pool, queue_url):
+    """Async counterpart of ``aws_sqs.get_queue_attributes``.
+
+    Returns:
+        dict: Queue attributes with friendly names and values
+
+    Raises:
+        ValueError: When AWS API call fails
+    """
+    sqs_client = await pool.get_client("sqs")
+    try:
+        response = await sqs_client.get_queue_attributes(QueueUrl=queue_url, AttributeNames=["All"])
+    except ClientError as e:
+        raise ValueError(f"Failed to get queue attributes: {e}") from e
+
+    return friendly_queue_attributes(response.get("Attributes", {}))
+
+
+async def get_queue_counts(pool, queue_url):
+    """Async counterpart of ``aws_sqs.get_queue_counts``.
+
+    Returns:
+        dict: Counts with keys 'available', 'in_flight' and 'delayed' (int)
+
+    Raises:
+        ValueError: When AWS API call fails
+    """
+    sqs_client = await pool.get_client("sqs")
+    try:
+        response = await sqs_client.get_queue_attributes(
+            QueueUrl=queue_url, AttributeNames=list(QUEUE_COUNT_ATTRIBUTES.values())
+        )
+    except ClientError as e:
+        raise ValueError(f"Failed to get queue counts: {e}") from e
+
+    return queue_counts(response.get("Attributes", {}))
+
+
+async def _fetch_metric_data(pool, queries, start_time, end_time):
+    cloudwatch = await pool.get_client("cloudwatch")
+    series = [[] for _ in queries]
+
+    async def fetch_request(kwargs):
+        while True:
+            response = await cloudwatch.get_metric_data(**kwargs)
+            add_metric_data_results(series, response)
+
+            next_token = response.get("NextToken")
+            if not next_token:
+                break
+            kwargs["NextToken"] = next_token
+
+    try:
+        await asyncio.gather(
+            *(fetch_request(kwargs) for kwargs in metric_data_requests(queries, start_time, end_time))
+        )
+    except ClientError as e:
+        raise ValueError(f"Failed to get metric data: {e}") from e
+
+    return series
+
+
+async def _run_blocking(func, *args):
+    """Run a blocking call (SQLite metric store, STS lookup) on the loop's default executor."""
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+def _plan_stored_metric_data(region, queries, start_time, end_time, use_cache):
+    store = get_metric_store() if use_cache else None
+    scope = f"{get_account_id(region)}:{region}" if store else ""
+    return (store, *plan_metric_data(queries, start_time, end_time, store, scope))
+
+
+async def get_metric_data(pool, queries, start_time, end_time, use_cache=True):
+    """Async counterpart of ``aws_cloudwatch.get_metric_data``.
+
+    Uses the same batching and local metric store; the GetMetricData requests of all
+    batches are sent concurrently. Metric store reads and writes (and the account lookup
+    scoping them) run on the default executor so they do not block the event loop.
+
+    Args:
+        pool: AsyncClientPool
+        queries: List of metric queries built with ``aws_cloudwatch.metric_query``
+        start_time: Start of the window (datetime, UTC)
+        end_time: End of the window (datetime, UTC)
+        use_cache: Whether to use the local metric store (default: True)
+
+    Returns:
+        list: One list per query of datapoints with keys 'timestamp' and 'value'
+
+    Raises:
+        ValueError: When AWS API call fails
+    """
+    store, plans, fetch_groups, end, settled_before = await _run_blocking(
+        _plan_stored_metric_data, pool.region, queries, start_time, end_time, use_cache
+    )
+
+    groups = list(fetch_groups.items())
+    results = await asyncio.gather(
+        *(
+            _fetch_metric_data(pool, [queries[i] for i in indexes], from_epoch(fetch_start), end_time)
+            for fetch_start, indexes in groups
+        )
+    )
+
+    fetched = {}
+    for (_, indexes), series in zip(groups, results):
+        fetched.update(zip(indexes, series))
+
+    return await _run_blocking(merge_metric_data, plans, fetched, end, settled_before, store)
+
+
+async def iter_bucket_objects(pool, bucket_name, prefix=None, max_keys=None):
+    """Async counterpart of ``aws_s3.iter_bucket_objects``.
+
+    Yields:
+        dict: Raw object record with keys 'key', 'size', 'last_modified' (datetime) and
+              'storage_class'
+
+    Raises:
+        ValueError: When AWS API call fails
+    """
+    s3_client = await pool.get_client("s3")
+    kwargs = {"Bucket": bucket_name}
+    if prefix:
+        kwargs["Prefix"] = prefix
+
+    remaining = max_keys
+    try:
+        while True:
+            if remaining:
+                kwargs["MaxKeys"] = min(remaining, 1000)
+
+            response = await s3_client.list_objects_v2(**kwargs)
+            for obj in response.get("Contents", []):
+                yield object_record(obj)
+
+                if remaining:
+                    remaining -= 1
+                    if remaining == 0:
+                        return
+
+            if not response.get("IsTruncated"):
+                break
+
+            kwargs["ContinuationToken"] = response.get("NextContinuationToken")
+
+    except ClientError as e:
+        raise ValueError(f"Failed to list objects in bucket '{bucket_name}': {e}") from e
+
+
+async def list_bucket_objects(pool, bucket_name, prefix=None, max_keys=None):
+    """Async counterpart of ``aws_s3.list_bucket_objects``.
+
+    Returns:
+        dict: Bucket info with keys 'bucket_name', 'prefix', 'total_objects' and 'objects'
+
+    Raises:
+        ValueError: When AWS API call fails
+    """
+    objects = [format_object_record(obj) async for obj in iter_bucket_objects(pool, bucket_name, prefix, max_keys)]
+
+    return {
+        "bucket_name": bucket_name,
+        "prefix": prefix or "all",
+        "total_objects": len(objects),
+        "objects": objects,
+    }
+
+
+async def read_object_content(pool, bucket_name, object_key, encoding="utf-8"):
+    """Async counterpart of ``aws_s3.read_object_content``.
+
+    Returns:
+        dict: Object content and metadata (content is None for binary objects)
+
+    Raises:
+        ValueError: When the object does not exist or AWS API call fails
+    """
+    s3_client = await pool.get_client("s3")
+    try:
+        response = await s3_client.get_object(Bucket=bucket_name, Key=object_key)
+        async with response["Body"] as body:
+            content_bytes = await body.read()
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "NoSuchKey":
+            raise ValueError(f"Object '{object_key}' not found in bucket '{bucket_name}'") from e
+        raise ValueError(f"Failed to read object content: {e}") from e
+
+    return object_content_result(bucket_name, object_key, content_bytes, response.get("ContentType", "N/A"), encoding)
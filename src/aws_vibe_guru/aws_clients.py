@@ -0,0 +1,283 @@
+import configparser
+import functools
+import hashlib
+import os.path
+import threading
+import time
+
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
+
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+ACCOUNT_CACHE_FILE = "accounts.json"
+THROTTLING_ERROR_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+    "SlowDown",
+    "RequestThrottled",
+    "AWS.SimpleQueueService.RequestThrottled",
+}
+
+_client_options = {
+    "max_pool_connections": int(os.environ.get("AWS_VIBE_GURU_MAX_POOL_CONNECTIONS", DEFAULT_MAX_POOL_CONNECTIONS)),
+    "retries": {"mode": "standard"},
+}
+_sessions = {}
+_clients = {}
+_client_hooks = []
+_account_ids = {}
+_lock = threading.Lock()
+
+
+def read_aws_credentials():
+    """Read AWS credentials from ~/.aws/credentials file or environment variables.
+
+    Returns:
+        dict: Dictionary containing access_key, secret_key, and region
+
+    """
+    credentials_file = os.path.expanduser("~/.aws/credentials")
+    if os.path.exists(credentials_file):
+        config = configparser.ConfigParser()
+        config.read(credentials_file)
+
+        if "default" in config.sections():
+            return {
+                "access_key": config.get("default", "aws_access_key_id", fallback=""),
+                "secret_key": config.get("default", "aws_secret_access_key", fallback=""),
+                "region": config.get("default", "region", fallback="us-east-1"),
+            }
+
+    credentials = {
+        "access_key": os.environ.get("AWS_ACCESS_KEY_ID", ""),
+        "secret_key": os.environ.get("AWS_SECRET_ACCESS_KEY", ""),
+        "region": os.environ.get("AWS_DEFAULT_REGION", "us-east-1"),
+    }
+
+    return credentials
+
+
+@functools.lru_cache(maxsize=None)
+def _resolved_credentials():
+    credentials = read_aws_credentials()
+    return (credentials["access_key"], credentials["secret_key"], credentials["region"])
+
+
+def configure_clients(**options):
+    """Tune the botocore configuration used by every shared client.
+
+    Accepts any ``botocore.config.Config`` option, for example ``max_pool_connections``,
+    ``connect_timeout``, ``read_timeout`` or ``retries``. Cached clients are dropped so
+    that the next call picks up the new settings.
+
+    Args:
+        **options: botocore Config keyword arguments
+    """
+    with _lock:
+        _client_options.update(options)
+    clear_client_cache()
+
+
+def clear_client_cache():
+    """Drop all cached sessions, clients and the memoized credentials."""
+    with _lock:
+        _clients.clear()
+        _sessions.clear()
+        _account_ids.clear()
+    _resolved_credentials.cache_clear()
+
+
+def add_client_hook(hook):
+    """Call ``hook`` for every client: the cached ones now and each new one when created.
+
+    Hooks are the place to register botocore event handlers on the clients used by
+    ``aws_sqs``, ``aws_s3`` and ``aws_cloudwatch`` (see ``tracing.enable_tracing``). They are
+    called as ``hook(client, creation_seconds)``, where ``creation_seconds`` is the time it
+    took to create the client, or None for clients that already existed.
+
+    Args:
+        hook: Callable taking the client and its creation time
+    """
+    with _lock:
+        if hook in _client_hooks:
+            return
+        _client_hooks.append(hook)
+        clients = list(_clients.values())
+    for client in clients:
+        hook(client, None)
+
+
+def remove_client_hook(hook):
+    """Stop calling ``hook`` for new clients (handlers it registered stay registered)."""
+    with _lock:
+        if hook in _client_hooks:
+            _client_hooks.remove(hook)
+
+
+def _run_client_hooks(client, creation_seconds):
+    for hook in list(_client_hooks):
+        hook(client, creation_seconds)
+
+
+def _client_config():
+    # boto3 and the botocore client machinery take a few hundred ms to import, so they are
+    # only loaded when the first client is created (not for --help or shell completion)
+    from botocore.config import Config
+
+    return Config(**_client_options)
+
+
+def _get_session(region, profile):
+    import boto3.session
+
+    key = (region, profile)
+    session = _sessions.get(key)
+    if session is None:
+        if profile:
+            session = boto3.session.Session(profile_name=profile, region_name=region)
+        else:
+            access_key, secret_key, _ = _resolved_credentials()
+            session = boto3.session.Session(
+                aws_access_key_id=access_key or None,
+                aws_secret_access_key=secret_key or None,
+                region_name=region,
+            )
+        _sessions[key] = session
+    return session
+
+
+def get_client(service_name, region=None, profile=None):
+    """Return a shared boto3 client for a service, creating it on first use.
+
+    Clients are cached per (service, region, profile) for the lifetime of the process, so
+    repeated calls reuse the loaded service model and the keep-alive HTTP connection pool.
+    Credentials are resolved once and memoized.
+
+    Args:
+        service_name: AWS service name (e.g. "sqs", "s3", "cloudwatch")
+        region: AWS region (optional, will read from credentials if not provided)
+        profile: AWS profile name (optional, uses the default credentials if not provided)
+
+    Returns:
+        boto3.client: Client object for the service
+
+    Raises:
+        ValueError: When credentials are invalid or missing or AWS connection fails
+    """
+    if not region and not profile:
+        region = _resolved_credentials()[2]
+
+    key = (service_name, region, profile)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            start = time.perf_counter()
+            try:
+                session = _get_session(region, profile)
+                client = session.client(service_name, config=_client_config())
+            except NoCredentialsError as e:
+                raise ValueError("Invalid AWS credentials provided") from e
+            except (ClientError, BotoCoreError) as e:
+                raise ValueError(f"Failed to create AWS {service_name} client: {e}") from e
+            _run_client_hooks(client, time.perf_counter() - start)
+            _clients[key] = client
+    return client
+
+
+def create_client(service_name, access_key, secret_key, region):
+    """Create an uncached client for explicitly provided credentials.
+
+    Args:
+        service_name: AWS service name (e.g. "sqs", "s3", "cloudwatch")
+        access_key: AWS access key ID
+        secret_key: AWS secret access key
+        region: AWS region
+
+    Returns:
+        boto3.client: Client object for the service
+    """
+    import boto3
+
+    with _lock:
+        config = _client_config()
+    start = time.perf_counter()
+    client = boto3.client(
+        service_name,
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region,
+        config=config,
+    )
+    _run_client_hooks(client, time.perf_counter() - start)
+    return client
+
+
+def is_throttling_error(error):
+    """Return whether an exception, or one it was raised from, is a throttling ClientError.
+
+    The clients already retry throttled calls with backoff, so this is for callers deciding
+    what to do once those retries are exhausted (the AWS errors reach them wrapped in
+    ``ValueError``).
+    """
+    while error is not None:
+        if isinstance(error, ClientError) and error.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES:
+            return True
+        error = error.__cause__
+    return False
+
+
+def get_account_id(region=None, profile=None):
+    """Return the AWS account id of the credentials used by the shared clients.
+
+    Local caches of account-specific data (queue URLs, CloudWatch datapoints) are keyed by
+    it, so switching profiles or credentials never returns another account's entries. The id
+    is looked up with STS GetCallerIdentity the first time a set of credentials is seen and
+    remembered on disk per access key, so later runs make no call. When STS cannot be reached,
+    a fingerprint of the access key is returned instead, which still keeps accounts apart.
+
+    Args:
+        region: AWS region (optional, will read from credentials if not provided)
+        profile: AWS profile name (optional, uses the default credentials if not provided)
+
+    Returns:
+        str: Account id, or ``key-<fingerprint>`` when it could not be looked up
+
+    Raises:
+        ValueError: When credentials are invalid or missing
+    """
+    from aws_vibe_guru.cache import load_json_cache, save_json_cache
+
+    if not region and not profile:
+        region = _resolved_credentials()[2]
+
+    with _lock:
+        session = _get_session(region, profile)
+    credentials = session.get_credentials()
+    if credentials is None:
+        raise ValueError("Invalid AWS credentials provided")
+    fingerprint = hashlib.sha256(credentials.get_frozen_credentials().access_key.encode()).hexdigest()[:16]
+
+    account_id = _account_ids.get(fingerprint)
+    if account_id is not None:
+        return account_id
+
+    accounts = load_json_cache(ACCOUNT_CACHE_FILE)
+    account_id = accounts.get(fingerprint)
+    if account_id is None:
+        try:
+            account_id = get_client("sts", region, profile).get_caller_identity()["Account"]
+        except (ClientError, BotoCoreError, ValueError):
+            account_id = f"key-{fingerprint}"
+        else:
+            accounts[fingerprint] = account_id
+            save_json_cache(ACCOUNT_CACHE_FILE, accounts)
+
+    _account_ids[fingerprint] = account_id
+    return account_id
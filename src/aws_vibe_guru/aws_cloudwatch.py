@@ -0,0 +1,291 @@
+import calendar
+import datetime
+import functools
+import math
+import time
+
+from botocore.exceptions import ClientError
+
+from aws_vibe_guru.aws_clients import get_account_id, get_client
+from aws_vibe_guru.concurrency import bounded_map
+from aws_vibe_guru.metric_store import MetricStore, get_metric_store
+
+MAX_QUERIES_PER_REQUEST = 500
+MAX_DATAPOINTS_PER_CHUNK = 1440
+DEFAULT_FETCH_WORKERS = 4
+METRIC_SETTLE_SECONDS = 900
+# AWS services can publish a datapoint well after its period closed, so a bucket without
+# data is only stored as empty once it is this old
+METRIC_EMPTY_SETTLE_SECONDS = 3 * 3600
+
+# (maximum age of the window start in seconds, finest period CloudWatch still keeps)
+RETENTION_PERIODS = (
+    (3 * 3600, 1),
+    (15 * 86400, 60),
+    (63 * 86400, 300),
+    (455 * 86400, 3600),
+)
+STANDARD_PERIODS = (1, 5, 10, 30, 60, 300, 900, 3600, 21600, 86400)
+
+
+def create_cloudwatch_connection(region=None):
+    """Get the shared CloudWatch client.
+
+    Args:
+        region: AWS region (optional, will read from credentials if not provided)
+
+    Returns:
+        boto3.client: CloudWatch client object
+
+    Raises:
+        ValueError: When credentials are invalid or missing or AWS connection fails
+    """
+    return get_client("cloudwatch", region)
+
+
+def metric_query(namespace, metric_name, dimensions, statistic, period):
+    """Build a metric query understood by ``get_metric_data``.
+
+    Args:
+        namespace: CloudWatch namespace (e.g. "AWS/SQS")
+        metric_name: Metric name (e.g. "NumberOfMessagesReceived")
+        dimensions: Dict of dimension name to value
+        statistic: Statistic to return (e.g. "Sum", "Maximum")
+        period: Period in seconds
+
+    Returns:
+        dict: Metric query
+    """
+    return {
+        "namespace": namespace,
+        "metric_name": metric_name,
+        "dimensions": dict(dimensions),
+        "statistic": statistic,
+        "period": period,
+    }
+
+
+def choose_period(start_time, end_time, max_datapoints=None, min_period=60):
+    """Pick the finest period CloudWatch can return for a window.
+
+    Older datapoints are only kept at coarser resolutions (1 second for 3 hours, 1 minute
+    for 15 days, 5 minutes for 63 days and 1 hour for 455 days), so the finest period
+    depends on how far back the window starts. The result is a standard period
+    (1, 5, 10, 30 seconds, 1, 5, 15 minutes, 1, 6 hours or whole days).
+
+    Args:
+        start_time: Start of the window (datetime, UTC)
+        end_time: End of the window (datetime, UTC)
+        max_datapoints: Optional cap on the number of datapoints per series; the period is
+                        widened until the window fits
+        min_period: Finest period to consider (default: 60, the resolution of standard
+                    metrics such as AWS/SQS)
+
+    Returns:
+        int: Period in seconds
+    """
+    age = time.time() - _to_epoch(start_time)
+    finest = next((period for max_age, period in RETENTION_PERIODS if age <= max_age), RETENTION_PERIODS[-1][1])
+
+    period = max(finest, min_period)
+    if max_datapoints:
+        window = max(_to_epoch(end_time) - _to_epoch(start_time), 1)
+        period = max(period, math.ceil(window / max_datapoints))
+
+    return next(
+        (standard for standard in STANDARD_PERIODS if standard >= period and standard % finest == 0),
+        math.ceil(period / 86400) * 86400,
+    )
+
+
+def _to_epoch(value):
+    return calendar.timegm(value.utctimetuple())
+
+
+def from_epoch(value):
+    """Convert epoch seconds to a UTC datetime."""
+    return datetime.datetime.fromtimestamp(value, tz=datetime.timezone.utc)
+
+
+def _chunk_seconds(queries):
+    """Length of the time chunks holding at most ``MAX_DATAPOINTS_PER_CHUNK`` buckets per query."""
+    periods = {query["period"] for query in queries}
+    # Chunk boundaries must fall on a bucket boundary of every period
+    step = functools.reduce(lambda a, b: a * b // math.gcd(a, b), periods)
+    return max(step, MAX_DATAPOINTS_PER_CHUNK * min(periods) // step * step)
+
+
+def _time_chunks(start_time, end_time, chunk_seconds):
+    start = _to_epoch(start_time)
+    end = _to_epoch(end_time)
+    if end - start <= chunk_seconds:
+        yield start_time, end_time
+        return
+
+    for chunk_start in range(start, end, chunk_seconds):
+        chunk_end = chunk_start + chunk_seconds
+        yield (
+            start_time if chunk_start == start else from_epoch(chunk_start),
+            end_time if chunk_end >= end else from_epoch(chunk_end),
+        )
+
+
+def metric_data_requests(queries, start_time, end_time):
+    """Yield the GetMetricData arguments covering ``queries`` over the window, per batch and time chunk."""
+    for offset in range(0, len(queries), MAX_QUERIES_PER_REQUEST):
+        batch = queries[offset : offset + MAX_QUERIES_PER_REQUEST]
+        metric_data_queries = [
+            {
+                "Id": f"q{index}",
+                "MetricStat": {
+                    "Metric": {
+                        "Namespace": query["namespace"],
+                        "MetricName": query["metric_name"],
+                        "Dimensions": [{"Name": name, "Value": value} for name, value in query["dimensions"].items()],
+                    },
+                    "Period": query["period"],
+                    "Stat": query["statistic"],
+                },
+                "ReturnData": True,
+            }
+            for index, query in enumerate(batch, start=offset)
+        ]
+        for chunk_start, chunk_end in _time_chunks(start_time, end_time, _chunk_seconds(batch)):
+            yield {
+                "MetricDataQueries": metric_data_queries,
+                "StartTime": chunk_start,
+                "EndTime": chunk_end,
+                "ScanBy": "TimestampAscending",
+            }
+
+
+def add_metric_data_results(series, response):
+    """Append the datapoints of a GetMetricData response to ``series`` (one list per query index)."""
+    for result in response.get("MetricDataResults", []):
+        points = series[int(result["Id"][1:])]
+        for timestamp, value in zip(result.get("Timestamps", []), result.get("Values", [])):
+            points.append({"timestamp": timestamp, "value": value})
+
+
+def _fetch_metric_data(queries, start_time, end_time, max_workers=DEFAULT_FETCH_WORKERS):
+    series = [[] for _ in queries]
+    cloudwatch = create_cloudwatch_connection()
+
+    def fetch_pages(kwargs):
+        responses = []
+        while True:
+            response = cloudwatch.get_metric_data(**kwargs)
+            responses.append(response)
+
+            next_token = response.get("NextToken")
+            if not next_token:
+                return responses
+            kwargs["NextToken"] = next_token
+
+    requests = metric_data_requests(queries, start_time, end_time)
+    for _, responses, error in bounded_map(fetch_pages, requests, max_workers=max_workers):
+        if isinstance(error, ClientError):
+            raise ValueError(f"Failed to get metric data: {error}") from error
+        if error:
+            raise error
+        for response in responses:
+            add_metric_data_results(series, response)
+
+    return series
+
+
+def plan_metric_data(queries, start_time, end_time, store, scope=""):
+    """Split queries into stored buckets and the windows still to fetch, grouped by start."""
+    start = _to_epoch(start_time)
+    end = _to_epoch(end_time)
+    settled_before = min(end, int(time.time()) - METRIC_SETTLE_SECONDS)
+
+    plans = []
+    fetch_groups = {}
+    for index, query in enumerate(queries):
+        period = query["period"]
+        aligned_start = start - start % period
+        series_key = MetricStore.series_key(query, scope)
+        stored = store.load(series_key, aligned_start, end) if store else {}
+
+        fetch_start = next(
+            (
+                bucket
+                for bucket in range(aligned_start, end, period)
+                if bucket not in stored or bucket + period > settled_before
+            ),
+            None,
+        )
+        plans.append((series_key, period, fetch_start, stored))
+        if fetch_start is not None:
+            fetch_groups.setdefault(fetch_start, []).append(index)
+
+    return plans, fetch_groups, end, settled_before
+
+
+def merge_metric_data(plans, fetched, end, settled_before, store):
+    """Merge stored and fetched buckets into sorted series and store the settled ones."""
+    empty_settled_before = min(settled_before, int(time.time()) - METRIC_EMPTY_SETTLE_SECONDS)
+    series = []
+    for index, (series_key, period, fetch_start, stored) in enumerate(plans):
+        buckets = {bucket: value for bucket, value in stored.items() if value is not None}
+
+        if fetch_start is not None:
+            new_points = {}
+            for point in fetched[index]:
+                timestamp = _to_epoch(point["timestamp"])
+                new_points[timestamp - timestamp % period] = point["value"]
+            buckets.update(new_points)
+
+            if store:
+                settled = {
+                    bucket: new_points.get(bucket)
+                    for bucket in range(fetch_start, end, period)
+                    if bucket + period <= (settled_before if bucket in new_points else empty_settled_before)
+                }
+                store.save(series_key, settled)
+
+        series.append([{"timestamp": from_epoch(bucket), "value": buckets[bucket]} for bucket in sorted(buckets)])
+
+    return series
+
+
+def get_metric_data(queries, start_time, end_time, use_cache=True, max_workers=DEFAULT_FETCH_WORKERS):
+    """Fetch many metric series with as few GetMetricData calls as possible.
+
+    Queries are packed up to ``MAX_QUERIES_PER_REQUEST`` per request and every request
+    follows ``NextToken`` until all datapoints have been returned. The window start is
+    aligned down to each query's period, so buckets are stable between runs. Windows with
+    more than ``MAX_DATAPOINTS_PER_CHUNK`` buckets per query (long or high-resolution
+    windows) are split into time chunks that are fetched concurrently and merged back
+    into one ordered series.
+
+    Periods that closed more than ``METRIC_SETTLE_SECONDS`` ago never change, so they are
+    kept in the local metric store (empty ones only after ``METRIC_EMPTY_SETTLE_SECONDS``,
+    in case a late datapoint arrives); later calls only request the buckets that are not
+    stored yet plus the still-open ones. Stored series are kept per account and region.
+
+    Args:
+        queries: List of metric queries built with ``metric_query``
+        start_time: Start of the window (datetime, UTC)
+        end_time: End of the window (datetime, UTC)
+        use_cache: Whether to use the local metric store (default: True)
+        max_workers: Number of GetMetricData requests run at the same time (default: 4)
+
+    Returns:
+        list: One list per query, in the same order, of datapoints with keys
+              'timestamp' (datetime) and 'value' (float), sorted by timestamp
+
+    Raises:
+        ValueError: When AWS API call fails
+    """
+    store = get_metric_store() if use_cache else None
+    scope = f"{get_account_id()}:{create_cloudwatch_connection().meta.region_name}" if store else ""
+    plans, fetch_groups, end, settled_before = plan_metric_data(queries, start_time, end_time, store, scope)
+
+    fetched = {}
+    for fetch_start, indexes in fetch_groups.items():
+        results = _fetch_metric_data([queries[i] for i in indexes], from_epoch(fetch_start), end_time, max_workers)
+        fetched.update(zip(indexes, results))
+
+    return merge_metric_data(plans, fetched, end, settled_before, store)
@@ -1,23 +1,43 @@
-import boto3
+import codecs
+import contextlib
+import functools
+import hashlib
+import itertools
+import json
+import math
+import os
+import re
+import string
+
 from botocore.exceptions import ClientError, NoCredentialsError
 
-from aws_vibe_guru.aws_sqs import read_aws_credentials
+from aws_vibe_guru.aws_clients import create_client, get_client, read_aws_credentials
+from aws_vibe_guru.aws_s3_inventory import iter_inventory_objects
+from aws_vibe_guru.concurrency import bounded_chain, bounded_map
+from aws_vibe_guru.defaults import (
+    DEFAULT_DOWNLOAD_WORKERS,
+    DEFAULT_MAX_BUFFER_BYTES,
+    DEFAULT_PART_SIZE,
+    DEFAULT_READ_WORKERS,
+)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+LIST_PAGE_KEYS = 1000
+MAX_PARTITION_DEPTH = 3
+MAX_SPLIT_ROUNDS = 10
+MAX_SPLIT_KEY_CHARS = 64
+OPEN_RANGE_PIECES = 3
+MAX_SEARCH_LINE_CHARS = 64 * 1024
+SEARCH_WINDOW_OVERLAP = 1024
+LONG_LINE_CONTEXT_CHARS = 256
 
 
 def create_s3_connection(access_key=None, secret_key=None, region=None):
-    if not all([access_key, secret_key, region]):
-        credentials = read_aws_credentials()
-        access_key = access_key or credentials["access_key"]
-        secret_key = secret_key or credentials["secret_key"]
-        region = region or credentials["region"]
+    if not (access_key and secret_key):
+        return get_client("s3", region)
 
     try:
-        return boto3.client(
-            "s3",
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name=region,
-        )
+        return create_client("s3", access_key, secret_key, region or read_aws_credentials()["region"])
     except NoCredentialsError as e:
         raise ValueError("Invalid AWS credentials provided") from e
     except ClientError as e:
@@ -41,8 +61,356 @@ def list_buckets():
         raise ValueError(f"Failed to list S3 buckets: {e}") from e
 
 
-def list_bucket_objects(bucket_name, prefix=None, max_keys=None):
+def format_object_record(obj):
+    """Add display fields to a raw object record from ``iter_bucket_objects``.
+
+    Args:
+        obj: Raw object record
+
+    Returns:
+        dict: Record with 'size_mb' as a string and 'last_modified' formatted as text
+    """
+    size_mb = obj["size"] / (1024 * 1024)
+    return {
+        "key": obj["key"],
+        "size": obj["size"],
+        "size_mb": f"{size_mb:.2f}",
+        "last_modified": obj["last_modified"].strftime("%Y-%m-%d %H:%M:%S UTC"),
+        "storage_class": obj["storage_class"],
+    }
+
+
+def object_record(obj):
+    """Convert a ListObjectsV2 entry to a raw object record ('key', 'size', 'last_modified', 'storage_class')."""
+    return {
+        "key": obj["Key"],
+        "size": obj["Size"],
+        "last_modified": obj["LastModified"],
+        "storage_class": obj.get("StorageClass", "STANDARD"),
+    }
+
+
+def _range_page(response, through):
+    """Return the records of a page up to ``through`` and whether the key range is complete."""
+    page = []
+    for obj in response.get("Contents", []):
+        if through is not None and obj["Key"] > through:
+            return page, True
+        page.append(object_record(obj))
+        if obj["Key"] == through:
+            return page, True
+    return page, not response.get("IsTruncated")
+
+
+def _iter_key_range_pages(bucket_name, prefix, after=None, through=None):
+    s3_client = create_s3_connection()
+
+    kwargs = {"Bucket": bucket_name, "Prefix": prefix}
+    if after:
+        kwargs["StartAfter"] = after
+
+    while True:
+        response = s3_client.list_objects_v2(**kwargs)
+
+        page, complete = _range_page(response, through)
+        yield page
+        if complete:
+            return
+
+        kwargs["ContinuationToken"] = response.get("NextContinuationToken")
+
+
+def _probe_key_range(bucket_name, key_range):
+    """List the first page of a key range and return it with the rest of the range (or None)."""
+    prefix, after, through = key_range
+    s3_client = create_s3_connection()
+
+    kwargs = {"Bucket": bucket_name, "Prefix": prefix}
+    if after:
+        kwargs["StartAfter"] = after
+    page, complete = _range_page(s3_client.list_objects_v2(**kwargs), through)
+
+    return page, None if complete or not page else (prefix, page[-1]["key"], through)
+
+
+def _key_numbering(key_range, sample, origin=None):
+    """Read the keys of a range as numbers, one digit per character after the range prefix.
+
+    Each position's digits are the characters the sample (and the ``origin`` key, when given)
+    has there, widened to all digits and to the letters between the first and last seen, so
+    that keys beyond the sample are counted too. Past the length every key has, digit 0
+    stands for the end of a shorter key.
+
+    Returns:
+        tuple: (to_number, to_key, page_span), page_span being the distance one page of keys
+               covers at the sample's density (0 when the sample gives no estimate)
+    """
+    prefix, after, through = key_range
+    start = len(prefix)
+    bounds = [key for key in (after, through, origin) if key]
+    suffixes = [key[start : start + MAX_SPLIT_KEY_CHARS] for key in sample + bounds]
+    common_length = min(map(len, suffixes))
+
+    positions = [
+        {suffix[position] for suffix in suffixes if len(suffix) > position}
+        for position in range(max(map(len, suffixes)))
+    ]
+    # Letters go from the first to the last seen (as in words); positions mixing them with
+    # digits (as in hexadecimal) lend their letters to the positions showing only digits
+    mixed_letters = set()
+    for chars in positions:
+        if not chars.isdisjoint(string.digits) and not chars.isdisjoint(string.ascii_letters):
+            mixed_letters.update(chars.intersection(string.ascii_letters))
+
+    alphabets = []
+    for position, chars in enumerate(positions):
+        if not chars.isdisjoint(string.digits):
+            chars.update(string.digits, mixed_letters)
+        for letters in (string.ascii_uppercase, string.ascii_lowercase):
+            seen = sorted(chars.intersection(letters))
+            if seen:
+                chars.update(letters[letters.index(seen[0]) : letters.index(seen[-1]) + 1])
+        # Positions every key has get no end-of-key digit
+        alphabets.append(sorted(chars) if position < common_length else [""] + sorted(chars))
+    ranks = [{char: rank for rank, char in enumerate(alphabet)} for alphabet in alphabets]
+    last_number = math.prod(map(len, alphabets)) - 1
+
+    def to_number(key):
+        number = 0
+        for position, position_ranks in enumerate(ranks, start=start):
+            number = number * len(position_ranks) + position_ranks[key[position] if position < len(key) else ""]
+        return number
+
+    def to_key(number):
+        # Numbers past the last key read as the last key
+        number = min(number, last_number)
+        chars = []
+        for alphabet in reversed(alphabets):
+            number, digit = divmod(number, len(alphabet))
+            chars.append(alphabet[digit])
+        # An end-of-key digit ends the key
+        return prefix + "".join(itertools.takewhile(bool, reversed(chars)))
+
+    page_span = (to_number(sample[-1]) - to_number(sample[0])) * LIST_PAGE_KEYS // max(len(sample) - 1, 1)
+    return to_number, to_key, page_span
+
+
+def _split_points(key_range, numbering, pieces=None, origin=None):
+    """Keys splitting a range in ``pieces`` equal parts, or else in parts growing fourfold.
+
+    The first of the growing parts spans one page of keys, or as much of the keyspace as has
+    been listed since ``origin`` when that is more (up to a quarter of a bounded range), so
+    that ranges of large prefixes whose keys may end anywhere are covered in few rounds.
+    """
+    _, after, through = key_range
+    to_number, to_key, page_span = numbering
+    low = to_number(after)
+    if pieces:
+        numbers = [low + (to_number(through) - low) * index // pieces for index in range(1, pieces)]
+    else:
+        unit = max(page_span, low - to_number(origin)) if origin else page_span
+        if through is not None:
+            unit = min(unit, max(page_span, (to_number(through) - low) // 4))
+        numbers = [low + unit * (4**index - 1) // 3 for index in range(1, OPEN_RANGE_PIECES)]
+
+    points = []
+    for point in map(to_key, numbers):
+        if point > (points[-1] if points else after) and (through is None or point < through):
+            points.append(point)
+    return points
+
+
+def _discover_partitions(bucket_name, prefix, min_partitions, max_workers):
+    """Split the keyspace under a prefix into at least ``min_partitions`` ordered partitions.
+
+    Folders are found with ``Delimiter="/"``, descending up to ``MAX_PARTITION_DEPTH`` levels.
+    When the folders are too few (or a level is too large to enumerate), the key ranges
+    left are split for up to ``MAX_SPLIT_ROUNDS`` rounds: the first page of each range is
+    listed (and kept), and the rest of the range is cut at points extrapolated from that
+    page. Ranges known to hold keys up to their end are cut in parts of about the same number
+    of pages; the others, whose keys may end anywhere, in parts growing fourfold. Every request made here returns objects
+    that are kept, so discovery costs few calls beyond the listing itself.
+
+    Returns:
+        list: Partitions in key order, each either a list of object records already listed
+              or a (prefix, after, through) range of keys still to list
+    """
+    s3_client = create_s3_connection()
+
+    # Entries are (sort key, records) or (sort key, key range, sample of its first keys or None)
+    entries = []
+    # First and last keys listed so far under each range prefix
+    listed = {}
+    level = [prefix]
+
+    for _ in range(MAX_PARTITION_DEPTH):
+        next_level = []
+
+        for level_prefix in level:
+            response = s3_client.list_objects_v2(Bucket=bucket_name, Prefix=level_prefix, Delimiter="/")
+            keys = [obj["Key"] for obj in response.get("Contents", [])]
+            folders = [common_prefix["Prefix"] for common_prefix in response.get("CommonPrefixes", [])]
+
+            entries.extend((obj["Key"], [object_record(obj)]) for obj in response.get("Contents", []))
+            if not response.get("IsTruncated"):
+                next_level.extend(folders)
+                continue
+
+            # Too many entries for one response: the returned folders become key ranges, and
+            # so does the rest of the level, after the last entry returned
+            entries.extend((folder, (folder, None, None), None) for folder in folders)
+            after = max(keys + [folder + "\U0010ffff" for folder in folders])
+            entries.append((after, (level_prefix, after, None), None if folders else keys))
+            if keys and not folders:
+                listed[level_prefix] = (keys[0], keys[-1])
+
+        level = next_level
+        if not level or sum(len(entry) == 3 for entry in entries) + len(level) >= min_partitions:
+            break
+
+    entries.extend((level_prefix, (level_prefix, None, None), None) for level_prefix in level)
+    entries.sort(key=lambda entry: entry[0])
+
+    # Ranges cut without knowing where their keys end, like the open-ended rest of a level
+    # listed in part, may hold most of the keys
+    guessed = any(len(entry) == 3 and entry[1][1] is not None for entry in entries)
+    for _ in range(MAX_SPLIT_ROUNDS):
+        ranges = [entry for entry in entries if len(entry) == 3]
+        if not ranges or (len(ranges) >= min_partitions and not guessed):
+            break
+
+        unprobed = [entry[1] for entry in ranges if entry[2] is None]
+        probes = {}
+        for key_range, result, error in bounded_map(
+            functools.partial(_probe_key_range, bucket_name), unprobed, max_workers=max_workers
+        ):
+            if error:
+                raise error
+            probes[key_range] = result
+            page = result[0]
+            if page:
+                first, last = listed.get(key_range[0], (page[0]["key"], page[-1]["key"]))
+                listed[key_range[0]] = (min(first, page[0]["key"]), max(last, page[-1]["key"]))
+
+        next_entries = []
+        for entry in entries:
+            if len(entry) == 3 and entry[2] is None:
+                page, key_range = probes[entry[1]]
+                if page:
+                    next_entries.append((page[0]["key"], page))
+                if key_range:
+                    next_entries.append((key_range[1], key_range, [obj["key"] for obj in page]))
+            else:
+                next_entries.append(entry)
+        entries = next_entries
+
+        # Ranges with keys listed past their end are cut in parts of about the same number of
+        # pages at their estimated density, sharing the partitions left by the others
+        numberings = {}
+        estimates = {}
+        for _, key_range, sample in (entry for entry in entries if len(entry) == 3):
+            range_prefix, after, through = key_range
+            origin = listed[range_prefix][0]
+            numberings[key_range] = numbering = _key_numbering(key_range, sample, origin)
+            to_number, _, page_span = numbering
+            if through is not None and page_span and listed[range_prefix][1] > through:
+                estimates[key_range] = (to_number(through) - to_number(after)) / page_span
+        budget = max(min_partitions - OPEN_RANGE_PIECES * (len(numberings) - len(estimates)), 1)
+        part_pages = max(1, sum(estimates.values()) / budget)
+
+        guessed = False
+        next_entries = []
+        for entry in entries:
+            if len(entry) == 2:
+                next_entries.append(entry)
+                continue
+
+            sort_key, key_range, sample = entry
+            range_prefix, after, through = key_range
+            if key_range in estimates:
+                pieces = max(1, round(estimates[key_range] / part_pages))
+                points = _split_points(key_range, numberings[key_range], pieces=pieces)
+            else:
+                points = _split_points(key_range, numberings[key_range], origin=listed[range_prefix][0])
+                guessed = guessed or bool(points)
+            bounds = [after] + points + [through]
+            next_entries.extend(
+                (lower, (range_prefix, lower, upper), None if points else sample)
+                for lower, upper in zip(bounds, bounds[1:])
+            )
+        entries = next_entries
+
+    # Merge consecutive listed records into one partition each
+    partitions = []
+    for entry in entries:
+        if len(entry) == 3:
+            partitions.append(entry[1])
+        elif partitions and isinstance(partitions[-1], list):
+            partitions[-1].extend(entry[1])
+        else:
+            partitions.append(list(entry[1]))
+    return partitions
+
+
+def _iter_bucket_objects_parallel(bucket_name, prefix, max_workers):
+    def list_partition(partition):
+        if isinstance(partition, list):
+            return [partition]
+        return _iter_key_range_pages(bucket_name, *partition)
+
+    partitions = _discover_partitions(bucket_name, prefix or "", max_workers * 2, max_workers)
+
+    for page in bounded_chain(list_partition, partitions, max_workers=max_workers):
+        yield from page
+
+
+def iter_bucket_objects(bucket_name, prefix=None, max_keys=None, max_workers=1, inventory=None):
+    """Iterate over the objects of a bucket page by page.
+
+    Objects are yielded as each ListObjectsV2 page arrives and the next page is only
+    requested when the caller keeps iterating, so memory stays constant whatever the
+    bucket size.
+
+    With ``max_workers`` above 1 the keyspace is split into partitions, discovered with
+    ``Delimiter="/"`` (descending up to ``MAX_PARTITION_DEPTH`` levels) and, for folders too
+    few or too large, by key ranges cut at points extrapolated from their first page (see
+    ``_discover_partitions``). Partitions are listed concurrently and yielded in
+    lexicographic order. Each worker runs at most one page
+    ahead of the consumer, so memory stays bounded by the number of workers, and stopping
+    early (``max_keys`` or closing the iterator) stops the workers too. A ``max_keys`` that
+    fits in one page is listed sequentially.
+
+    With ``inventory``, objects are read from an S3 Inventory report instead of
+    ListObjectsV2 (see ``iter_inventory_objects``); ``max_workers`` then sets how many
+    inventory data files are read at the same time.
+
+    Args:
+        bucket_name: The name of the bucket
+        prefix: Optional key prefix to filter objects
+        max_keys: Maximum number of objects to yield (default: unlimited)
+        max_workers: Number of partitions listed at the same time (default: 1)
+        inventory: Optional local path or ``s3://`` URL of an S3 Inventory ``manifest.json``
+
+    Yields:
+        dict: Raw object record with keys 'key', 'size', 'last_modified' (datetime) and
+              'storage_class'
+
+    Raises:
+        ValueError: When AWS API call fails or the inventory cannot be read
+    """
+    if inventory:
+        yield from iter_inventory_objects(inventory, bucket_name, prefix, max_keys, max_workers)
+        return
+
     try:
+        if max_workers > 1 and not (max_keys and max_keys <= LIST_PAGE_KEYS):
+            with contextlib.closing(_iter_bucket_objects_parallel(bucket_name, prefix, max_workers)) as objects:
+                for count, obj in enumerate(objects, start=1):
+                    yield obj
+                    if max_keys and count >= max_keys:
+                        return
+            return
+
         s3_client = create_s3_connection()
 
         kwargs = {"Bucket": bucket_name}
@@ -50,49 +418,118 @@ def list_bucket_objects(bucket_name, prefix=None, max_keys=None):
         if prefix:
             kwargs["Prefix"] = prefix
 
-        objects = []
-        continuation_token = None
+        remaining = max_keys
 
         while True:
-            if continuation_token:
-                kwargs["ContinuationToken"] = continuation_token
+            if remaining:
+                kwargs["MaxKeys"] = min(remaining, 1000)
 
             response = s3_client.list_objects_v2(**kwargs)
 
             for obj in response.get("Contents", []):
-                size_mb = obj["Size"] / (1024 * 1024)
-                objects.append(
-                    {
-                        "key": obj["Key"],
-                        "size": obj["Size"],
-                        "size_mb": f"{size_mb:.2f}",
-                        "last_modified": obj["LastModified"].strftime("%Y-%m-%d %H:%M:%S UTC"),
-                        "storage_class": obj.get("StorageClass", "STANDARD"),
-                    }
-                )
-
-                if max_keys and len(objects) >= max_keys:
-                    break
-
-            if max_keys and len(objects) >= max_keys:
-                break
+                yield object_record(obj)
+
+                if remaining:
+                    remaining -= 1
+                    if remaining == 0:
+                        return
 
             if not response.get("IsTruncated"):
                 break
 
-            continuation_token = response.get("NextContinuationToken")
-
-        return {
-            "bucket_name": bucket_name,
-            "prefix": prefix or "all",
-            "total_objects": len(objects),
-            "objects": objects,
-        }
+            kwargs["ContinuationToken"] = response.get("NextContinuationToken")
 
     except ClientError as e:
         raise ValueError(f"Failed to list objects in bucket '{bucket_name}': {e}") from e
 
 
+def list_bucket_objects(bucket_name, prefix=None, max_keys=None, max_workers=1, inventory=None):
+    objects = [
+        format_object_record(obj)
+        for obj in iter_bucket_objects(bucket_name, prefix, max_keys, max_workers, inventory)
+    ]
+
+    return {
+        "bucket_name": bucket_name,
+        "prefix": prefix or "all",
+        "total_objects": len(objects),
+        "objects": objects,
+    }
+
+
+def summarize_objects(objects):
+    """Compute streaming aggregates over object records without keeping them.
+
+    Args:
+        objects: Iterable of raw object records (e.g. from ``iter_bucket_objects``)
+
+    Returns:
+        dict: Summary with keys 'total_objects', 'total_size', 'min_size', 'max_size',
+              'mean_size', 'oldest_modified', 'newest_modified' and 'storage_classes'
+              (mapping of storage class to {'count', 'size'})
+    """
+    total_objects = 0
+    total_size = 0
+    min_size = None
+    max_size = None
+    oldest = None
+    newest = None
+    storage_classes = {}
+
+    for obj in objects:
+        size = obj["size"]
+        last_modified = obj["last_modified"]
+
+        total_objects += 1
+        total_size += size
+        if min_size is None or size < min_size:
+            min_size = size
+        if max_size is None or size > max_size:
+            max_size = size
+        if oldest is None or last_modified < oldest:
+            oldest = last_modified
+        if newest is None or last_modified > newest:
+            newest = last_modified
+
+        storage_class = storage_classes.get(obj["storage_class"])
+        if storage_class is None:
+            storage_class = storage_classes[obj["storage_class"]] = {"count": 0, "size": 0}
+        storage_class["count"] += 1
+        storage_class["size"] += size
+
+    return {
+        "total_objects": total_objects,
+        "total_size": total_size,
+        "min_size": min_size or 0,
+        "max_size": max_size or 0,
+        "mean_size": total_size / total_objects if total_objects else 0,
+        "oldest_modified": oldest.strftime("%Y-%m-%d %H:%M:%S UTC") if oldest else None,
+        "newest_modified": newest.strftime("%Y-%m-%d %H:%M:%S UTC") if newest else None,
+        "storage_classes": dict(sorted(storage_classes.items())),
+    }
+
+
+def summarize_bucket_objects(bucket_name, prefix=None, max_keys=None, inventory=None, max_workers=1):
+    """Summarize the objects of a bucket in constant memory.
+
+    Args:
+        bucket_name: The name of the bucket
+        prefix: Optional key prefix to filter objects
+        max_keys: Maximum number of objects to include (default: unlimited)
+        inventory: Optional S3 Inventory manifest to read instead of listing the bucket
+        max_workers: Number of partitions listed (or inventory files read) at the same time
+                     (default: 1)
+
+    Returns:
+        dict: ``summarize_objects`` result plus 'bucket_name' and 'prefix'
+
+    Raises:
+        ValueError: When AWS API call fails
+    """
+    summary = summarize_objects(iter_bucket_objects(bucket_name, prefix, max_keys, max_workers, inventory))
+    return {"bucket_name": bucket_name, "prefix": prefix or "all", **summary}
+
+
 def get_object_info(bucket_name, object_key):
     try:
         s3_client = create_s3_connection()
@@ -112,6 +549,8 @@ def get_object_info(bucket_name, object_key):
             "storage_class": response.get("StorageClass", "STANDARD"),
             "metadata": response.get("Metadata", {}),
             "version_id": response.get("VersionId", "N/A"),
+            "server_side_encryption": response.get("ServerSideEncryption"),
+            "sse_customer_algorithm": response.get("SSECustomerAlgorithm"),
         }
 
         return object_info
@@ -122,6 +561,26 @@ def get_object_info(bucket_name, object_key):
         raise ValueError(f"Failed to get object info: {e}") from e
 
 
+def object_content_result(bucket_name, object_key, content_bytes, content_type, encoding):
+    """Decode downloaded object bytes into the result returned by ``read_object_content``."""
+    try:
+        content = content_bytes.decode(encoding)
+        is_binary = False
+    except UnicodeDecodeError:
+        content = None
+        is_binary = True
+
+    return {
+        "bucket": bucket_name,
+        "key": object_key,
+        "size": len(content_bytes),
+        "content_type": content_type,
+        "is_binary": is_binary,
+        "encoding": encoding if not is_binary else None,
+        "content": content,
+    }
+
+
 def read_object_content(bucket_name, object_key, encoding="utf-8"):
     try:
         s3_client = create_s3_connection()
@@ -130,55 +589,180 @@ def read_object_content(bucket_name, object_key, encoding="utf-8"):
 
         content_bytes = response["Body"].read()
 
-        try:
-            content = content_bytes.decode(encoding)
-            is_binary = False
-        except UnicodeDecodeError:
-            content = None
-            is_binary = True
+        return object_content_result(
+            bucket_name, object_key, content_bytes, response.get("ContentType", "N/A"), encoding
+        )
 
-        result = {
-            "bucket": bucket_name,
-            "key": object_key,
-            "size": len(content_bytes),
-            "content_type": response.get("ContentType", "N/A"),
-            "is_binary": is_binary,
-            "encoding": encoding if not is_binary else None,
-            "content": content,
-        }
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "NoSuchKey":
+            raise ValueError(f"Object '{object_key}' not found in bucket '{bucket_name}'") from e
+        raise ValueError(f"Failed to read object content: {e}") from e
+
+
+def parse_byte_range(value):
+    """Validate a byte range given as "START-END", "START-" or "-LAST_N_BYTES".
+
+    Args:
+        value: Byte range string
+
+    Returns:
+        str: The range in HTTP Range header form (e.g. "bytes=0-1023")
+
+    Raises:
+        ValueError: When the range is malformed
+    """
+    start, separator, end = value.strip().partition("-")
+    if (
+        not separator
+        or not (start or end)
+        or (start and not start.isdigit())
+        or (end and not end.isdigit())
+        or (start and end and int(end) < int(start))
+    ):
+        raise ValueError(f"Invalid byte range '{value}', expected START-END, START- or -LAST_N_BYTES")
+    return f"bytes={start}-{end}"
 
-        return result
+
+def read_object_stream(bucket_name, object_key, encoding="utf-8", byte_range=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Open an object for streaming and decode its body incrementally.
+
+    Only the first chunk is read before returning; it is used to detect binary content.
+    The remaining chunks are downloaded and decoded while ``chunks`` is consumed, so memory
+    use does not depend on the object size. With ``byte_range`` only that part of the object
+    is fetched (ranged GET); undecodable bytes at the range edges are replaced.
+
+    Args:
+        bucket_name: The name of the bucket
+        object_key: The key (path) of the object
+        encoding: Text encoding to use (default: utf-8)
+        byte_range: Optional HTTP byte range, e.g. "bytes=0-1023" (see ``parse_byte_range``)
+        chunk_size: Number of bytes read per chunk (default: 64 KB)
+
+    Returns:
+        dict: Object information with keys 'bucket', 'key', 'size' (bytes in this response),
+              'total_size', 'content_range', 'content_type', 'is_binary', 'encoding' and
+              'chunks' (iterator of decoded text, or None for binary objects)
+
+    Raises:
+        ValueError: When the object does not exist or AWS API call fails
+    """
+    try:
+        s3_client = create_s3_connection()
+
+        kwargs = {"Bucket": bucket_name, "Key": object_key}
+        if byte_range:
+            kwargs["Range"] = byte_range
+
+        response = s3_client.get_object(**kwargs)
 
     except ClientError as e:
         if e.response["Error"]["Code"] == "NoSuchKey":
             raise ValueError(f"Object '{object_key}' not found in bucket '{bucket_name}'") from e
+        if e.response["Error"]["Code"] == "InvalidRange":
+            raise ValueError(f"Byte range '{byte_range}' is not satisfiable for object '{object_key}'") from e
         raise ValueError(f"Failed to read object content: {e}") from e
 
+    body = response["Body"]
+    raw_chunks = body.iter_chunks(chunk_size)
+    first_chunk = next(raw_chunks, b"")
+
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace" if byte_range else "strict")
+    try:
+        first_text = decoder.decode(first_chunk)
+        is_binary = bool(byte_range) and b"\x00" in first_chunk
+    except UnicodeDecodeError:
+        is_binary = True
+
+    content_range = response.get("ContentRange")
+    result = {
+        "bucket": bucket_name,
+        "key": object_key,
+        "size": response["ContentLength"],
+        "total_size": int(content_range.rsplit("/", 1)[1]) if content_range else response["ContentLength"],
+        "content_range": content_range,
+        "content_type": response.get("ContentType", "N/A"),
+        "is_binary": is_binary,
+        "encoding": encoding if not is_binary else None,
+        "chunks": None,
+    }
 
-def read_folder_contents(bucket_name, prefix, encoding="utf-8", max_files=None):
+    if is_binary:
+        body.close()
+        return result
+
+    def decoded_chunks():
+        decoder.errors = "replace"
+        try:
+            yield first_text
+            for chunk in raw_chunks:
+                yield decoder.decode(chunk)
+            yield decoder.decode(b"", final=True)
+        finally:
+            body.close()
+
+    result["chunks"] = decoded_chunks()
+    return result
+
+
+def iter_folder_contents(
+    bucket_name,
+    prefix,
+    encoding="utf-8",
+    max_files=None,
+    max_workers=DEFAULT_READ_WORKERS,
+    ordered=True,
+    max_buffer_bytes=DEFAULT_MAX_BUFFER_BYTES,
+):
+    """Download the files under a prefix on a worker pool and yield them as they finish.
+
+    Files whose content has been downloaded but not consumed yet are capped at
+    ``max_buffer_bytes`` (by listed object size), so memory does not grow with the prefix.
+
+    Args:
+        bucket_name: The name of the bucket
+        prefix: The folder prefix/path to read
+        encoding: Text encoding to use (default: utf-8)
+        max_files: Maximum number of files to read (default: unlimited)
+        max_workers: Number of parallel downloads (default: 8)
+        ordered: Yield files in key order (True) or as soon as they finish (False)
+        max_buffer_bytes: Maximum bytes of downloaded files held in memory (default: 64 MB)
+
+    Yields:
+        dict: File data with keys 'key', 'size', 'is_binary', 'content' and, for files that
+              could not be read, 'error'
+
+    Raises:
+        ValueError: When the folder cannot be listed
+    """
+
+    def read_file(obj):
+        content_result = read_object_content(bucket_name, obj["key"], encoding)
+        return {
+            "key": obj["key"],
+            "size": content_result["size"],
+            "is_binary": content_result["is_binary"],
+            "content": content_result["content"],
+        }
+
+    for obj, file_data, error in bounded_map(
+        read_file,
+        iter_bucket_objects(bucket_name, prefix, max_keys=max_files),
+        max_workers=max_workers,
+        ordered=ordered,
+        weight=lambda obj: obj["size"],
+        max_pending_weight=max_buffer_bytes,
+    ):
+        if error:
+            yield {"key": obj["key"], "size": obj["size"], "is_binary": True, "content": None, "error": str(error)}
+        else:
+            yield file_data
+
+
+def read_folder_contents(bucket_name, prefix, encoding="utf-8", max_files=None, max_workers=DEFAULT_READ_WORKERS):
     try:
-        objects_result = list_bucket_objects(bucket_name, prefix, max_keys=max_files)
-
-        if objects_result["total_objects"] == 0:
-            return {"bucket": bucket_name, "prefix": prefix, "total_files": 0, "files": []}
-
-        files_with_content = []
-
-        for obj in objects_result["objects"]:
-            try:
-                content_result = read_object_content(bucket_name, obj["key"], encoding)
-                files_with_content.append(
-                    {
-                        "key": obj["key"],
-                        "size": content_result["size"],
-                        "is_binary": content_result["is_binary"],
-                        "content": content_result["content"],
-                    }
-                )
-            except Exception as e:
-                files_with_content.append(
-                    {"key": obj["key"], "size": obj["size"], "is_binary": True, "content": None, "error": str(e)}
-                )
+        files_with_content = list(
+            iter_folder_contents(bucket_name, prefix, encoding, max_files, max_workers=max_workers)
+        )
 
         return {
             "bucket": bucket_name,
@@ -189,3 +773,300 @@ def read_folder_contents(bucket_name, prefix, encoding="utf-8", max_files=None):
 
     except Exception as e:
         raise ValueError(f"Failed to read folder contents: {e}") from e
+
+
+def _line_match(line_number, line, match, start):
+    if start or len(line) > MAX_SEARCH_LINE_CHARS:
+        line = line[max(start, match.start() - LONG_LINE_CONTEXT_CHARS) : match.end() + LONG_LINE_CONTEXT_CHARS]
+    return {"line_number": line_number, "line": line.rstrip("\r")}
+
+
+def _search_object(bucket_name, object_key, regex, encoding, first_match_only):
+    result = read_object_stream(bucket_name, object_key, encoding)
+
+    def record(matches, complete):
+        return {
+            "key": object_key,
+            "size": result["total_size"],
+            "is_binary": result["is_binary"],
+            "matches": matches,
+            "complete": complete,
+        }
+
+    if result["is_binary"]:
+        yield record([], True)
+        return
+
+    chunks = result["chunks"]
+    line_number = 0
+    carry = ""
+    # While the current line is longer than MAX_SEARCH_LINE_CHARS, ``carry`` only keeps its
+    # last characters: the first one is context for the pattern, not searched again, and
+    # the line is reported at most once.
+    start = 0
+    reported = False
+    try:
+        for chunk in itertools.chain(chunks, [None]):
+            if chunk is None:
+                buffer, carry = carry, ""
+            else:
+                buffer = carry + chunk
+                end = buffer.rfind("\n") + 1
+                buffer, carry = buffer[:end], buffer[end:]
+
+            matches = []
+            if not buffer or not regex.search(buffer, start):
+                line_number += buffer.count("\n")
+            else:
+                lines = buffer.split("\n")
+                if not lines[-1]:
+                    lines.pop()
+                for index, line in enumerate(lines):
+                    line_number += 1
+                    line_start = 0 if index else start
+                    match = None if index == 0 and reported else regex.search(line, line_start)
+                    if match:
+                        matches.append(_line_match(line_number, line, match, line_start))
+                        if first_match_only:
+                            break
+            if buffer:
+                start, reported = 0, False
+
+            if len(carry) > MAX_SEARCH_LINE_CHARS and not (first_match_only and matches):
+                match = None if reported else regex.search(carry, start)
+                if match:
+                    matches.append(_line_match(line_number + 1, carry, match, start))
+                    reported = True
+                carry = carry[-(SEARCH_WINDOW_OVERLAP + 1) :]
+                start = 1
+
+            if matches:
+                if first_match_only:
+                    yield record(matches, True)
+                    return
+                yield record(matches, False)
+    finally:
+        chunks.close()
+
+    yield record([], True)
+
+
+def iter_object_matches(
+    bucket_name,
+    prefix,
+    pattern,
+    encoding="utf-8",
+    ignore_case=False,
+    first_match_only=False,
+    max_files=None,
+    max_workers=DEFAULT_READ_WORKERS,
+):
+    """Search the text objects under a prefix for a regular expression, like ``grep -r``.
+
+    Objects are streamed through the matcher on a worker pool, so only one chunk per
+    worker is held in memory, and matches are yielded as soon as they are found. Binary
+    objects are skipped after their first chunk and, with ``first_match_only``, the
+    download of an object stops at its first match. Chunks without any match are skipped
+    without splitting them into lines. Lines longer than ``MAX_SEARCH_LINE_CHARS`` (such as
+    single-line objects) are searched in windows overlapping by ``SEARCH_WINDOW_OVERLAP``
+    characters, reported once per line with ``LONG_LINE_CONTEXT_CHARS`` around the match.
+
+    Args:
+        bucket_name: The name of the bucket
+        prefix: The folder prefix/path to search
+        pattern: Regular expression (Python syntax) matched against each line
+        encoding: Text encoding to use (default: utf-8)
+        ignore_case: Match case-insensitively (default: False)
+        first_match_only: Stop reading an object after its first matching line
+        max_files: Maximum number of objects to search (default: unlimited)
+        max_workers: Number of objects searched at the same time (default: 8)
+
+    Yields:
+        dict: Records with 'key', 'size', 'is_binary', 'matches' (list of dicts with
+              'line_number' and 'line' found since the object's previous record) and
+              'complete'. Each searched object ends with one record where 'complete' is
+              True; objects that could not be read also get 'error' there. Records of
+              different objects are interleaved.
+
+    Raises:
+        ValueError: When the pattern is invalid or the prefix cannot be listed
+    """
+    try:
+        regex = re.compile(pattern, re.MULTILINE | (re.IGNORECASE if ignore_case else 0))
+    except re.error as e:
+        raise ValueError(f"Invalid pattern '{pattern}': {e}") from e
+
+    def search(obj):
+        try:
+            yield from _search_object(bucket_name, obj["key"], regex, encoding, first_match_only)
+        except Exception as e:
+            yield {
+                "key": obj["key"],
+                "size": obj["size"],
+                "is_binary": False,
+                "matches": [],
+                "complete": True,
+                "error": str(e),
+            }
+
+    objects = (obj for obj in iter_bucket_objects(bucket_name, prefix, max_keys=max_files) if obj["size"] > 0)
+    yield from bounded_chain(search, objects, max_workers=max_workers, ordered=False)
+
+
+def _save_checkpoint(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def _load_checkpoint(path, expected):
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return set()
+
+    if not isinstance(data, dict) or any(data.get(name) != value for name, value in expected.items()):
+        return set()
+    return set(data.get("done", []))
+
+
+def _file_md5(path, chunk_size=DEFAULT_PART_SIZE):
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def download_object(
+    bucket_name,
+    object_key,
+    destination,
+    part_size=DEFAULT_PART_SIZE,
+    max_workers=DEFAULT_DOWNLOAD_WORKERS,
+    resume=True,
+    on_progress=None,
+    object_info=None,
+):
+    """Download an object to a local file with concurrent ranged GETs.
+
+    The object is split into ``part_size`` byte ranges that are fetched on a worker pool
+    and written in place into a preallocated ``<destination>.part`` file. Every finished
+    part is recorded in ``<destination>.part.json``, so an interrupted download resumes
+    with the missing parts only. Each GET is conditional on the ETag read at the start
+    (when the object has one), so the parts always belong to the same object version. The
+    bytes received for each part are checked against its range, and the MD5 of the file
+    as well when the ETag is a plain MD5 (single-part uploads not encrypted with KMS or a
+    customer key), before the file is renamed to ``destination``.
+
+    Args:
+        bucket_name: The name of the bucket
+        object_key: The key (path) of the object
+        destination: Local file path, or existing directory to download into
+        part_size: Size of each ranged GET in bytes (default: 8 MB)
+        max_workers: Number of parts downloaded at the same time (default: 8)
+        resume: Reuse the parts recorded by an interrupted download (default: True)
+        on_progress: Optional callable receiving the number of bytes of each finished part
+                     (including parts reused on resume)
+        object_info: Result of ``get_object_info`` for the object, when already read
+                     (saves a HeadObject)
+
+    Returns:
+        dict: Download result with keys 'bucket', 'key', 'path', 'size', 'etag', 'parts',
+              'resumed_parts' and 'verified' ('md5' or 'size')
+
+    Raises:
+        ValueError: When the object cannot be read, changes during the download or fails
+                    verification
+    """
+    if part_size <= 0:
+        raise ValueError("Part size must be positive")
+
+    info = object_info or get_object_info(bucket_name, object_key)
+    size = info["size"]
+    etag = info["etag"] if info["etag"] != "N/A" else None
+
+    if os.path.isdir(destination):
+        destination = os.path.join(destination, os.path.basename(object_key.rstrip("/")) or "download")
+    part_path = f"{destination}.part"
+    checkpoint_path = f"{part_path}.json"
+
+    parts = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+    checkpoint = {"bucket": bucket_name, "key": object_key, "etag": etag, "size": size, "part_size": part_size}
+
+    done = set()
+    if resume and os.path.exists(part_path) and os.path.getsize(part_path) == size:
+        done = _load_checkpoint(checkpoint_path, checkpoint)
+
+    try:
+        if not done:
+            with open(part_path, "wb") as f:
+                f.truncate(size)
+            _save_checkpoint(checkpoint_path, {**checkpoint, "done": []})
+    except OSError as e:
+        raise ValueError(f"Failed to create '{part_path}': {e}") from e
+
+    if on_progress:
+        for index in done:
+            start, end = parts[index]
+            on_progress(end - start + 1)
+
+    s3_client = create_s3_connection()
+
+    def download_part(index):
+        start, end = parts[index]
+        kwargs = {"IfMatch": f'"{etag}"'} if etag else {}
+        response = s3_client.get_object(Bucket=bucket_name, Key=object_key, Range=f"bytes={start}-{end}", **kwargs)
+        written = 0
+        with open(part_path, "r+b") as f:
+            f.seek(start)
+            for chunk in response["Body"].iter_chunks(DEFAULT_CHUNK_SIZE):
+                f.write(chunk)
+                written += len(chunk)
+        if written != end - start + 1:
+            raise ValueError(f"Part {index} returned {written} bytes, expected {end - start + 1}")
+        return written
+
+    pending = [index for index in range(len(parts)) if index not in done]
+    resumed_parts = len(done)
+
+    for index, written, error in bounded_map(download_part, pending, max_workers=max_workers, ordered=False):
+        if error:
+            if isinstance(error, ClientError) and error.response["Error"]["Code"] in ("PreconditionFailed", "412"):
+                raise ValueError(f"Object '{object_key}' changed during the download; run it again") from error
+            raise ValueError(f"Failed to download part {index} of '{object_key}': {error}") from error
+
+        done.add(index)
+        _save_checkpoint(checkpoint_path, {**checkpoint, "done": sorted(done)})
+        if on_progress:
+            on_progress(written)
+
+    verified = "size"
+    if (
+        etag
+        and "-" not in etag
+        and len(etag) == 32
+        and not (info["server_side_encryption"] or "").startswith("aws:kms")
+        and not info.get("sse_customer_algorithm")
+    ):
+        if _file_md5(part_path) != etag:
+            os.remove(part_path)
+            os.remove(checkpoint_path)
+            raise ValueError(f"MD5 of '{object_key}' does not match its ETag; the partial download was removed")
+        verified = "md5"
+
+    os.replace(part_path, destination)
+    os.remove(checkpoint_path)
+
+    return {
+        "bucket": bucket_name,
+        "key": object_key,
+        "path": destination,
+        "size": size,
+        "etag": etag,
+        "parts": len(parts),
+        "resumed_parts": resumed_parts,
+        "verified": verified,
+    }
@@ -0,0 +1,267 @@
+import contextlib
+import csv
+import datetime
+import gzip
+import io
+import itertools
+import json
+import os
+import shutil
+import tempfile
+import urllib.parse
+
+from botocore.exceptions import ClientError
+
+from aws_vibe_guru.aws_clients import get_client
+from aws_vibe_guru.concurrency import bounded_chain
+
+INVENTORY_FORMATS = ("CSV", "Parquet", "ORC")
+INVENTORY_BATCH_SIZE = 1000
+
+_COLUMNS = {
+    "CSV": {
+        "key": "Key",
+        "size": "Size",
+        "last_modified": "LastModifiedDate",
+        "storage_class": "StorageClass",
+        "is_latest": "IsLatest",
+        "is_delete_marker": "IsDeleteMarker",
+    },
+    "COLUMNAR": {
+        "key": "key",
+        "size": "size",
+        "last_modified": "last_modified_date",
+        "storage_class": "storage_class",
+        "is_latest": "is_latest",
+        "is_delete_marker": "is_delete_marker",
+    },
+}
+
+
+def _is_s3_url(location):
+    return location.startswith("s3://")
+
+
+def _split_s3_url(url):
+    bucket, _, key = url[len("s3://") :].partition("/")
+    return bucket, key
+
+
+def _open_location(location):
+    """Open a local file or an ``s3://`` object as a binary stream."""
+    if not _is_s3_url(location):
+        try:
+            return open(location, "rb")
+        except OSError as e:
+            raise ValueError(f"Failed to open inventory file '{location}': {e}") from e
+
+    bucket, key = _split_s3_url(location)
+    try:
+        return get_client("s3").get_object(Bucket=bucket, Key=key)["Body"]
+    except ClientError as e:
+        raise ValueError(f"Failed to read inventory file '{location}': {e}") from e
+
+
+def _resolve_local_file(manifest_dir, key):
+    directory = manifest_dir
+    while True:
+        candidate = os.path.join(directory, key)
+        if os.path.exists(candidate):
+            return candidate
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+
+    # Layout of a synced inventory configuration: <config>/<date>/manifest.json and <config>/data/<file>
+    return os.path.join(os.path.dirname(manifest_dir), "data", os.path.basename(key))
+
+
+def load_inventory_manifest(manifest):
+    """Load an S3 Inventory ``manifest.json``.
+
+    Data files listed in a local manifest are looked up relative to the manifest's parent
+    directories (mirroring the destination bucket layout) and then in the ``data``
+    directory next to the manifest's date directory.
+
+    Args:
+        manifest: Local path or ``s3://bucket/key`` URL of the manifest
+
+    Returns:
+        dict: Manifest with keys 'source_bucket', 'file_format', 'file_schema' (list of
+              column names, CSV only) and 'files' (list of local paths or s3:// URLs)
+
+    Raises:
+        ValueError: When the manifest cannot be read or has an unsupported format
+    """
+    stream = _open_location(manifest)
+    try:
+        data = json.load(stream)
+    except (UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid inventory manifest '{manifest}': {e}") from e
+    finally:
+        stream.close()
+
+    file_format = data.get("fileFormat", "CSV")
+    if file_format not in INVENTORY_FORMATS:
+        raise ValueError(
+            f"Unsupported inventory format '{file_format}' (expected one of {', '.join(INVENTORY_FORMATS)})"
+        )
+
+    if _is_s3_url(manifest):
+        destination_bucket = data.get("destinationBucket", "").split(":::")[-1] or _split_s3_url(manifest)[0]
+        files = [f"s3://{destination_bucket}/{entry['key']}" for entry in data.get("files", [])]
+    else:
+        manifest_dir = os.path.dirname(os.path.abspath(manifest))
+        files = [_resolve_local_file(manifest_dir, entry["key"]) for entry in data.get("files", [])]
+
+    file_schema = []
+    if file_format == "CSV":
+        file_schema = [column.strip() for column in data.get("fileSchema", "").split(",")]
+
+    return {
+        "source_bucket": data.get("sourceBucket"),
+        "file_format": file_format,
+        "file_schema": file_schema,
+        "files": files,
+    }
+
+
+def _parse_timestamp(value):
+    if isinstance(value, datetime.datetime):
+        return value if value.tzinfo else value.replace(tzinfo=datetime.timezone.utc)
+    value = value.rstrip("Z")
+    try:
+        parsed = datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f")
+    except ValueError:
+        parsed = datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
+    return parsed.replace(tzinfo=datetime.timezone.utc)
+
+
+def _is_false(value):
+    return value is False or value == "false"
+
+
+def _is_true(value):
+    return value is True or value == "true"
+
+
+def _iter_csv_rows(stream, file_schema):
+    text = io.TextIOWrapper(gzip.GzipFile(fileobj=stream), encoding="utf-8", newline="")
+    for row in csv.reader(text):
+        row = dict(zip(file_schema, row))
+        row["Key"] = urllib.parse.unquote_plus(row.get("Key", ""))
+        yield row
+
+
+def _iter_columnar_rows(stream, file_format):
+    try:
+        if file_format == "Parquet":
+            import pyarrow.parquet as reader
+        else:
+            import pyarrow.orc as reader
+    except ImportError as e:
+        raise ValueError(
+            f"Reading {file_format} inventories requires pyarrow: pip install 'aws-vibe-guru[inventory]'"
+        ) from e
+
+    # pyarrow needs a seekable file, so S3 bodies are spooled to disk first
+    with tempfile.TemporaryFile() as f:
+        shutil.copyfileobj(stream, f)
+        f.seek(0)
+
+        if file_format == "Parquet":
+            batches = reader.ParquetFile(f).iter_batches()
+        else:
+            orc_file = reader.ORCFile(f)
+            batches = (orc_file.read_stripe(index) for index in range(orc_file.nstripes))
+
+        for batch in batches:
+            yield from batch.to_pylist()
+
+
+def _iter_inventory_file(location, inventory, prefix):
+    file_format = inventory["file_format"]
+    columns = _COLUMNS["CSV" if file_format == "CSV" else "COLUMNAR"]
+
+    stream = _open_location(location)
+    try:
+        if file_format == "CSV":
+            rows = _iter_csv_rows(stream, inventory["file_schema"])
+        else:
+            rows = _iter_columnar_rows(stream, file_format)
+
+        for row in rows:
+            key = row.get(columns["key"])
+            if not key or (prefix and not key.startswith(prefix)):
+                continue
+            if _is_false(row.get(columns["is_latest"])) or _is_true(row.get(columns["is_delete_marker"])):
+                continue
+
+            yield {
+                "key": key,
+                "size": int(row.get(columns["size"]) or 0),
+                "last_modified": _parse_timestamp(row[columns["last_modified"]]),
+                "storage_class": row.get(columns["storage_class"]) or "STANDARD",
+            }
+    except (OSError, EOFError, csv.Error, KeyError) as e:
+        raise ValueError(f"Failed to read inventory file '{location}': {e}") from e
+    finally:
+        stream.close()
+
+
+def _iter_inventory_files_parallel(inventory, prefix, max_workers):
+    def read_file(location):
+        objects = _iter_inventory_file(location, inventory, prefix)
+        while True:
+            batch = list(itertools.islice(objects, INVENTORY_BATCH_SIZE))
+            if not batch:
+                return
+            yield batch
+
+    for batch in bounded_chain(read_file, inventory["files"], max_workers=max_workers, ordered=False):
+        yield from batch
+
+
+def iter_inventory_objects(manifest, bucket_name=None, prefix=None, max_keys=None, max_workers=1):
+    """Iterate over the objects listed in an S3 Inventory report instead of calling ListObjectsV2.
+
+    The inventory data files (gzipped CSV, or Parquet/ORC with the optional ``pyarrow``
+    dependency) are streamed. With ``max_workers`` above 1 several files are read at the
+    same time, each handing over batches of ``INVENTORY_BATCH_SIZE`` records through a
+    bounded queue, so memory does not grow with file size; records of different files are
+    then interleaved. Non-current versions and delete markers are skipped. Unlike
+    ListObjectsV2, records are in inventory file order, not key order.
+
+    Args:
+        manifest: Local path or ``s3://bucket/key`` URL of the inventory ``manifest.json``
+        bucket_name: Optional bucket name, checked against the manifest's source bucket
+        prefix: Optional key prefix to filter objects
+        max_keys: Maximum number of objects to yield (default: unlimited)
+        max_workers: Number of data files read at the same time (default: 1)
+
+    Yields:
+        dict: Raw object record with keys 'key', 'size', 'last_modified' (datetime) and
+              'storage_class', as yielded by ``iter_bucket_objects``
+
+    Raises:
+        ValueError: When the manifest or a data file cannot be read, or the inventory
+                    belongs to another bucket
+    """
+    inventory = load_inventory_manifest(manifest)
+    source_bucket = inventory["source_bucket"]
+    if bucket_name and source_bucket and source_bucket != bucket_name:
+        raise ValueError(f"Inventory '{manifest}' lists bucket '{source_bucket}', not '{bucket_name}'")
+
+    if max_workers > 1:
+        objects = _iter_inventory_files_parallel(inventory, prefix, max_workers)
+    else:
+        objects = (
+            obj for location in inventory["files"] for obj in _iter_inventory_file(location, inventory, prefix)
+        )
+
+    with contextlib.closing(objects):
+        for count, obj in enumerate(objects, start=1):
+            yield obj
+            if max_keys and count >= max_keys:
+                return
@@ -1,45 +1,51 @@
-import configparser
 import datetime
-import os.path
+import itertools
+import math
+import os
+import random
+import time
 
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from aws_vibe_guru.aws_clients import (
+    create_client,
+    get_account_id,
+    get_client,
+    is_throttling_error,
+    read_aws_credentials,
+)
+from aws_vibe_guru.aws_cloudwatch import (
+    MAX_QUERIES_PER_REQUEST,
+    choose_period,
+    get_metric_data,
+    metric_query,
+)
+from aws_vibe_guru.cache import load_json_cache, save_json_cache
+from aws_vibe_guru.concurrency import bounded_map
+from aws_vibe_guru.stats import compute_matrix_statistics
+
 ONE_DAY_IN_SECONDS = 86400
 ONE_HOUR_IN_SECONDS = 3600
+DAYS_IN_WEEK = 7
 
-
-def read_aws_credentials():
-    """Read AWS credentials from ~/.aws/credentials file or environment variables.
-
-    Returns:
-        dict: Dictionary containing access_key, secret_key, and region
-
-    """
-    credentials_file = os.path.expanduser("~/.aws/credentials")
-    if os.path.exists(credentials_file):
-        config = configparser.ConfigParser()
-        config.read(credentials_file)
-
-        if "default" in config.sections():
-            return {
-                "access_key": config.get("default", "aws_access_key_id", fallback=""),
-                "secret_key": config.get("default", "aws_secret_access_key", fallback=""),
-                "region": config.get("default", "region", fallback="us-east-1"),
-            }
-
-    credentials = {
-        "access_key": os.environ.get("AWS_ACCESS_KEY_ID", ""),
-        "secret_key": os.environ.get("AWS_SECRET_ACCESS_KEY", ""),
-        "region": os.environ.get("AWS_DEFAULT_REGION", "us-east-1"),
-    }
-
-    return credentials
+QUEUE_URL_CACHE_FILE = "queue_urls.json"
+QUEUE_URL_CACHE_TTL_SECONDS = int(os.environ.get("AWS_VIBE_GURU_QUEUE_URL_TTL", ONE_DAY_IN_SECONDS))
+QUEUE_NOT_FOUND_ERROR_CODES = ("AWS.SimpleQueueService.NonExistentQueue", "QueueDoesNotExist")
+BATCH_THROTTLE_RETRIES = 4
+BATCH_THROTTLE_BACKOFF_SECONDS = 1.0
+QUEUE_COUNT_ATTRIBUTES = {
+    "available": "ApproximateNumberOfMessages",
+    "in_flight": "ApproximateNumberOfMessagesNotVisible",
+    "delayed": "ApproximateNumberOfMessagesDelayed",
+}
 
 
 def create_sqs_connection(access_key=None, secret_key=None, region=None):
     """Establish connection with AWS SQS service.
 
+    Without explicit keys the shared client from ``aws_clients.get_client`` is returned, so
+    repeated calls reuse one client and its connection pool.
+
     Args:
         access_key: AWS access key ID (optional, will read from credentials if not provided)
         secret_key: AWS secret access key (optional, will read from credentials if not provided)
@@ -51,65 +57,171 @@ def create_sqs_connection(access_key=None, secret_key=None, region=None):
     Raises:
         ValueError: When credentials are invalid or missing or AWS connection fails
     """
-    if not all([access_key, secret_key, region]):
-        credentials = read_aws_credentials()
-        access_key = access_key or credentials["access_key"]
-        secret_key = secret_key or credentials["secret_key"]
-        region = region or credentials["region"]
+    if not (access_key and secret_key):
+        return get_client("sqs", region)
 
     try:
-        return boto3.client(
-            "sqs",
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name=region,
-        )
+        return create_client("sqs", access_key, secret_key, region or read_aws_credentials()["region"])
     except NoCredentialsError as e:
         raise ValueError("Invalid AWS credentials provided") from e
     except ClientError as e:
         raise ValueError(f"Failed to connect to AWS SQS: {e}") from e
 
 
-def list_sqs_queues(queue_name_prefix=None, max_results=1000):
-    """List all SQS queues with optional filtering.
+def iter_sqs_queues(queue_name_prefix=None, page_size=1000):
+    """Iterate over SQS queues, following ListQueues pagination.
+
+    Queues are yielded as each page arrives, and pages after the one being consumed are only
+    requested when the caller keeps iterating, so stopping early skips the remaining calls.
 
     Args:
-        sqs_client: boto3 SQS client object
         queue_name_prefix: Optional prefix to filter queue names
-        max_results: Maximum number of queues to return (default 1000)
+        page_size: Number of queues requested per ListQueues call (max 1000)
 
-    Returns:
-        list: List of dictionaries containing queue information with keys:
-              'name', 'url'
+    Yields:
+        dict: Queue information with keys 'name', 'url'
 
     Raises:
         ValueError: When AWS API call fails
     """
     try:
         sqs_client = create_sqs_connection()
-        kwargs = {"MaxResults": min(max_results, 1000)}
+        kwargs = {"MaxResults": min(page_size, 1000)}
         if queue_name_prefix:
             kwargs["QueueNamePrefix"] = queue_name_prefix
 
-        response = sqs_client.list_queues(**kwargs)
-        queue_urls = response.get("QueueUrls", [])
+        while True:
+            response = sqs_client.list_queues(**kwargs)
 
-        queues = []
-        for url in queue_urls:
-            queue_name = url.split("/")[-1]
-            queues.append({"name": queue_name, "url": url})
+            for url in response.get("QueueUrls", []):
+                yield {"name": url.split("/")[-1], "url": url}
 
-        return queues
+            next_token = response.get("NextToken")
+            if not next_token:
+                break
+            kwargs["NextToken"] = next_token
 
     except ClientError as e:
         raise ValueError(f"Failed to list SQS queues: {e}") from e
 
 
+def list_sqs_queues(queue_name_prefix=None, max_results=None):
+    """List all SQS queues with optional filtering.
+
+    Args:
+        queue_name_prefix: Optional prefix to filter queue names
+        max_results: Maximum number of queues to return (default: unlimited)
+
+    Returns:
+        list: List of dictionaries containing queue information with keys:
+              'name', 'url'
+
+    Raises:
+        ValueError: When AWS API call fails
+    """
+    queues = []
+    for queue in iter_sqs_queues(queue_name_prefix):
+        queues.append(queue)
+        if max_results and len(queues) >= max_results:
+            break
+
+    return queues
+
+
+def resolve_queue_url(queue_name, use_cache=True):
+    """Resolve a queue name to its URL.
+
+    Looks the name up in the on-disk queue URL index first and falls back to a single
+    GetQueueUrl call, whose result is stored in the index for
+    ``QUEUE_URL_CACHE_TTL_SECONDS`` (default one day). The index is kept per account and
+    region (see ``aws_clients.get_account_id``).
+
+    Args:
+        queue_name: The name of the queue
+        use_cache: Whether to read and update the on-disk index (default: True)
+
+    Returns:
+        str: The queue URL, or None when the queue does not exist
+
+    Raises:
+        ValueError: When AWS API call fails
+    """
+    return resolve_queue_urls([queue_name], use_cache=use_cache).get(queue_name)
+
+
+def resolve_queue_urls(queue_names, use_cache=True):
+    """Resolve several queue names to their URLs.
+
+    Args:
+        queue_names: Names of the queues
+        use_cache: Whether to read and update the on-disk index (default: True)
+
+    Returns:
+        dict: Mapping of queue name to URL; names of queues that do not exist are omitted
+
+    Raises:
+        ValueError: When AWS API call fails
+    """
+    sqs_client = create_sqs_connection()
+    now = time.time()
+
+    index = load_json_cache(QUEUE_URL_CACHE_FILE) if use_cache else {}
+    # Queue names are only unique within an account and region
+    scope = f"{get_account_id()}:{sqs_client.meta.region_name}" if use_cache else ""
+    scope_index = index.setdefault(scope, {})
+
+    urls = {}
+    missing = []
+    for queue_name in queue_names:
+        entry = scope_index.get(queue_name)
+        if entry and now - entry["fetched_at"] < QUEUE_URL_CACHE_TTL_SECONDS:
+            urls[queue_name] = entry["url"]
+        elif queue_name not in missing:
+            missing.append(queue_name)
+
+    for queue_name in missing:
+        try:
+            response = sqs_client.get_queue_url(QueueName=queue_name)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in QUEUE_NOT_FOUND_ERROR_CODES:
+                scope_index.pop(queue_name, None)
+                continue
+            raise ValueError(f"Failed to resolve queue URL for '{queue_name}': {e}") from e
+
+        urls[queue_name] = response["QueueUrl"]
+        scope_index[queue_name] = {"url": response["QueueUrl"], "fetched_at": now}
+
+    if use_cache and missing:
+        save_json_cache(QUEUE_URL_CACHE_FILE, index)
+
+    return urls
+
+
+def friendly_queue_attributes(attributes):
+    """Map raw GetQueueAttributes values to the friendly names shown by ``get_queue_attributes``."""
+    return {
+        "Created": attributes.get("CreatedTimestamp", "N/A"),
+        "Messages Available": attributes.get("ApproximateNumberOfMessages", "N/A"),
+        "Messages In Flight": attributes.get("ApproximateNumberOfMessagesNotVisible", "N/A"),
+        "Messages Delayed": attributes.get("ApproximateNumberOfMessagesDelayed", "N/A"),
+        "Message Retention Period (days)": str(int(attributes.get("MessageRetentionPeriod", 0)) / 86400),
+        "Maximum Message Size (KB)": str(int(attributes.get("MaximumMessageSize", 0)) / 1024),
+        "Visibility Timeout (seconds)": attributes.get("VisibilityTimeout", "N/A"),
+        "Receive Message Wait Time (seconds)": attributes.get("ReceiveMessageWaitTimeSeconds", "N/A"),
+        "Dead Letter Target": attributes.get("RedrivePolicy", "None"),
+        "KMS Master Key": attributes.get("KmsMasterKeyId", "None"),
+        "KMS Data Key Reuse Period": attributes.get("KmsDataKeyReusePeriod", "N/A"),
+        "Content Based Deduplication": attributes.get("ContentBasedDeduplication", "False"),
+        "Deduplication Scope": attributes.get("DeduplicationScope", "N/A"),
+        "FIFO Queue": attributes.get("FifoQueue", "False"),
+        "Policy": attributes.get("Policy", "None"),
+    }
+
+
 def get_queue_attributes(queue_url):
     """Get all attributes of a specific queue.
 
     Args:
-        sqs_client: boto3 SQS client object
         queue_url: The URL of the queue to get attributes for
 
     Returns:
@@ -122,39 +234,131 @@ def get_queue_attributes(queue_url):
         sqs_client = create_sqs_connection()
         response = sqs_client.get_queue_attributes(QueueUrl=queue_url, AttributeNames=["All"])
 
-        attributes = response.get("Attributes", {})
-
-        friendly_attributes = {
-            "Created": attributes.get("CreatedTimestamp", "N/A"),
-            "Messages Available": attributes.get("ApproximateNumberOfMessages", "N/A"),
-            "Messages In Flight": attributes.get("ApproximateNumberOfMessagesNotVisible", "N/A"),
-            "Messages Delayed": attributes.get("ApproximateNumberOfMessagesDelayed", "N/A"),
-            "Message Retention Period (days)": str(int(attributes.get("MessageRetentionPeriod", 0)) / 86400),
-            "Maximum Message Size (KB)": str(int(attributes.get("MaximumMessageSize", 0)) / 1024),
-            "Visibility Timeout (seconds)": attributes.get("VisibilityTimeout", "N/A"),
-            "Receive Message Wait Time (seconds)": attributes.get("ReceiveMessageWaitTimeSeconds", "N/A"),
-            "Dead Letter Target": attributes.get("RedrivePolicy", "None"),
-            "KMS Master Key": attributes.get("KmsMasterKeyId", "None"),
-            "KMS Data Key Reuse Period": attributes.get("KmsDataKeyReusePeriod", "N/A"),
-            "Content Based Deduplication": attributes.get("ContentBasedDeduplication", "False"),
-            "Deduplication Scope": attributes.get("DeduplicationScope", "N/A"),
-            "FIFO Queue": attributes.get("FifoQueue", "False"),
-            "Policy": attributes.get("Policy", "None"),
-        }
-
-        return friendly_attributes
+        return friendly_queue_attributes(response.get("Attributes", {}))
 
     except ClientError as e:
         raise ValueError(f"Failed to get queue attributes: {e}") from e
 
 
-def get_queue_oldest_message(queue_url, days=7):
+def queue_counts(attributes):
+    """Extract the 'available', 'in_flight' and 'delayed' counts from raw queue attributes."""
+    return {name: int(attributes.get(attribute, 0)) for name, attribute in QUEUE_COUNT_ATTRIBUTES.items()}
+
+
+def get_queue_counts(queue_url):
+    """Get only the approximate message counts of a queue.
+
+    Unlike ``get_queue_attributes`` this requests just the three count attributes, which
+    keeps the response small enough to poll frequently.
+
+    Args:
+        queue_url: The URL of the queue
+
+    Returns:
+        dict: Counts with keys 'available', 'in_flight' and 'delayed' (int)
+
+    Raises:
+        ValueError: When AWS API call fails
+    """
+    try:
+        sqs_client = create_sqs_connection()
+        response = sqs_client.get_queue_attributes(
+            QueueUrl=queue_url, AttributeNames=list(QUEUE_COUNT_ATTRIBUTES.values())
+        )
+    except ClientError as e:
+        raise ValueError(f"Failed to get queue counts: {e}") from e
+
+    return queue_counts(response.get("Attributes", {}))
+
+
+def watch_queue_counts(queue_urls, interval=5, max_interval=60, max_workers=8, iterations=None):
+    """Poll the message counts of several queues with an adaptive interval.
+
+    Due queues are polled concurrently through the shared client. A queue whose counts
+    did not change since its previous poll waits twice as long before the next one (up to
+    ``max_interval``); any change brings it back to ``interval``. The generator sleeps
+    until the next queue is due.
+
+    Args:
+        queue_urls: URLs of the queues to watch
+        interval: Minimum seconds between polls of a queue (default: 5)
+        max_interval: Maximum seconds between polls of a quiet queue (default: 60)
+        max_workers: Number of queues polled at the same time (default: 8)
+        iterations: Number of snapshots to yield (default: unlimited)
+
+    Yields:
+        list: One dict per queue, in input order, with keys 'url', 'available',
+              'in_flight', 'delayed', 'delta' (change of 'available' since the previous
+              poll), 'rate' (messages per minute over that poll), 'next_poll_in'
+              (seconds) and 'error' (None when the last poll succeeded)
+    """
+    queue_urls = list(queue_urls)
+    states = {
+        queue_url: {
+            "url": queue_url,
+            "available": None,
+            "in_flight": None,
+            "delayed": None,
+            "delta": None,
+            "rate": None,
+            "polled_at": None,
+            "error": None,
+            "interval": interval,
+            "next_poll": 0.0,
+        }
+        for queue_url in queue_urls
+    }
+
+    count = 0
+    while queue_urls and (iterations is None or count < iterations):
+        now = time.monotonic()
+        due = [queue_url for queue_url in queue_urls if states[queue_url]["next_poll"] <= now]
+
+        for queue_url, counts, error in bounded_map(get_queue_counts, due, max_workers=max_workers):
+            state = states[queue_url]
+            polled_at = time.monotonic()
+
+            if error:
+                state["error"] = str(error)
+                state["interval"] = interval
+            else:
+                changed = any(state[name] != counts[name] for name in QUEUE_COUNT_ATTRIBUTES)
+                if state["polled_at"] is not None:
+                    state["delta"] = counts["available"] - state["available"]
+                    state["rate"] = state["delta"] * 60 / max(polled_at - state["polled_at"], 1e-6)
+                state.update(counts, polled_at=polled_at, error=None)
+                state["interval"] = interval if changed else min(state["interval"] * 2, max_interval)
+
+            state["next_poll"] = polled_at + state["interval"]
+
+        now = time.monotonic()
+        yield [
+            {
+                **{
+                    key: value
+                    for key, value in states[queue_url].items()
+                    if key not in ("interval", "next_poll", "polled_at")
+                },
+                "next_poll_in": max(0.0, states[queue_url]["next_poll"] - now),
+            }
+            for queue_url in queue_urls
+        ]
+
+        count += 1
+        if iterations is None or count < iterations:
+            time.sleep(max(0.0, min(state["next_poll"] for state in states.values()) - time.monotonic()))
+
+
+def get_queue_oldest_message(queue_url, days=7, period=None):
     """Get approximate age of oldest message in the queue over time.
 
     Args:
-        sqs_client: boto3 SQS client object
         queue_url: The URL of the queue to get metrics for
         days: Number of days to look back (default: 7)
+        period: Metric period in seconds (default: one hour, or the finest period CloudWatch
+                still keeps for older windows, see ``choose_period``). The Maximum statistic
+                keeps short age spikes visible in hourly buckets, and ``hourly_data`` stays
+                hourly unless a finer period is requested
 
     Returns:
         dict: Dictionary containing age metrics with values in seconds
@@ -162,153 +366,251 @@ def get_queue_oldest_message(queue_url, days=7):
     Raises:
         ValueError: When AWS API call fails
     """
-    try:
-        cloudwatch = boto3.client("cloudwatch")
-
-        queue_name = queue_url.split("/")[-1]
-
-        response = cloudwatch.get_metric_statistics(
-            Namespace="AWS/SQS",
-            MetricName="ApproximateAgeOfOldestMessage",
-            Dimensions=[{"Name": "QueueName", "Value": queue_name}],
-            StartTime=datetime.datetime.utcnow() - datetime.timedelta(days=days),
-            EndTime=datetime.datetime.utcnow(),
-            Period=ONE_HOUR_IN_SECONDS,
-            Statistics=["Maximum"],
+    queue_name = queue_url.split("/")[-1]
+    end_time = datetime.datetime.utcnow()
+    start_time = end_time - datetime.timedelta(days=days)
+    period = period or choose_period(start_time, end_time, min_period=ONE_HOUR_IN_SECONDS)
+
+    datapoints = get_metric_data(
+        [metric_query("AWS/SQS", "ApproximateAgeOfOldestMessage", {"QueueName": queue_name}, "Maximum", period)],
+        start_time,
+        end_time,
+    )[0]
+
+    def format_age(seconds):
+        days = seconds // 86400
+        hours = (seconds % 86400) // 3600
+        minutes = (seconds % 3600) // 60
+        if days > 0:
+            return f"{int(days)}d {int(hours)}h {int(minutes)}m"
+        elif hours > 0:
+            return f"{int(hours)}h {int(minutes)}m"
+        else:
+            return f"{int(minutes)}m"
+
+    metrics = {
+        "queue_name": queue_name,
+        "metric": "ApproximateAgeOfOldestMessage",
+        "period": f"last_{days}_days",
+        "period_seconds": period,
+        "current_max_age": format_age(datapoints[-1]["value"]) if datapoints else "0m",
+        "period_max_age": format_age(max((p["value"] for p in datapoints), default=0)),
+        "hourly_data": [
+            {
+                "timestamp": point["timestamp"].strftime("%Y-%m-%d %H:%M UTC"),
+                "age": format_age(point["value"]),
+                "value": int(point["value"]),
+            }
+            for point in datapoints
+        ],
+    }
+
+    return metrics
+
+
+def _daily_volume_matrix(series):
+    """Align the daily datapoints of many queues on the same consecutive days."""
+    days = sorted({point["timestamp"].date() for datapoints in series for point in datapoints})
+    if days:
+        days = [days[0] + datetime.timedelta(days=offset) for offset in range((days[-1] - days[0]).days + 1)]
+    columns = {day: index for index, day in enumerate(days)}
+
+    matrix = []
+    for datapoints in series:
+        row = [None] * len(days)
+        for point in datapoints:
+            row[columns[point["timestamp"].date()]] = int(point["value"])
+        matrix.append(row)
+
+    return [day.strftime("%Y-%m-%d") for day in days], matrix
+
+
+def _percent_above(value, reference, has_data):
+    if reference > 0:
+        return (value - reference) / reference * 100
+    return 100 if has_data else 0
+
+
+def _build_volume_analysis(dates, row, statistics):
+    daily_data = [
+        {"date": date, "value": value, "zscore": zscore}
+        for date, value, zscore in zip(dates, row, statistics["zscores"])
+        if value is not None
+    ]
+    has_data = bool(daily_data)
+
+    max_index = statistics["max_index"]
+    second_max_index = statistics["second_max_index"]
+    max_volume = row[max_index] if has_data else 0
+    second_max_volume = row[second_max_index] if second_max_index is not None else 0
+    mean_volume = statistics["mean"]
+    median_volume = statistics["median"]
+
+    return {
+        "daily_data": daily_data,
+        "max_volume_day": dates[max_index] if has_data else None,
+        "max_volume": max_volume,
+        "second_max_day": dates[second_max_index] if second_max_index is not None else None,
+        "second_max_volume": second_max_volume,
+        "volume_difference": max_volume - second_max_volume,
+        "volume_increase_percent": _percent_above(max_volume, second_max_volume, has_data),
+        "mean_volume": mean_volume,
+        "mean_difference": max_volume - mean_volume,
+        "mean_increase_percent": _percent_above(max_volume, mean_volume, has_data),
+        "median_volume": median_volume,
+        "median_difference": max_volume - median_volume,
+        "median_increase_percent": _percent_above(max_volume, median_volume, has_data),
+        "std_volume": statistics["std"],
+        "percentiles": statistics["percentiles"],
+        "peak_zscore": statistics["zscores"][max_index] if has_data else None,
+        "last_week_volume": statistics["last_season_total"],
+        "previous_week_volume": statistics["previous_season_total"],
+        "week_over_week_percent": statistics["season_change_percent"],
+    }
+
+
+def analyze_queues_volume(queue_urls, days=15):
+    """Analyze message volume trends for many queues with batched GetMetricData calls.
+
+    All queues are fetched together, so analyzing hundreds of queues takes a handful of
+    round trips instead of one request per queue. The daily volumes are aligned into one
+    queue×day matrix whose statistics are computed in a single pass (vectorized when the
+    optional NumPy dependency is installed).
+
+    Args:
+        queue_urls: URLs of the queues to analyze
+        days: Number of days to look back (default: 15)
+
+    Returns:
+        dict: Mapping of queue URL to the volume analysis returned by ``analyze_queue_volume``
+
+    Raises:
+        ValueError: When AWS API call fails
+    """
+    queue_urls = list(dict.fromkeys(queue_urls))
+    queries = [
+        metric_query(
+            "AWS/SQS",
+            "NumberOfMessagesReceived",
+            {"QueueName": queue_url.split("/")[-1]},
+            "Sum",
+            ONE_DAY_IN_SECONDS,
         )
+        for queue_url in queue_urls
+    ]
 
-        datapoints = response.get("Datapoints", [])
-        datapoints.sort(key=lambda x: x["Timestamp"])
-
-        def format_age(seconds):
-            days = seconds // 86400
-            hours = (seconds % 86400) // 3600
-            minutes = (seconds % 3600) // 60
-            if days > 0:
-                return f"{int(days)}d {int(hours)}h {int(minutes)}m"
-            elif hours > 0:
-                return f"{int(hours)}h {int(minutes)}m"
-            else:
-                return f"{int(minutes)}m"
-
-        metrics = {
-            "queue_name": queue_name,
-            "metric": "ApproximateAgeOfOldestMessage",
-            "period": f"last_{days}_days",
-            "current_max_age": format_age(datapoints[-1]["Maximum"]) if datapoints else "0m",
-            "period_max_age": format_age(max((p["Maximum"] for p in datapoints), default=0)),
-            "hourly_data": [
-                {"timestamp": point["Timestamp"].strftime("%Y-%m-%d %H:%M UTC"), "age": format_age(point["Maximum"])}
-                for point in datapoints
-            ],
-        }
+    end_time = datetime.datetime.utcnow()
+    start_time = end_time - datetime.timedelta(days=days)
 
-        return metrics
+    series = get_metric_data(queries, start_time, end_time)
 
-    except ClientError as e:
-        raise ValueError(f"Failed to get queue age metrics: {e}") from e
+    dates, matrix = _daily_volume_matrix(series)
+    statistics = compute_matrix_statistics(matrix, season_length=DAYS_IN_WEEK)
+
+    return {
+        queue_url: _build_volume_analysis(dates, row, row_statistics)
+        for queue_url, row, row_statistics in zip(queue_urls, matrix, statistics)
+    }
+
+
+def _analyze_batch_volume(queue_urls, days):
+    """Analyze a batch of queues, narrowing a failure down to the queues that cause it.
+
+    A throttled batch, once the client's own retries are exhausted, is retried whole after
+    a backoff with jitter (up to ``BATCH_THROTTLE_RETRIES`` times), since splitting it would
+    only add requests. Any other failed batch, such as one invalid queue, is retried as two
+    halves, recursively, so the error is reported for the affected queues alone.
+
+    Returns:
+        list: (queue_url, analysis, error) tuples in the order of ``queue_urls``
+    """
+    for attempt in itertools.count():
+        try:
+            analyses = analyze_queues_volume(queue_urls, days)
+            break
+        except ValueError as e:
+            throttled = is_throttling_error(e)
+            if throttled and attempt < BATCH_THROTTLE_RETRIES:
+                time.sleep(random.uniform(0, BATCH_THROTTLE_BACKOFF_SECONDS * 2**attempt))
+                continue
+            if throttled or len(queue_urls) == 1:
+                return [(queue_url, None, e) for queue_url in queue_urls]
+            middle = len(queue_urls) // 2
+            return _analyze_batch_volume(queue_urls[:middle], days) + _analyze_batch_volume(queue_urls[middle:], days)
+
+    return [(queue_url, analyses[queue_url], None) for queue_url in queue_urls]
+
+
+def iter_queues_volume(queue_urls, days=15, concurrency=1):
+    """Analyze many queues on a bounded thread pool, yielding results in input order.
+
+    Queues are split into ``concurrency`` batches (each at most one GetMetricData page of
+    queries) that are fetched in parallel. A throttled batch is retried after a backoff; a
+    batch failing otherwise is retried split into smaller batches down to single queues, so
+    errors are yielded only for the queues that still fail on their own.
+
+    Args:
+        queue_urls: URLs of the queues to analyze
+        days: Number of days to look back (default: 15)
+        concurrency: Number of batches fetched at the same time (default: 1)
+
+    Yields:
+        tuple: (queue_url, analysis, error) where analysis is the ``analyze_queue_volume``
+               result, or None together with the exception when the fetch failed
+    """
+    queue_urls = list(queue_urls)
+    if not queue_urls:
+        return
+
+    concurrency = max(1, concurrency)
+    batch_size = min(MAX_QUERIES_PER_REQUEST, math.ceil(len(queue_urls) / concurrency))
+    batches = [queue_urls[i : i + batch_size] for i in range(0, len(queue_urls), batch_size)]
+
+    for batch, results, error in bounded_map(
+        lambda urls: _analyze_batch_volume(urls, days), batches, max_workers=concurrency
+    ):
+        if error is not None:
+            for queue_url in batch:
+                yield queue_url, None, error
+            continue
+        yield from results
 
 
 def analyze_queue_volume(queue_url, days=15):
     """Analyze message volume trends for a queue.
 
     Args:
-        sqs_client: boto3 SQS client object
         queue_url: The URL of the queue to analyze
         days: Number of days to look back (default: 15)
 
     Returns:
         dict: Dictionary containing volume analysis with keys:
-            'daily_data': List of daily volumes
+            'daily_data': List of daily volumes with keys 'date', 'value' and 'zscore'
             'max_volume_day': Day with highest volume
             'max_volume': Highest daily volume
             'second_max_day': Day with second highest volume
             'second_max_volume': Second highest daily volume
             'volume_difference': Difference between max and second max
             'volume_increase_percent': Percentage increase from second to max
+            'mean_volume', 'mean_difference', 'mean_increase_percent': Peak compared to the mean
+            'median_volume', 'median_difference', 'median_increase_percent': Peak compared to the median
+            'std_volume': Standard deviation of the daily volumes
+            'percentiles': Daily volume percentiles with keys 'p50', 'p90', 'p95' and 'p99'
+            'peak_zscore': Number of standard deviations the peak day is above the mean
+            'last_week_volume', 'previous_week_volume': Volumes of the last 7 days and the 7 before
+            'week_over_week_percent': Change from the previous week to the last one
+                                      (None with less than 14 days of data)
 
     Raises:
         ValueError: When AWS API call fails
     """
-    try:
-        cloudwatch = boto3.client("cloudwatch")
-        queue_name = queue_url.split("/")[-1]
-
-        response = cloudwatch.get_metric_statistics(
-            Namespace="AWS/SQS",
-            MetricName="NumberOfMessagesReceived",
-            Dimensions=[{"Name": "QueueName", "Value": queue_name}],
-            StartTime=datetime.datetime.utcnow() - datetime.timedelta(days=days),
-            EndTime=datetime.datetime.utcnow(),
-            Period=ONE_DAY_IN_SECONDS,
-            Statistics=["Sum"],
-        )
-
-        datapoints = response.get("Datapoints", [])
-        datapoints.sort(key=lambda x: x["Timestamp"])
-
-        daily_data = [
-            {"date": point["Timestamp"].strftime("%Y-%m-%d"), "value": int(point["Sum"])} for point in datapoints
-        ]
-
-        if len(daily_data) < 2:
-            return {
-                "daily_data": daily_data,
-                "max_volume_day": daily_data[0]["date"] if daily_data else None,
-                "max_volume": daily_data[0]["value"] if daily_data else 0,
-                "second_max_day": None,
-                "second_max_volume": 0,
-                "volume_difference": daily_data[0]["value"] if daily_data else 0,
-                "volume_increase_percent": 100 if daily_data else 0,
-            }
-
-        volume_sorted = sorted(daily_data, key=lambda x: x["value"], reverse=True)
-        max_day = volume_sorted[0]
-        second_max_day = volume_sorted[1]
-
-        volume_diff = max_day["value"] - second_max_day["value"]
-        volume_percent = (volume_diff / second_max_day["value"] * 100) if second_max_day["value"] > 0 else 100
-
-        all_volumes = [day["value"] for day in daily_data]
-        mean_volume = sum(all_volumes) / len(all_volumes)
-
-        sorted_volumes = sorted(all_volumes)
-        mid = len(sorted_volumes) // 2
-        median_volume = sorted_volumes[mid]
-        if len(sorted_volumes) % 2 == 0:
-            median_volume = (sorted_volumes[mid - 1] + sorted_volumes[mid]) / 2
-
-        mean_diff = max_day["value"] - mean_volume
-        mean_percent = (mean_diff / mean_volume * 100) if mean_volume > 0 else 100
-
-        median_diff = max_day["value"] - median_volume
-        median_percent = (median_diff / median_volume * 100) if median_volume > 0 else 100
-
-        return {
-            "daily_data": daily_data,
-            "max_volume_day": max_day["date"],
-            "max_volume": max_day["value"],
-            "second_max_day": second_max_day["date"],
-            "second_max_volume": second_max_day["value"],
-            "volume_difference": volume_diff,
-            "volume_increase_percent": volume_percent,
-            "mean_volume": mean_volume,
-            "mean_difference": mean_diff,
-            "mean_increase_percent": mean_percent,
-            "median_volume": median_volume,
-            "median_difference": median_diff,
-            "median_increase_percent": median_percent,
-        }
-
-    except ClientError as e:
-        raise ValueError(f"Failed to analyze queue volume: {e}") from e
+    return analyze_queues_volume([queue_url], days)[queue_url]
 
 
 def get_queue_metrics(queue_url, days=7):
     """Get CloudWatch metrics for a specific queue.
 
     Args:
-        sqs_client: boto3 SQS client object
         queue_url: The URL of the queue to get metrics for
         days: Number of days to look back (default: 7)
 
@@ -318,35 +620,23 @@ def get_queue_metrics(queue_url, days=7):
     Raises:
         ValueError: When AWS API call fails
     """
-    try:
-        cloudwatch = boto3.client("cloudwatch")
-
-        queue_name = queue_url.split("/")[-1]
-
-        response = cloudwatch.get_metric_statistics(
-            Namespace="AWS/SQS",
-            MetricName="NumberOfMessagesReceived",
-            Dimensions=[{"Name": "QueueName", "Value": queue_name}],
-            StartTime=datetime.datetime.utcnow() - datetime.timedelta(days=days),
-            EndTime=datetime.datetime.utcnow(),
-            Period=ONE_DAY_IN_SECONDS,
-            Statistics=["Sum"],
-        )
-
-        datapoints = response.get("Datapoints", [])
-        datapoints.sort(key=lambda x: x["Timestamp"])
-
-        metrics = {
-            "queue_name": queue_name,
-            "metric": "NumberOfMessagesReceived",
-            "period": "last_7_days",
-            "total": sum(point["Sum"] for point in datapoints),
-            "daily_data": [
-                {"date": point["Timestamp"].strftime("%Y-%m-%d"), "value": int(point["Sum"])} for point in datapoints
-            ],
-        }
-
-        return metrics
+    queue_name = queue_url.split("/")[-1]
+    end_time = datetime.datetime.utcnow()
+
+    datapoints = get_metric_data(
+        [metric_query("AWS/SQS", "NumberOfMessagesReceived", {"QueueName": queue_name}, "Sum", ONE_DAY_IN_SECONDS)],
+        end_time - datetime.timedelta(days=days),
+        end_time,
+    )[0]
+
+    metrics = {
+        "queue_name": queue_name,
+        "metric": "NumberOfMessagesReceived",
+        "period": "last_7_days",
+        "total": sum(point["value"] for point in datapoints),
+        "daily_data": [
+            {"date": point["timestamp"].strftime("%Y-%m-%d"), "value": int(point["value"])} for point in datapoints
+        ],
+    }
 
-    except ClientError as e:
-        raise ValueError(f"Failed to get queue metrics: {e}") from e
+    return metrics
@@ -0,0 +1,52 @@
+import json
+import os
+import tempfile
+
+DEFAULT_CACHE_DIR = os.path.join("~", ".cache", "aws-vibe-guru")
+
+
+def get_cache_dir():
+    """Return the local cache directory, creating it if needed.
+
+    The location can be overridden with the ``AWS_VIBE_GURU_CACHE_DIR`` environment variable.
+
+    Returns:
+        str: Absolute path of the cache directory
+    """
+    path = os.path.expanduser(os.environ.get("AWS_VIBE_GURU_CACHE_DIR", DEFAULT_CACHE_DIR))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def load_json_cache(name):
+    """Load a JSON cache file, returning an empty dict when it is missing or unreadable.
+
+    Args:
+        name: File name inside the cache directory
+
+    Returns:
+        dict: Cached data
+    """
+    try:
+        with open(os.path.join(get_cache_dir(), name), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_json_cache(name, data):
+    """Atomically write a JSON cache file. Write errors are ignored.
+
+    Args:
+        name: File name inside the cache directory
+        data: JSON-serializable dict
+    """
+    try:
+        cache_dir = get_cache_dir()
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f".{name}.")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, os.path.join(cache_dir, name))
+    except OSError:
+        pass
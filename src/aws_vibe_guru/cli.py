@@ -1,27 +1,30 @@
-import json
+import contextlib
+import itertools
+import re
+import sys
 
 import typer
 from rich.console import Console
 
-from aws_vibe_guru.aws_s3 import (
-    get_object_info,
-    list_bucket_objects,
-    list_buckets,
-    read_folder_contents,
-    read_object_content,
-)
-from aws_vibe_guru.aws_sqs import (
-    analyze_queue_volume,
-    get_queue_attributes,
-    get_queue_metrics,
-    get_queue_oldest_message,
-    list_sqs_queues,
-)
 from aws_vibe_guru.cli_helpers import (
+    OUTPUT_FORMATS,
+    BatchedPrinter,
     Panel,
+    RecordWriter,
     Text,
     create_bar_chart,
     create_daily_breakdown,
+    create_queue_watch_table,
+    create_trace_table,
+    format_size,
+    iter_json_pretty,
+    iter_ndjson_pretty,
+)
+from aws_vibe_guru.defaults import (
+    DEFAULT_DOWNLOAD_WORKERS,
+    DEFAULT_MAX_BUFFER_BYTES,
+    DEFAULT_PART_SIZE,
+    DEFAULT_READ_WORKERS,
 )
 
 app = typer.Typer(
@@ -30,6 +33,127 @@ app = typer.Typer(
     add_completion=True,
 )
 console = Console()
+error_console = Console(stderr=True)
+_state = {"output": "text"}
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    output: str = typer.Option(
+        "text",
+        "--output",
+        "-o",
+        help="Output format: text (default), or json, ndjson and csv records written to stdout as they are produced",
+    ),
+    trace: bool = typer.Option(
+        False, "--trace", help="Print call counts, latency percentiles, retries and bytes per AWS operation on stderr"
+    ),
+    trace_json: str = typer.Option(None, "--trace-json", help="Write every traced AWS call as JSON to this file"),
+) -> None:
+    """A CLI tool for managing AWS resources."""
+    if output not in OUTPUT_FORMATS:
+        raise typer.BadParameter(f"must be one of {', '.join(OUTPUT_FORMATS)}", param_hint="--output")
+    _state["output"] = output
+
+    if trace or trace_json:
+        from aws_vibe_guru.tracing import disable_tracing, enable_tracing
+
+        tracer = enable_tracing()
+
+        def report_trace() -> None:
+            disable_tracing(tracer)
+            _report_trace(tracer, trace, trace_json)
+
+        ctx.call_on_close(report_trace)
+
+
+def _report_trace(tracer, show_table: bool, json_path: str) -> None:
+    if show_table:
+        error_console.print(
+            create_trace_table(tracer.summary(), tracer.elapsed_seconds, max_width=error_console.width)
+        )
+    if json_path:
+        try:
+            tracer.write_json(json_path)
+        except ValueError as e:
+            error_console.print(Text(f"Error: {e}", style="bold red"))
+            return
+        error_console.print(Text(f"Trace written to {json_path}", style="dim"))
+
+
+def _machine_output() -> bool:
+    return _state["output"] != "text"
+
+
+def _exit_with_error(message: str) -> None:
+    """Report an error on stderr and exit with status 1 (machine-readable output modes)."""
+    error_console.print(Text(f"Error: {message}", style="bold red"))
+    raise typer.Exit(1)
+
+
+@contextlib.contextmanager
+def _record_output(fieldnames=None):
+    """Yield a RecordWriter on stdout for the selected --output format; a ValueError exits with status 1."""
+    try:
+        with RecordWriter(sys.stdout, _state["output"], fieldnames) as writer:
+            yield writer
+    except ValueError as e:
+        _exit_with_error(str(e))
+
+
+def _print_error(message: str) -> None:
+    """Print an error, on stderr with exit status 1 when --output selects records."""
+    if _machine_output():
+        _exit_with_error(message)
+    console.print(Text(f"Error: {message}", style="bold red"))
+
+
+def _write_records(records, fieldnames=None) -> None:
+    """Write records to stdout in the selected --output format, as they are produced."""
+    with _record_output(fieldnames) as writer:
+        for record in records:
+            writer.write(record)
+
+
+def _resolve_queue_url_or_fail(queue_name: str) -> str:
+    from aws_vibe_guru.aws_sqs import resolve_queue_url
+
+    queue_url = resolve_queue_url(queue_name)
+    if not queue_url:
+        raise ValueError(f"Queue '{queue_name}' not found")
+    return queue_url
+
+
+def _print_chunks(chunks) -> None:
+    """Write text chunks to the console as they arrive, ending with a newline."""
+    last_chunk = ""
+    try:
+        for chunk in chunks:
+            if chunk:
+                console.out(chunk, end="", highlight=False)
+                last_chunk = chunk
+    finally:
+        if not last_chunk.endswith("\n"):
+            console.out("", highlight=False)
+
+
+def _print_lines(lines) -> None:
+    """Print lines (e.g. a daily breakdown) in batched writes."""
+    with BatchedPrinter(console) as printer:
+        for line in lines:
+            printer.print(line)
+
+
+def _print_chart(graph_lines) -> None:
+    """Print the lines of a bar chart, dimming the axis and label lines."""
+    with BatchedPrinter(console) as printer:
+        for line in graph_lines:
+            printer.print(line, style="dim" if "└" in line or not any(c in "┬┤┴│" for c in line) else None)
+
+
+def _is_json_document(text: str) -> bool:
+    return text.lstrip()[:1] in ("{", "[")
 
 
 @app.command()
@@ -49,15 +173,19 @@ def sqs_list_queues(
         # List queues with full prefix
         aws-vibe-guru sqs-list-queues --name "my-app-queue"
     """
+    from aws_vibe_guru.aws_sqs import iter_sqs_queues
+
+    if _machine_output():
+        _write_records(iter_sqs_queues(queue_name_prefix))
+        return
+
     panel_content = Text(f"Listing queues with prefix: {queue_name_prefix}")
     panel = Panel(panel_content, "AWS SQS Queues")
     console.print(panel)
 
-    queues = list_sqs_queues(queue_name_prefix)
-
-    for queue in queues:
-        queue_text = f"Name: {queue['name']}\nURL: {queue['url']}"
-        console.print(Text(queue_text))
+    with BatchedPrinter(console) as printer:
+        for queue in iter_sqs_queues(queue_name_prefix):
+            printer.print(f"Name: {queue['name']}\nURL: {queue['url']}")
 
 
 @app.command()
@@ -76,16 +204,18 @@ def sqs_get_attributes(
         # Get attributes for FIFO queue
         aws-vibe-guru sqs-get-attributes "my-fifo-queue.fifo"
     """
+    from aws_vibe_guru.aws_sqs import get_queue_attributes, resolve_queue_url
+
+    if _machine_output():
+        with _record_output() as writer:
+            writer.write(get_queue_attributes(_resolve_queue_url_or_fail(queue_name)))
+        return
+
     panel_content = Text(f"Getting attributes for queue: {queue_name}")
     panel = Panel(panel_content, "AWS SQS Queue Attributes")
     console.print(panel)
 
-    queues = list_sqs_queues()
-    queue_url = None
-    for queue in queues:
-        if queue["name"] == queue_name:
-            queue_url = queue["url"]
-            break
+    queue_url = resolve_queue_url(queue_name)
 
     if not queue_url:
         console.print(Text(f"Queue '{queue_name}' not found", style="bold red"))
@@ -118,16 +248,20 @@ def sqs_get_metrics(
         # Get metrics for last 3 days
         aws-vibe-guru sqs-get-metrics "dev-queue" -d 3
     """
+    from aws_vibe_guru.aws_sqs import get_queue_metrics, resolve_queue_url
+
+    if _machine_output():
+        with _record_output() as writer:
+            metrics = get_queue_metrics(_resolve_queue_url_or_fail(queue_name), days)
+            for day in metrics["daily_data"]:
+                writer.write({"queue_name": metrics["queue_name"], **day})
+        return
+
     panel_content = Text(f"Getting metrics for queue: {queue_name} (last {days} days)")
     panel = Panel(panel_content, "AWS SQS Queue Metrics")
     console.print(panel)
 
-    queues = list_sqs_queues()
-    queue_url = None
-    for queue in queues:
-        if queue["name"] == queue_name:
-            queue_url = queue["url"]
-            break
+    queue_url = resolve_queue_url(queue_name)
 
     if not queue_url:
         console.print(Text(f"Queue '{queue_name}' not found", style="bold red"))
@@ -141,24 +275,29 @@ def sqs_get_metrics(
     breakdown_lines = create_daily_breakdown(
         data=metrics["daily_data"], value_key="value", date_key="date", message_suffix="messages"
     )
-    for line in breakdown_lines:
-        console.print(line)
+    _print_lines(breakdown_lines)
 
     console.print(Text("\nMessage Volume Chart:", style="bold"))
 
     graph_lines = create_bar_chart(
-        data=metrics["daily_data"], value_key="value", label_key="date", title="Message Volume Chart"
+        data=metrics["daily_data"],
+        value_key="value",
+        label_key="date",
+        title="Message Volume Chart",
+        max_width=console.width,
     )
 
     console.print()
-    for line in graph_lines:
-        console.print(Text(line, style="dim" if "└" in line or not any(c in "┬┤┴│" for c in line) else None))
+    _print_chart(graph_lines)
 
 
 @app.command()
 def sqs_get_oldest_message(
     queue_name: str = typer.Argument(..., help="The name of the queue to check"),
     days: int = typer.Option(7, "--days", "-d", help="Number of days to look back"),
+    period: int = typer.Option(
+        None, "--period", "-p", help="Metric period in seconds (default: 3600, coarser for windows over 455 days)"
+    ),
 ) -> None:
     """Get the age of the oldest message in a specific SQS queue over time.
 
@@ -175,33 +314,61 @@ def sqs_get_oldest_message(
 
         # Get oldest message age for last 24 hours
         aws-vibe-guru sqs-get-oldest-message "dev-queue" -d 1
+
+        # Get oldest message age for last 24 hours at one-minute resolution
+        aws-vibe-guru sqs-get-oldest-message "prod-queue" -d 1 --period 60
     """
+    from aws_vibe_guru.aws_sqs import get_queue_oldest_message, resolve_queue_url
+
+    if _machine_output():
+        with _record_output() as writer:
+            metrics = get_queue_oldest_message(_resolve_queue_url_or_fail(queue_name), days, period)
+            for point in metrics["hourly_data"]:
+                writer.write(
+                    {"queue_name": metrics["queue_name"], "period_seconds": metrics["period_seconds"], **point}
+                )
+        return
+
     panel_content = Text(f"Getting oldest message age for queue: {queue_name} (last {days} days)")
     panel = Panel(panel_content, "AWS SQS Queue Message Age")
     console.print(panel)
 
-    queues = list_sqs_queues()
-    queue_url = None
-    for queue in queues:
-        if queue["name"] == queue_name:
-            queue_url = queue["url"]
-            break
+    queue_url = resolve_queue_url(queue_name)
 
     if not queue_url:
         console.print(Text(f"Queue '{queue_name}' not found", style="bold red"))
         return
 
-    metrics = get_queue_oldest_message(queue_url, days)
+    metrics = get_queue_oldest_message(queue_url, days, period)
 
     console.print(Text("\nSummary:", style="bold"))
+    console.print(
+        Text(f"Resolution: {metrics['period_seconds']}s ({len(metrics['hourly_data']):,} datapoints)", style="dim")
+    )
     console.print(Text(f"Current oldest message age: {metrics['current_max_age']}", style="bold blue"))
     console.print(Text(f"Maximum age in period: {metrics['period_max_age']}", style="bold blue"))
 
+    console.print(Text("\nOldest Message Age Chart (seconds):", style="bold"))
+    graph_lines = create_bar_chart(
+        data=[{"time": point["timestamp"][5:16], "value": point["value"]} for point in metrics["hourly_data"]],
+        value_key="value",
+        label_key="time",
+        title="Oldest Message Age Chart",
+        date_width=12,
+        max_width=console.width,
+    )
+
+    console.print()
+    _print_chart(graph_lines)
+
 
 @app.command()
 def sqs_analyze_volume(
     queue_names: list[str] = typer.Argument(..., help="Names of the queues to analyze"),
     days: int = typer.Option(15, "--days", "-d", help="Number of days to look back"),
+    concurrency: int = typer.Option(
+        1, "--concurrency", "-c", help="Number of metric requests to run at the same time"
+    ),
 ) -> None:
     """Analyze message volume trends for multiple SQS queues.
 
@@ -221,14 +388,43 @@ def sqs_analyze_volume(
 
         # Analyze multiple queues with different time periods
         aws-vibe-guru sqs-analyze-volume "high-volume-queue" "low-volume-queue" --days 60
+
+        # Fetch metrics for many queues with 8 parallel requests
+        aws-vibe-guru sqs-analyze-volume "queue1" "queue2" "queue3" --concurrency 8
     """
+    from aws_vibe_guru.aws_sqs import iter_queues_volume, resolve_queue_urls
+
+    def analyze(map_queue_url):
+        return iter_queues_volume(
+            [map_queue_url[name] for name in queue_names if name in map_queue_url], days, concurrency
+        )
+
+    if _machine_output():
+        with _record_output() as writer:
+            map_queue_url = resolve_queue_urls(queue_names)
+            results = analyze(map_queue_url)
+            for queue_name in queue_names:
+                if queue_name not in map_queue_url:
+                    error_console.print(Text(f"Queue '{queue_name}' not found", style="bold red"))
+                    continue
+
+                _, analysis, error = next(results)
+                if error:
+                    error_console.print(Text(f"Queue '{queue_name}' failed: {error}", style="bold red"))
+                    continue
+                writer.write({"queue_name": queue_name, **analysis})
+        return
+
     panel_content = Text(f"Analyzing message volume for {len(queue_names)} queues (last {days} days)")
     panel = Panel(panel_content, "AWS SQS Queue Volume Analysis")
     console.print(panel)
 
-    all_queues = list_sqs_queues()
-
-    map_queue_url = {queue["name"]: queue["url"] for queue in all_queues if queue["name"] in queue_names}
+    try:
+        map_queue_url = resolve_queue_urls(queue_names)
+    except ValueError as e:
+        _print_error(str(e))
+        return
+    results = analyze(map_queue_url)
 
     for queue_name in queue_names:
         queue_url = map_queue_url.get(queue_name)
@@ -237,7 +433,11 @@ def sqs_analyze_volume(
             console.print(Text(f"\nQueue '{queue_name}' not found", style="bold red"))
             continue
 
-        analysis = analyze_queue_volume(queue_url, days)
+        _, analysis, error = next(results)
+
+        if error:
+            console.print(Text(f"\nQueue '{queue_name}' failed: {error}", style="bold red"))
+            continue
 
         console.print()
         console.print(Text(f"Queue: {queue_name}", style="bold green"))
@@ -254,17 +454,19 @@ def sqs_analyze_volume(
             message_suffix="messages",
             number_of_days_to_highlight=3,
         )
-        for line in breakdown_lines:
-            console.print(line)
+        _print_lines(breakdown_lines)
 
         console.print(Text("\nMessage Volume Chart:", style="bold"))
         graph_lines = create_bar_chart(
-            data=analysis["daily_data"], value_key="value", label_key="date", title="Message Volume Chart"
+            data=analysis["daily_data"],
+            value_key="value",
+            label_key="date",
+            title="Message Volume Chart",
+            max_width=console.width,
         )
 
         console.print()
-        for line in graph_lines:
-            console.print(Text(line, style="dim" if "└" in line or not any(c in "┬┤┴│" for c in line) else None))
+        _print_chart(graph_lines)
 
         console.print()
         console.print(Text("Volume Analysis:", style="bold"))
@@ -293,6 +495,96 @@ def sqs_analyze_volume(
         console.print(Text(f"  - Difference from Median: +{int(analysis['median_difference']):,} messages"))
         console.print(Text(f"  - Percentage Above Median: {analysis['median_increase_percent']:.1f}%"))
 
+        console.print()
+        console.print(Text("• Distribution:", style="bold blue"))
+        console.print(Text(f"  - Standard Deviation: {int(analysis['std_volume']):,} messages"))
+        percentiles = analysis["percentiles"]
+        console.print(
+            Text("  - Percentiles: " + ", ".join(f"{name} {int(value):,}" for name, value in percentiles.items()))
+        )
+        if analysis["peak_zscore"] is not None:
+            console.print(Text(f"  - Peak Z-Score: {analysis['peak_zscore']:.2f}"))
+
+        if analysis["week_over_week_percent"] is not None:
+            console.print()
+            console.print(Text("• Week over Week:", style="bold blue"))
+            console.print(Text(f"  - Last 7 Days: {analysis['last_week_volume']:,} messages"))
+            console.print(Text(f"  - Previous 7 Days: {analysis['previous_week_volume']:,} messages"))
+            console.print(Text(f"  - Change: {analysis['week_over_week_percent']:+.1f}%"))
+
+
+@app.command()
+def sqs_watch(
+    queue_names: list[str] = typer.Argument(..., help="Names of the queues to watch"),
+    interval: float = typer.Option(5, "--interval", "-n", help="Minimum seconds between polls of a queue"),
+    max_interval: float = typer.Option(
+        60, "--max-interval", help="Maximum seconds between polls of a queue whose counts do not change"
+    ),
+    workers: int = typer.Option(8, "--workers", "-w", help="Number of queues polled in parallel"),
+    iterations: int = typer.Option(None, "--iterations", help="Stop after N refreshes (default: until Ctrl+C)"),
+) -> None:
+    """Watch the message counts of several queues in a live table.
+
+    Only the approximate message counts are requested, through a single shared
+    client. Queues whose counts do not change are polled less and less often (up to
+    --max-interval) and go back to --interval as soon as they change.
+
+    Examples:
+        aws-vibe-guru sqs-watch "orders" "payments" "notifications"
+
+        aws-vibe-guru sqs-watch "orders" "orders-dlq" --interval 2 --max-interval 30
+
+        aws-vibe-guru sqs-watch "orders" --iterations 10
+    """
+    from rich.live import Live
+
+    from aws_vibe_guru.aws_sqs import resolve_queue_urls, watch_queue_counts
+
+    def report_missing(queue_urls, output):
+        for queue_name in queue_names:
+            if queue_name not in queue_urls:
+                output.print(Text(f"Queue '{queue_name}' not found", style="bold red"))
+
+    def watch(queue_urls):
+        return watch_queue_counts(
+            list(dict.fromkeys(queue_urls.values())),
+            interval=interval,
+            max_interval=max_interval,
+            max_workers=workers,
+            iterations=iterations,
+        )
+
+    if _machine_output():
+        try:
+            with _record_output() as writer:
+                queue_urls = resolve_queue_urls(queue_names)
+                report_missing(queue_urls, error_console)
+                names = {url: name for name, url in queue_urls.items()}
+                for queues in watch(queue_urls) if queue_urls else ():
+                    for queue in queues:
+                        writer.write({"queue_name": names[queue["url"]], **queue})
+                    writer.flush()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    try:
+        queue_urls = resolve_queue_urls(queue_names)
+    except ValueError as e:
+        _print_error(str(e))
+        return
+    report_missing(queue_urls, console)
+    if not queue_urls:
+        return
+    snapshots = watch(queue_urls)
+
+    try:
+        with Live(console=console, auto_refresh=False) as live:
+            for queues in snapshots:
+                live.update(create_queue_watch_table(queues), refresh=True)
+    except KeyboardInterrupt:
+        pass
+
 
 @app.command()
 def s3_list_buckets() -> None:
@@ -301,6 +593,14 @@ def s3_list_buckets() -> None:
     Examples:
         aws-vibe-guru s3-list-buckets
     """
+    from aws_vibe_guru.aws_s3 import list_buckets
+
+    if _machine_output():
+        with _record_output() as writer:
+            for bucket in list_buckets():
+                writer.write(bucket)
+        return
+
     panel_content = Text("Listing all S3 buckets")
     panel = Panel(panel_content, "AWS S3 Buckets")
     console.print(panel)
@@ -314,10 +614,9 @@ def s3_list_buckets() -> None:
     console.print(Text(f"\nTotal buckets: {len(buckets)}", style="bold blue"))
     console.print()
 
-    for bucket in buckets:
-        bucket_text = f"Name: {bucket['name']}\nCreated: {bucket['creation_date']}"
-        console.print(Text(bucket_text))
-        console.print()
+    with BatchedPrinter(console) as printer:
+        for bucket in buckets:
+            printer.print(f"Name: {bucket['name']}\nCreated: {bucket['creation_date']}\n")
 
 
 @app.command()
@@ -328,7 +627,16 @@ def s3_list_objects(
         None, "--max", "-m", help="Maximum number of objects to return (default: unlimited)"
     ),
     summary: bool = typer.Option(
-        False, "--summary", "-s", help="Show only summary information (bucket, filter, total)"
+        False, "--summary", "-s", help="Show only summary information (totals, sizes, dates, storage classes)"
+    ),
+    workers: int = typer.Option(
+        1, "--workers", "-w", help="Number of key ranges (or inventory files) listed in parallel"
+    ),
+    inventory: str = typer.Option(
+        None,
+        "--inventory",
+        "-i",
+        help="Read objects from an S3 Inventory manifest.json (local path or s3:// URL) instead of listing the bucket",
     ),
 ) -> None:
     """List all objects in a specific S3 bucket with optional prefix filtering.
@@ -346,38 +654,74 @@ def s3_list_objects(
 
         aws-vibe-guru s3-list-objects "my-bucket" --summary
         aws-vibe-guru s3-list-objects "my-bucket" -s
+
+        aws-vibe-guru s3-list-objects "my-bucket" --summary --workers 16
+
+        aws-vibe-guru s3-list-objects "my-bucket" --inventory "s3://inventory-bucket/my-bucket/daily/2024-01-01T01-00Z/manifest.json"
+        aws-vibe-guru s3-list-objects "my-bucket" -i ./inventory/manifest.json --summary --workers 4
     """
+    from aws_vibe_guru.aws_s3 import format_object_record, iter_bucket_objects, summarize_objects
+
+    if _machine_output():
+        with _record_output() as writer:
+            objects = iter_bucket_objects(bucket_name, prefix, max_results, max_workers=workers, inventory=inventory)
+            if summary:
+                writer.write({"bucket_name": bucket_name, "prefix": prefix or "all", **summarize_objects(objects)})
+            else:
+                for obj in objects:
+                    writer.write(obj)
+        return
+
     prefix_text = f" with prefix: {prefix}" if prefix else ""
     panel_content = Text(f"Listing objects in bucket: {bucket_name}{prefix_text}")
     panel = Panel(panel_content, "AWS S3 Bucket Objects")
     console.print(panel)
 
     try:
-        result = list_bucket_objects(bucket_name, prefix, max_results)
+        objects = iter_bucket_objects(bucket_name, prefix, max_results, max_workers=workers, inventory=inventory)
 
-        console.print(Text(f"\nBucket: {result['bucket_name']}", style="bold green"))
-        console.print(Text(f"Filter: {result['prefix']}", style="bold green"))
-        console.print(Text(f"Total objects: {result['total_objects']:,}", style="bold blue"))
+        console.print(Text(f"\nBucket: {bucket_name}", style="bold green"))
+        console.print(Text(f"Filter: {prefix or 'all'}", style="bold green"))
 
         if summary:
+            result = summarize_objects(objects)
+            console.print(Text(f"Total objects: {result['total_objects']:,}", style="bold blue"))
+
+            if result["total_objects"] == 0:
+                return
+
+            console.print(Text(f"Total size: {format_size(result['total_size'])}", style="bold blue"))
+            console.print(Text(f"Smallest object: {format_size(result['min_size'])}"))
+            console.print(Text(f"Largest object: {format_size(result['max_size'])}"))
+            console.print(Text(f"Mean object size: {format_size(int(result['mean_size']))}"))
+            console.print(Text(f"Oldest modification: {result['oldest_modified']}"))
+            console.print(Text(f"Newest modification: {result['newest_modified']}"))
+
+            console.print(Text("\nStorage classes:", style="bold"))
+            for storage_class, totals in result["storage_classes"].items():
+                console.print(Text(f"  {storage_class}: {totals['count']:,} objects, {format_size(totals['size'])}"))
             return
 
-        if result["total_objects"] == 0:
+        total_objects = 0
+        with BatchedPrinter(console) as printer:
+            for obj in objects:
+                if total_objects == 0:
+                    printer.print("\nObjects:\n", style="bold")
+                total_objects += 1
+
+                obj = format_object_record(obj)
+                printer.print(
+                    f"Key: {obj['key']}\n"
+                    f"Size: {obj['size']:,} bytes ({obj['size_mb']} MB)\n"
+                    f"Last Modified: {obj['last_modified']}\n"
+                    f"Storage Class: {obj['storage_class']}\n"
+                )
+
+        if total_objects == 0:
             console.print(Text("\nNo objects found", style="bold yellow"))
             return
 
-        console.print(Text("\nObjects:", style="bold"))
-        console.print()
-
-        for obj in result["objects"]:
-            obj_text = (
-                f"Key: {obj['key']}\n"
-                f"Size: {obj['size']:,} bytes ({obj['size_mb']} MB)\n"
-                f"Last Modified: {obj['last_modified']}\n"
-                f"Storage Class: {obj['storage_class']}"
-            )
-            console.print(Text(obj_text))
-            console.print()
+        console.print(Text(f"Total objects: {total_objects:,}", style="bold blue"))
 
     except ValueError as e:
         console.print(Text(f"Error: {str(e)}", style="bold red"))
@@ -397,6 +741,13 @@ def s3_get_object(
 
         aws-vibe-guru s3-get-object "data-bucket" "data/users/export.csv"
     """
+    from aws_vibe_guru.aws_s3 import get_object_info
+
+    if _machine_output():
+        with _record_output() as writer:
+            writer.write(get_object_info(bucket_name, object_key))
+        return
+
     panel_content = Text(f"Getting object info: {object_key} from bucket: {bucket_name}")
     panel = Panel(panel_content, "AWS S3 Object Information")
     console.print(panel)
@@ -435,9 +786,21 @@ def s3_read_object(
     prefix: str = typer.Option(None, "--prefix", "-p", help="Search for objects by prefix"),
     encoding: str = typer.Option("utf-8", "--encoding", "-e", help="Text encoding to use"),
     format_json: bool = typer.Option(False, "--json", "-j", help="Format JSON content with 2-space indentation"),
+    ndjson: bool = typer.Option(False, "--ndjson", "-n", help="Format newline-delimited JSON one record at a time"),
+    max_records: int = typer.Option(
+        None, "--max-records", help="Stop after N records (top-level array elements or NDJSON lines)"
+    ),
+    byte_range: str = typer.Option(
+        None, "--range", "-r", help="Byte range to read: START-END, START- or -LAST_N_BYTES"
+    ),
+    head: int = typer.Option(None, "--head", help="Read only the first N bytes"),
+    tail: int = typer.Option(None, "--tail", help="Read only the last N bytes"),
 ) -> None:
     """Read and display the content of a file from S3 bucket.
 
+    Content is streamed in chunks, and --range, --head and --tail fetch only the
+    requested bytes. --json and --ndjson format the content as it arrives.
+
     Examples:
         aws-vibe-guru s3-read-object "my-bucket" "file.txt"
 
@@ -448,9 +811,46 @@ def s3_read_object(
         aws-vibe-guru s3-read-object "my-bucket" "file.txt" --encoding "latin-1"
 
         aws-vibe-guru s3-read-object "my-bucket" "data.json" --json
+
+        aws-vibe-guru s3-read-object "my-bucket" "export.json" --json --max-records 10
+
+        aws-vibe-guru s3-read-object "my-bucket" "events.ndjson" --ndjson --max-records 100
+
+        aws-vibe-guru s3-read-object "my-bucket" "logs/huge.log" --head 4096
+
+        aws-vibe-guru s3-read-object "my-bucket" "logs/huge.log" --tail 4096
+
+        aws-vibe-guru s3-read-object "my-bucket" "logs/huge.log" --range 1048576-2097151
     """
+    from aws_vibe_guru.aws_s3 import list_bucket_objects, parse_byte_range, read_object_stream
+
     if not object_key and not prefix:
-        console.print(Text("Error: Either object_key or --prefix must be provided", style="bold red"))
+        _print_error("Either object_key or --prefix must be provided")
+        return
+
+    if sum(option is not None for option in (byte_range, head, tail)) > 1:
+        _print_error("Use only one of --range, --head or --tail")
+        return
+
+    try:
+        if byte_range:
+            byte_range = parse_byte_range(byte_range)
+        elif head:
+            byte_range = parse_byte_range(f"0-{head - 1}")
+        elif tail:
+            byte_range = parse_byte_range(f"-{tail}")
+    except ValueError as e:
+        _print_error(str(e))
+        return
+
+    if _machine_output():
+        with _record_output() as writer:
+            if not object_key:
+                raise ValueError("object_key is required with --output json, ndjson or csv")
+            result = read_object_stream(bucket_name, object_key, encoding, byte_range)
+            chunks = result.pop("chunks")
+            result["content"] = "".join(chunks) if chunks is not None else None
+            writer.write(result)
         return
 
     if prefix and not object_key:
@@ -489,12 +889,14 @@ def s3_read_object(
     console.print(panel)
 
     try:
-        result = read_object_content(bucket_name, object_key, encoding)
+        result = read_object_stream(bucket_name, object_key, encoding, byte_range)
 
         console.print()
         console.print(Text(f"Bucket: {result['bucket']}", style="bold blue"))
         console.print(Text(f"Key: {result['key']}", style="bold blue"))
-        console.print(Text(f"Size: {result['size']:,} bytes", style="bold blue"))
+        console.print(Text(f"Size: {result['total_size']:,} bytes", style="bold blue"))
+        if result["content_range"]:
+            console.print(Text(f"Range: {result['content_range']}", style="bold blue"))
         console.print(Text(f"Content Type: {result['content_type']}"))
         console.print(Text("─" * 80, style="dim"))
         console.print()
@@ -503,24 +905,224 @@ def s3_read_object(
             console.print(
                 Text("⚠️  This file appears to be binary and cannot be displayed as text.", style="bold yellow")
             )
-            console.print(Text(f"File size: {result['size']:,} bytes", style="dim"))
-        else:
-            content_to_display = result["content"]
-
-            if format_json:
-                try:
-                    json_data = json.loads(content_to_display)
-                    content_to_display = json.dumps(json_data, indent=2, ensure_ascii=False)
-                except json.JSONDecodeError:
-                    console.print(
-                        Text(
-                            "⚠️  Warning: --json flag was used but content is not valid JSON. Displaying as-is.",
-                            style="bold yellow",
-                        )
+            console.print(Text(f"File size: {result['total_size']:,} bytes", style="dim"))
+        elif ndjson:
+            _print_chunks(iter_ndjson_pretty(result["chunks"], max_records=max_records))
+        elif format_json:
+            chunks = iter(result["chunks"])
+            first_chunk = next((chunk for chunk in chunks if chunk.strip()), "")
+            chunks = itertools.chain([first_chunk], chunks)
+
+            if _is_json_document(first_chunk):
+                _print_chunks(iter_json_pretty(chunks, max_records=max_records))
+            else:
+                console.print(
+                    Text(
+                        "⚠️  Warning: --json flag was used but content is not valid JSON. Displaying as-is.",
+                        style="bold yellow",
                     )
-                    console.print()
+                )
+                console.print()
+                _print_chunks(chunks)
+        else:
+            _print_chunks(result["chunks"])
+
+    except ValueError as e:
+        console.print(Text(f"Error: {str(e)}", style="bold red"))
+
+
+@app.command()
+def s3_grep(
+    bucket_name: str = typer.Argument(..., help="The name of the bucket"),
+    prefix: str = typer.Argument(..., help="The folder prefix/path to search"),
+    pattern: str = typer.Argument(..., help="Regular expression to search for"),
+    ignore_case: bool = typer.Option(False, "--ignore-case", "-i", help="Match case-insensitively"),
+    fixed_strings: bool = typer.Option(False, "--fixed-strings", "-F", help="Treat the pattern as a literal string"),
+    files_with_matches: bool = typer.Option(
+        False, "--files-with-matches", "-l", help="Only list matching keys, stopping each download at its first match"
+    ),
+    encoding: str = typer.Option("utf-8", "--encoding", "-e", help="Text encoding to use"),
+    max_files: int = typer.Option(None, "--max", "-m", help="Maximum number of files to search (default: unlimited)"),
+    workers: int = typer.Option(DEFAULT_READ_WORKERS, "--workers", "-w", help="Number of files searched in parallel"),
+) -> None:
+    """Search the content of all files under a prefix for a pattern.
+
+    Files are streamed through the matcher in parallel and matches are printed as soon as
+    they are found; binary files are skipped.
+
+    Examples:
+        aws-vibe-guru s3-grep "my-bucket" "logs/2024/" "ERROR"
+
+        aws-vibe-guru s3-grep "my-bucket" "logs/" "timeout|refused" --ignore-case
+
+        aws-vibe-guru s3-grep "my-bucket" "config/" "db.example.com" --fixed-strings -l
+
+        aws-vibe-guru s3-grep "my-bucket" "events/" "order-[0-9]+ failed" --workers 32
+    """
+    from aws_vibe_guru.aws_s3 import iter_object_matches
+
+    search_pattern = re.escape(pattern) if fixed_strings else pattern
+    try:
+        highlight = re.compile(search_pattern, re.IGNORECASE if ignore_case else 0)
+    except re.error as e:
+        _print_error(f"Invalid pattern '{pattern}': {e}")
+        return
+
+    if _machine_output():
+        with _record_output(["key", "line_number", "line"]) as writer:
+            for file_data in iter_object_matches(
+                bucket_name,
+                prefix,
+                search_pattern,
+                encoding,
+                ignore_case=ignore_case,
+                first_match_only=files_with_matches,
+                max_files=max_files,
+                max_workers=workers,
+            ):
+                if "error" in file_data:
+                    error_console.print(Text(f"{file_data['key']}: {file_data['error']}", style="red"))
+                elif files_with_matches and file_data["matches"]:
+                    writer.write({"key": file_data["key"]})
+                elif not files_with_matches:
+                    for match in file_data["matches"]:
+                        writer.write({"key": file_data["key"], **match})
+        return
+
+    panel_content = Text(f"Searching '{pattern}' in bucket: {bucket_name} with prefix: {prefix}")
+    panel = Panel(panel_content, "AWS S3 Content Search")
+    console.print(panel)
+    console.print()
+
+    try:
+        results = iter_object_matches(
+            bucket_name,
+            prefix,
+            search_pattern,
+            encoding,
+            ignore_case=ignore_case,
+            first_match_only=files_with_matches,
+            max_files=max_files,
+            max_workers=workers,
+        )
+
+        total_files = 0
+        matched_keys = set()
+        binary_files = 0
+        current_key = None
+        for file_data in results:
+            if file_data["complete"]:
+                total_files += 1
+                binary_files += file_data["is_binary"]
+            if "error" in file_data:
+                console.print(Text(f"{file_data['key']}: {file_data['error']}", style="red"))
+                current_key = None
+                continue
+            if not file_data["matches"]:
+                continue
+
+            matched_keys.add(file_data["key"])
+            # Matches of files searched in parallel arrive interleaved: repeat the key
+            # whenever the file changes.
+            if file_data["key"] != current_key:
+                console.print(Text(file_data["key"], style="bold cyan"))
+                current_key = file_data["key"]
+            if files_with_matches:
+                continue
+
+            for match in file_data["matches"]:
+                line = Text(f"  {match['line_number']}: ", style="dim")
+                content = Text(match["line"], style="")
+                content.highlight_regex(highlight, "bold red")
+                console.print(line + content)
+
+        console.print()
+        console.print(Text(f"Matched files: {len(matched_keys):,} of {total_files:,} searched", style="bold blue"))
+        if binary_files:
+            console.print(Text(f"Binary files skipped: {binary_files:,}", style="dim"))
+
+    except ValueError as e:
+        console.print(Text(f"Error: {str(e)}", style="bold red"))
+
+
+@app.command()
+def s3_download(
+    bucket_name: str = typer.Argument(..., help="The name of the bucket"),
+    object_key: str = typer.Argument(..., help="The key (path) of the object to download"),
+    destination: str = typer.Argument(".", help="Local file path or existing directory (default: current directory)"),
+    workers: int = typer.Option(
+        DEFAULT_DOWNLOAD_WORKERS, "--workers", "-w", help="Number of byte ranges downloaded in parallel"
+    ),
+    part_size_mb: int = typer.Option(
+        DEFAULT_PART_SIZE // (1024 * 1024), "--part-size-mb", help="Size of each ranged GET in MB"
+    ),
+    no_resume: bool = typer.Option(
+        False, "--no-resume", help="Start over instead of resuming an interrupted download"
+    ),
+) -> None:
+    """Download an object to a local file with parallel ranged GETs.
+
+    The object is fetched in byte ranges on several connections and written in place
+    into DESTINATION.part; finished parts are checkpointed, so running the same command
+    again resumes an interrupted download. The size (and MD5 when the ETag allows it)
+    is verified before the file is renamed.
+
+    Examples:
+        aws-vibe-guru s3-download "my-bucket" "exports/2024/dump.tar.gz"
+
+        aws-vibe-guru s3-download "my-bucket" "exports/2024/dump.tar.gz" /data/dump.tar.gz
+
+        aws-vibe-guru s3-download "my-bucket" "exports/2024/dump.tar.gz" /data/ --workers 16 --part-size-mb 32
+    """
+    from rich.progress import BarColumn, DownloadColumn, Progress, TimeRemainingColumn, TransferSpeedColumn
+
+    from aws_vibe_guru.aws_s3 import download_object, get_object_info
+
+    if _machine_output():
+        with _record_output() as writer:
+            writer.write(
+                download_object(
+                    bucket_name,
+                    object_key,
+                    destination,
+                    part_size=part_size_mb * 1024 * 1024,
+                    max_workers=workers,
+                    resume=not no_resume,
+                )
+            )
+        return
 
-            console.print(content_to_display)
+    panel_content = Text(f"Downloading object: {object_key} from bucket: {bucket_name}")
+    panel = Panel(panel_content, "AWS S3 Object Download")
+    console.print(panel)
+
+    try:
+        obj_info = get_object_info(bucket_name, object_key)
+        console.print(Text(f"\nSize: {format_size(obj_info['size'])}", style="bold blue"))
+
+        with Progress(
+            "[progress.description]{task.description}",
+            BarColumn(),
+            DownloadColumn(),
+            TransferSpeedColumn(),
+            TimeRemainingColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Downloading", total=obj_info["size"])
+            result = download_object(
+                bucket_name,
+                object_key,
+                destination,
+                part_size=part_size_mb * 1024 * 1024,
+                max_workers=workers,
+                resume=not no_resume,
+                on_progress=lambda size: progress.advance(task, size),
+                object_info=obj_info,
+            )
+
+        console.print(Text(f"Saved to: {result['path']}", style="bold green"))
+        console.print(Text(f"Parts: {result['parts']:,} ({result['resumed_parts']:,} resumed)"))
+        console.print(Text(f"Verified: {'MD5 checksum' if result['verified'] == 'md5' else 'size'}"))
 
     except ValueError as e:
         console.print(Text(f"Error: {str(e)}", style="bold red"))
@@ -533,33 +1135,75 @@ def s3_read_folder(
     encoding: str = typer.Option("utf-8", "--encoding", "-e", help="Text encoding to use"),
     max_files: int = typer.Option(None, "--max", "-m", help="Maximum number of files to read (default: unlimited)"),
     format_json: bool = typer.Option(False, "--json", "-j", help="Format JSON content with 2-space indentation"),
+    ndjson: bool = typer.Option(False, "--ndjson", "-n", help="Format newline-delimited JSON one record at a time"),
+    max_records: int = typer.Option(
+        None, "--max-records", help="Show at most N records per file (top-level array elements or NDJSON lines)"
+    ),
+    workers: int = typer.Option(DEFAULT_READ_WORKERS, "--workers", "-w", help="Number of parallel downloads"),
+    ordered: bool = typer.Option(
+        True, "--ordered/--unordered", help="Print files in key order, or as soon as each one finishes (--unordered)"
+    ),
+    max_buffer_mb: int = typer.Option(
+        DEFAULT_MAX_BUFFER_BYTES // (1024 * 1024),
+        "--max-buffer-mb",
+        help="Maximum MB of downloaded content held in memory",
+    ),
 ) -> None:
     """Read all files from a folder in S3 bucket and display their contents.
 
+    Files are downloaded in parallel and printed in key order; with --unordered each one is
+    printed as soon as it finishes.
+
     Examples:
         aws-vibe-guru s3-read-folder "my-bucket" "logs/2024/"
 
         aws-vibe-guru s3-read-folder "my-bucket" "config/" --json
 
+        aws-vibe-guru s3-read-folder "my-bucket" "events/" --ndjson --max-records 5
+
         aws-vibe-guru s3-read-folder "my-bucket" "data/" --max 50
 
         aws-vibe-guru s3-read-folder "my-bucket" "files/" --encoding "latin-1"
+
+        aws-vibe-guru s3-read-folder "my-bucket" "events/" --workers 32 --unordered
     """
+    from aws_vibe_guru.aws_s3 import iter_folder_contents
+
+    if _machine_output():
+        _write_records(
+            iter_folder_contents(
+                bucket_name,
+                prefix,
+                encoding,
+                max_files,
+                max_workers=workers,
+                ordered=ordered,
+                max_buffer_bytes=max_buffer_mb * 1024 * 1024,
+            ),
+            ["key", "size", "is_binary", "content", "error"],
+        )
+        return
+
     try:
-        result = read_folder_contents(bucket_name, prefix, encoding, max_files)
+        files = iter_folder_contents(
+            bucket_name,
+            prefix,
+            encoding,
+            max_files,
+            max_workers=workers,
+            ordered=ordered,
+            max_buffer_bytes=max_buffer_mb * 1024 * 1024,
+        )
 
         console.print()
         console.print(Text(f"Reading folder: {prefix}", style="bold green"))
-        console.print(Text(f"Bucket: {result['bucket']}", style="bold blue"))
-        console.print(Text(f"Total files: {result['total_files']}", style="bold blue"))
+        console.print(Text(f"Bucket: {bucket_name}", style="bold blue"))
         console.print(Text("=" * 80, style="dim"))
         console.print()
 
-        if result["total_files"] == 0:
-            console.print(Text("No files found in this folder", style="bold yellow"))
-            return
-
-        for file_data in result["files"]:
+        total_files = 0
+        for file_data in files:
+            total_files += 1
             console.print(Text(f"File: {file_data['key']}", style="bold cyan"))
             console.print(Text("-" * 80, style="dim"))
 
@@ -570,17 +1214,27 @@ def s3_read_folder(
             else:
                 content_to_display = file_data["content"]
 
-                if format_json:
+                if ndjson:
+                    content_to_display = "".join(iter_ndjson_pretty([content_to_display], max_records=max_records))
+                elif format_json and _is_json_document(content_to_display):
                     try:
-                        json_data = json.loads(content_to_display)
-                        content_to_display = json.dumps(json_data, indent=2, ensure_ascii=False)
-                    except json.JSONDecodeError:
+                        content_to_display = "".join(iter_json_pretty([content_to_display], max_records=max_records))
+                    except ValueError:
                         pass
+                if ndjson or format_json:
+                    content_to_display = content_to_display.rstrip("\n")
 
                 console.print(content_to_display)
 
             console.print()
 
+        if total_files == 0:
+            console.print(Text("No files found in this folder", style="bold yellow"))
+            return
+
+        console.print(Text("=" * 80, style="dim"))
+        console.print(Text(f"Total files: {total_files}", style="bold blue"))
+
     except ValueError as e:
         console.print(Text(f"Error: {str(e)}", style="bold red"))
 
@@ -1,9 +1,19 @@
+import csv
 import datetime
-from typing import Any, List, Tuple
-
+import itertools
+import json
+import math
+import re
+import time
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from rich.console import Console, Group
 from rich.panel import Panel as RichPanel
 from rich.text import Text as RichText
 
+if TYPE_CHECKING:
+    from rich.table import Table
+
 
 class Text(RichText):
     """A Text class with default styling for CLI output."""
@@ -32,6 +42,498 @@ class Panel(RichPanel):
         )
 
 
+class BatchedPrinter:
+    """Write many lines to a console in a few large writes instead of one print per line.
+
+    Lines are buffered and flushed every ``batch_size`` lines, every ``flush_interval``
+    seconds and when the printer is closed (use it as a context manager). On a terminal
+    each run of lines sharing a style is written with a single ``Console.out`` call,
+    skipping markup, highlighting and wrapping; when the output is not a terminal
+    (redirected to a file or piped) the lines are written to the console's file as plain
+    text. Rich ``Text`` lines keep their base style but not their spans.
+    """
+
+    def __init__(self, console: Console, batch_size: int = 1000, flush_interval: float = 0.25):
+        self.console = console
+        self.plain = not console.is_terminal
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lines: List[Tuple[str, Any]] = []
+        self._last_flush = time.monotonic()
+
+    def print(self, text: Union[str, RichText] = "", style: Any = "bold green") -> None:
+        """Queue one line (it may contain newlines); ``style`` defaults to the ``Text`` style."""
+        if isinstance(text, RichText):
+            text, style = text.plain, text.style
+        self._lines.append((text, style))
+
+        if len(self._lines) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the queued lines."""
+        lines, self._lines = self._lines, []
+        self._last_flush = time.monotonic()
+        if not lines:
+            return
+
+        if self.plain:
+            self.console.file.write("".join(f"{text}\n" for text, _ in lines))
+            self.console.file.flush()
+            return
+
+        for style, run in itertools.groupby(lines, key=lambda line: line[1]):
+            self.console.out("\n".join(text for text, _ in run), style=style or None, highlight=False)
+
+    def __enter__(self) -> "BatchedPrinter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
+
+
+OUTPUT_FORMATS = ("text", "json", "ndjson", "csv")
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return str(value)
+
+
+class RecordWriter:
+    """Stream dictionaries to a text file as JSON, NDJSON or CSV, one record at a time.
+
+    Records are serialized as soon as they are written, so listings of any size use
+    constant memory. ``json`` writes a single array whose elements are emitted one by one;
+    ``csv`` takes its columns from ``fieldnames`` or the first record (later extra keys
+    are dropped) and JSON-encodes nested lists and dicts. Datetimes become ISO 8601
+    strings in every format.
+    """
+
+    def __init__(self, file: TextIO, output_format: str, fieldnames: Optional[List[str]] = None):
+        if output_format not in OUTPUT_FORMATS[1:]:
+            raise ValueError(f"Unsupported output format '{output_format}'")
+
+        self.file = file
+        self.output_format = output_format
+        self.fieldnames = fieldnames
+        self.count = 0
+        self._csv_writer: Optional[Any] = None
+
+    def _csv_value(self, value: Any) -> Any:
+        if isinstance(value, (dict, list, tuple)):
+            return json.dumps(value, default=_json_default)
+        if isinstance(value, (datetime.datetime, datetime.date)):
+            return value.isoformat()
+        return value
+
+    def write(self, record: dict) -> None:
+        """Serialize one record."""
+        if self.output_format == "ndjson":
+            self.file.write(json.dumps(record, default=_json_default) + "\n")
+        elif self.output_format == "json":
+            separator = "[\n" if self.count == 0 else ",\n"
+            self.file.write(separator + json.dumps(record, default=_json_default))
+        else:
+            if self._csv_writer is None:
+                self._csv_writer = csv.DictWriter(
+                    self.file, fieldnames=self.fieldnames or list(record), extrasaction="ignore"
+                )
+                self._csv_writer.writeheader()
+            self._csv_writer.writerow({key: self._csv_value(value) for key, value in record.items()})
+
+        self.count += 1
+
+    def flush(self) -> None:
+        """Flush the underlying file, e.g. after each refresh of a live listing."""
+        self.file.flush()
+
+    def close(self) -> None:
+        """Terminate the JSON array (``[]`` when nothing was written) and flush."""
+        if self.output_format == "json":
+            self.file.write("[]\n" if self.count == 0 else "\n]\n")
+        self.flush()
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def format_size(size: int) -> str:
+    """Format a size in bytes with thousands separators and its MB equivalent.
+
+    Args:
+        size: Size in bytes
+
+    Returns:
+        Formatted size, e.g. "2,456,789 bytes (2.34 MB)"
+    """
+    return f"{size:,} bytes ({size / (1024 * 1024):.2f} MB)"
+
+
+_JSON_TOKEN = re.compile(
+    r'\s*(?:(?P<string>"[^"\\]*(?:\\.[^"\\]*)*")|(?P<open>[{\[])|(?P<close>[}\]])'
+    r'|(?P<comma>,)|(?P<colon>:)|(?P<scalar>[^\s"{}\[\],:]+)|(?P<quote>"))'
+)
+_JSON_SCALAR = re.compile(r"-?(?:0|[1-9]\d*)(?P<fraction>(?:\.\d+)?(?:[eE][+-]?\d+)?)|true|false|null")
+
+# What the next JSON token may be
+_EXPECT_VALUE = "value"
+_EXPECT_KEY = "key"
+_EXPECT_COLON = "colon"
+_EXPECT_NEXT = "',' or a closing bracket"
+
+
+def _dumps_string(token: str) -> str:
+    """Spell an escaped string token the way ``json.dumps(..., ensure_ascii=False)`` does."""
+    try:
+        return json.encoder.encode_basestring(json.decoder.scanstring(token, 1)[0])
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON string {token[:20]!r}: {e}") from e
+
+
+def _dumps_number(token: str) -> str:
+    """Spell a number with a fraction or an exponent (or -0) the way ``json.dumps`` does."""
+    if token == "-0":
+        return "0"
+    value = float(token)
+    # Out of float range (e.g. 1e400): json.dumps would print Infinity, which is not JSON
+    return token if math.isinf(value) else repr(value)
+
+
+class _LineBreaks(dict):
+    def __init__(self, pad: str):
+        super().__init__()
+        self.pad = pad
+
+    def __missing__(self, depth: int) -> str:
+        self[depth] = "\n" + self.pad * depth
+        return self[depth]
+
+
+def iter_json_pretty(chunks: Iterable[str], indent: int = 2, max_records: Optional[int] = None) -> Iterator[str]:
+    """Re-indent JSON text as it arrives, without parsing it into Python objects.
+
+    Tokens are handled one at a time, so memory use is bounded by the chunk size and
+    output starts with the first chunk. Escaped strings and numbers with a fraction or an
+    exponent are re-encoded token by token, so the output is that of
+    ``json.dumps(json.loads(text), indent=indent, ensure_ascii=False)`` (``"\\u00e9"``
+    becomes ``"é"`` and ``1E5`` becomes ``100000.0``), except that repeated keys are all
+    kept. The token sequence is still checked against the JSON grammar (a value, a key, a
+    colon or a comma/closing bracket is expected at each step), so malformed text raises
+    instead of being reformatted. A record is an element of a top-level array, or a
+    top-level value when several are concatenated.
+
+    Args:
+        chunks: Iterable of decoded text chunks
+        indent: Number of spaces per nesting level
+        max_records: Stop after this many records, closing the top-level array (0 prints nothing)
+
+    Returns:
+        Iterator of formatted text pieces
+
+    Raises:
+        ValueError: When the text is not well-formed JSON; the pieces before the error have
+                    already been yielded
+    """
+    if max_records is not None and max_records <= 0:
+        return
+
+    line_breaks = _LineBreaks(" " * indent)
+    stack: List[str] = []
+    expect = _EXPECT_VALUE
+    after_open = False
+    top_level_values = 0
+    records = 0
+    carry = ""
+
+    for chunk in itertools.chain(chunks, [None]):
+        final = chunk is None
+        buffer = carry + (chunk or "")
+        out: List[str] = []
+        append = out.append
+        position = 0
+
+        for match in _JSON_TOKEN.finditer(buffer):
+            kind = match.lastgroup
+            token = match.group(kind)
+
+            if kind == "quote":
+                if final:
+                    raise ValueError("Invalid JSON: unterminated string")
+                break
+            if kind == "scalar" and not final and match.end() == len(buffer):
+                break
+
+            if kind == "comma":
+                if expect != _EXPECT_NEXT:
+                    raise ValueError(f"Invalid JSON: expected {expect}, got ','")
+                expect = _EXPECT_KEY if stack[-1] == "{" else _EXPECT_VALUE
+                append(",")
+                append(line_breaks[len(stack)])
+                position = match.end()
+                continue
+            if kind == "colon":
+                if expect != _EXPECT_COLON:
+                    raise ValueError(f"Invalid JSON: expected {expect}, got ':'")
+                expect = _EXPECT_VALUE
+                append(": ")
+                position = match.end()
+                continue
+            position = match.end()
+
+            if kind == "close":
+                if not stack or stack[-1] != ("{" if token == "}" else "["):
+                    raise ValueError(f"Invalid JSON: unexpected '{token}'")
+                if not after_open and expect != _EXPECT_NEXT:
+                    raise ValueError(f"Invalid JSON: expected {expect}, got '{token}'")
+                stack.pop()
+                append(token if after_open else line_breaks[len(stack)] + token)
+                after_open = False
+            else:
+                if kind == "string" and expect == _EXPECT_KEY:
+                    expect = _EXPECT_COLON
+                elif expect != _EXPECT_VALUE:
+                    raise ValueError(f"Invalid JSON: expected {expect}, got {token[:20]!r}")
+                elif kind == "scalar":
+                    scalar = _JSON_SCALAR.fullmatch(token)
+                    if not scalar:
+                        raise ValueError(f"Invalid JSON value {token[:20]!r}")
+                    if scalar.group("fraction") or token == "-0":
+                        token = _dumps_number(token)
+                if kind == "string" and "\\" in token:
+                    token = _dumps_string(token)
+
+                if after_open:
+                    append(line_breaks[len(stack)])
+                    after_open = False
+                elif not stack and top_level_values:
+                    append("\n")
+
+                append(token)
+                if not stack:
+                    top_level_values += 1
+                if kind == "open":
+                    stack.append(token)
+                    expect = _EXPECT_KEY if token == "{" else _EXPECT_VALUE
+                    after_open = True
+                    continue
+                if expect == _EXPECT_COLON:
+                    continue
+
+            # A value is complete
+            expect = _EXPECT_NEXT if stack else _EXPECT_VALUE
+            if not stack or (len(stack) == 1 and stack[0] == "["):
+                records += 1
+                if max_records is not None and records >= max_records:
+                    if stack:
+                        append("\n]")
+                    append("\n")
+                    yield "".join(out)
+                    return
+
+        carry = buffer[position:]
+        if final:
+            if stack:
+                raise ValueError("Invalid JSON: unexpected end of content")
+            if carry.strip():
+                raise ValueError(f"Invalid JSON near {carry.strip()[:20]!r}")
+            if top_level_values:
+                append("\n")
+        if out:
+            yield "".join(out)
+
+
+def iter_ndjson_pretty(chunks: Iterable[str], indent: int = 2, max_records: Optional[int] = None) -> Iterator[str]:
+    """Format newline-delimited JSON one record at a time.
+
+    Each line is parsed and indented on its own, so only one record is held in memory.
+    Lines that are not valid JSON are passed through unchanged.
+
+    Args:
+        chunks: Iterable of decoded text chunks
+        indent: Number of spaces per nesting level
+        max_records: Stop after this many records (0 prints nothing)
+
+    Returns:
+        Iterator of formatted text pieces
+    """
+    if max_records is not None and max_records <= 0:
+        return
+
+    carry = ""
+    records = 0
+
+    for chunk in itertools.chain(chunks, [None]):
+        if chunk is None:
+            lines = [carry]
+        else:
+            lines = (carry + chunk).split("\n")
+            carry = lines.pop()
+
+        out: List[str] = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                out.append(json.dumps(json.loads(line), indent=indent, ensure_ascii=False))
+            except ValueError:
+                out.append(line)
+            out.append("\n")
+
+            records += 1
+            if max_records is not None and records >= max_records:
+                yield "".join(out)
+                return
+
+        if out:
+            yield "".join(out)
+
+
+def _format_count(value: Optional[int]) -> str:
+    return "-" if value is None else f"{value:,}"
+
+
+def _format_change(value: Optional[float], suffix: str = "") -> RichText:
+    if value is None:
+        return RichText("-", style="dim")
+    style = "red" if value > 0 else "green" if value < 0 else "dim"
+    number = f"{value:+,}" if isinstance(value, int) else f"{value:+,.1f}"
+    return RichText(f"{number}{suffix}", style=style)
+
+
+def create_queue_watch_table(queues: List[dict], title: str = "SQS Queue Watch") -> "Table":
+    """Create a table of queue message counts with their changes since the previous poll.
+
+    Args:
+        queues: List of queue snapshots from ``watch_queue_counts``
+        title: Title for the table
+
+    Returns:
+        Rich Table with one row per queue; a growing backlog is shown in red
+    """
+    from rich.table import Table
+
+    table = Table(title=title, title_style="bold green", border_style="blue")
+    table.add_column("Queue", style="bold cyan")
+    table.add_column("Available", justify="right")
+    table.add_column("Δ", justify="right")
+    table.add_column("Rate", justify="right")
+    table.add_column("In Flight", justify="right")
+    table.add_column("Delayed", justify="right")
+    table.add_column("Next Poll", justify="right", style="dim")
+
+    for queue in queues:
+        name = queue["url"].rsplit("/", 1)[-1]
+        if queue["error"]:
+            table.add_row(
+                name, RichText(queue["error"], style="red"), "", "", "", "", f"{queue['next_poll_in']:.0f}s"
+            )
+            continue
+
+        table.add_row(
+            name,
+            _format_count(queue["available"]),
+            _format_change(queue["delta"]),
+            _format_change(queue["rate"], "/min"),
+            _format_count(queue["in_flight"]),
+            _format_count(queue["delayed"]),
+            f"{queue['next_poll_in']:.0f}s",
+        )
+
+    return table
+
+
+def _format_bytes(value: int) -> str:
+    """Format a byte count compactly (``512 B``, ``4.2 KB``, ``1.5 MB``) for narrow columns."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024 or unit == "GB":
+            return f"{value} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+TRACE_COUNT_COLUMNS = ("Calls", "Err", "Retry", "Thr", "Sent", "Recv")
+TRACE_LATENCY_COLUMNS = ("p50", "p90", "p99", "Max", "Total")
+
+
+def create_trace_table(
+    summary: List[dict],
+    elapsed_seconds: float,
+    title: str = "AWS API Calls (latency in ms)",
+    max_width: Optional[int] = None,
+) -> Union["Table", Group]:
+    """Create a table of traced AWS calls per operation.
+
+    When the table would be wider than ``max_width``, the latency columns move to a
+    second table below the counts, so narrow terminals (80 columns in CI) still show
+    every value instead of truncating them.
+
+    Args:
+        summary: Rows from ``Tracer.summary``
+        elapsed_seconds: Wall time of the traced run, shown in the caption
+        title: Title for the table
+        max_width: Optional maximum width of the output (e.g. the console width)
+
+    Returns:
+        Rich Table with call counts, latency percentiles (ms), retries and bytes per operation,
+        or a Group of a counts table and a latency table
+    """
+    from rich.table import Table
+
+    operations = [f"{row['service']}.{row['operation']}" for row in summary]
+    counts = [
+        (
+            RichText(f"{row['calls']:,}"),
+            RichText(f"{row['errors']:,}", style="red" if row["errors"] else "dim"),
+            RichText(f"{row['retries']:,}", style="yellow" if row["retries"] else "dim"),
+            RichText(f"{row['throttled']:,}", style="red" if row["throttled"] else "dim"),
+            RichText(_format_bytes(row["request_bytes"])),
+            RichText(_format_bytes(row["response_bytes"])),
+        )
+        for row in summary
+    ]
+    latencies = [
+        tuple(RichText(f"{row[key]:,.1f}") for key in ("p50_ms", "p90_ms", "p99_ms", "max_ms"))
+        + (RichText(f"{row['total_ms']:,.0f}"),)
+        for row in summary
+    ]
+
+    def create_table(columns, cells, **kwargs):
+        table = Table(border_style="blue", **kwargs)
+        table.add_column("Operation", style="bold cyan", overflow="fold")
+        for column in columns:
+            table.add_column(column, justify="right", no_wrap=True)
+        for operation, row in zip(operations, cells):
+            table.add_row(operation, *row)
+        return table
+
+    def table_width(columns, cells):
+        # Cell contents plus one border and two padding characters per column
+        names = ("Operation",) + columns
+        values = [(operation,) + tuple(cell.plain for cell in row) for operation, row in zip(operations, cells)]
+        return sum(max(len(value) for value in column) for column in zip(names, *values)) + 3 * len(names) + 1
+
+    api_seconds = sum(row["total_ms"] for row in summary) / 1000
+    caption = f"Wall time {elapsed_seconds:.2f}s, {api_seconds:.2f}s in AWS calls (summed over threads)"
+    title_options = {"title": title, "title_style": "bold green"}
+
+    all_columns = TRACE_COUNT_COLUMNS[:4] + TRACE_LATENCY_COLUMNS + TRACE_COUNT_COLUMNS[4:]
+    all_cells = [count[:4] + latency + count[4:] for count, latency in zip(counts, latencies)]
+    if not max_width or table_width(all_columns, all_cells) <= max_width:
+        return create_table(all_columns, all_cells, caption=caption, **title_options)
+
+    return Group(
+        create_table(TRACE_COUNT_COLUMNS, counts, **title_options),
+        create_table(TRACE_LATENCY_COLUMNS, latencies, caption=caption),
+    )
+
+
 def create_daily_breakdown(
     data: List[dict],
     value_key: str = "value",
@@ -84,6 +586,21 @@ def create_daily_breakdown(
     return breakdown_lines
 
 
+CHART_GLYPHS = ("█", "▓", "▒", "░")
+
+
+def _chart_label(label: Any, label_key: str) -> str:
+    if label_key == "date" and "-" in str(label):
+        date_parts = str(label).split("-")[1:]
+        return f"{date_parts[0]}-{date_parts[1]}"
+    return label
+
+
+def _downsample_max(values: List[float], bounds: List[int]) -> List[float]:
+    """Keep the highest value of each group of points, so peaks survive downsampling."""
+    return [max(values[start:end]) for start, end in zip(bounds, bounds[1:])]
+
+
 def create_bar_chart(
     data: List[dict],
     value_key: str = "value",
@@ -92,9 +609,16 @@ def create_bar_chart(
     height: int = 8,
     date_width: int = 8,
     y_axis_width: int = 10,
+    max_width: Optional[int] = None,
+    value_keys: Optional[List[str]] = None,
 ) -> List[str]:
     """Create an ASCII bar chart from data.
 
+    When the chart would be wider than ``max_width``, bars are drawn one character wide
+    and, if there are still more points than columns, consecutive points are merged
+    keeping their highest value (so spikes stay visible); labels are then shown every
+    ``date_width`` columns.
+
     Args:
         data: List of dictionaries containing the data points
         value_key: Key in the dictionary for the numeric value
@@ -103,6 +627,9 @@ def create_bar_chart(
         height: Height of the chart in characters
         date_width: Width allocated for each data point
         y_axis_width: Width allocated for the y-axis
+        max_width: Optional maximum width of the chart lines (e.g. the terminal width)
+        value_keys: Optional keys of several series drawn side by side, each with its own
+                    glyph and a legend line (replaces ``value_key``)
 
     Returns:
         List of strings representing the chart lines
@@ -110,39 +637,37 @@ def create_bar_chart(
     if not data:
         return []
 
-    max_value = max(item[value_key] for item in data)
+    keys = value_keys or [value_key]
+    series = [[item[key] for item in data] for key in keys]
+    labels = [_chart_label(item[label_key], label_key) for item in data]
+
+    max_value = max(max(values) for values in series)
     if max_value == 0:
         max_value = 1
 
     scale_factor = height / max_value
-    graph_width = len(data) * date_width
-
-    bars = []
-    labels = []
-    for item in data:
-        label = item[label_key]
-        if label_key == "date" and "-" in str(label):
-            date_parts = str(label).split("-")[1:]
-            label = f"{date_parts[0]}-{date_parts[1]}"
-        labels.append(label)
-
-        bar_height = int(item[value_key] * scale_factor)
-        if item[value_key] > 0 and bar_height == 0:
-            bar_height = 1
-
-        bar = []
-        for h in range(height):
-            if h >= (height - bar_height):
-                bar.append("█")
-            else:
-                bar.append(" ")
-        bars.append(bar)
 
     # Calculate required y-axis width based on the largest formatted number
     max_formatted_value = f"{int(max_value):,}"
     y_axis_required_width = len(max_formatted_value) + 3  # +3 for " ┬", " ┴", " ┤"
     actual_y_axis_width = max(y_axis_width, y_axis_required_width)
 
+    slot_width = max(date_width, len(keys) + 3)
+    compact = bool(max_width) and len(data) * slot_width > max_width - actual_y_axis_width
+    if compact:
+        slot_width = len(keys)
+        columns = max(1, (max_width - actual_y_axis_width) // slot_width)
+        if len(data) > columns:
+            bounds = [len(data) * column // columns for column in range(columns + 1)]
+            series = [_downsample_max(values, bounds) for values in series]
+            labels = [labels[start] for start in bounds[:-1]]
+
+    bar_heights = [[max(1, int(value * scale_factor)) if value > 0 else 0 for value in values] for values in series]
+    glyphs = CHART_GLYPHS[: len(keys)] if len(keys) > 1 else ("█",)
+    points = list(zip(*bar_heights))
+    padding = "" if compact else " " * (slot_width - 2 - len(keys))
+    margin = "" if compact else "  "
+
     graph_lines = []
 
     for i in range(height):
@@ -156,23 +681,32 @@ def create_bar_chart(
         else:
             y_value = " " * (actual_y_axis_width - 2) + "│"
 
-        bar_line = ""
-        for bar in bars:
-            bar_line += "  " + bar[i] + " " * (date_width - 3)
-
+        threshold = height - i
+        bar_line = "".join(
+            margin
+            + "".join(glyph if bar_height >= threshold else " " for glyph, bar_height in zip(glyphs, point))
+            + padding
+            for point in points
+        )
         graph_lines.append(f"{y_value:>{actual_y_axis_width}}{bar_line}")
 
-    x_axis = "─" * graph_width
-    graph_lines.append(f"{' ' * (actual_y_axis_width - 1)}└{x_axis}")
+    graph_width = len(points) * slot_width
+    graph_lines.append(f"{' ' * (actual_y_axis_width - 1)}└{'─' * graph_width}")
 
-    x_labels = ""
-    for label in labels:
-        x_labels += f"{label:<{date_width}}"
-    graph_lines.append(f"{' ' * actual_y_axis_width}{x_labels}")
+    if compact:
+        label_step = -(-date_width // slot_width)
+        label_width = label_step * slot_width
+        x_labels = "".join(f"{str(label)[: label_width - 1]:<{label_width}}" for label in labels[::label_step])
+        graph_lines.append(f"{' ' * actual_y_axis_width}{x_labels[:graph_width]}")
+    else:
+        x_labels = "".join(f"{label:<{slot_width}}" for label in labels)
+        graph_lines.append(f"{' ' * actual_y_axis_width}{x_labels}")
 
-    values = ""
-    for item in data:
-        values += " " * (date_width - len(f"{item[value_key]:,}"))
-    graph_lines.append(f"{' ' * actual_y_axis_width}{values}")
+        values = "".join(" " * (date_width - len(f"{value:,}")) for value in series[0])
+        graph_lines.append(f"{' ' * actual_y_axis_width}{values}")
+
+    if len(keys) > 1:
+        legend = "  ".join(f"{glyph} {key}" for glyph, key in zip(glyphs, keys))
+        graph_lines.append(f"{' ' * actual_y_axis_width}{legend}")
 
     return graph_lines
@@ -0,0 +1,174 @@
+import collections
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+DEFAULT_MAX_WORKERS = 8
+STOP_POLL_SECONDS = 0.1
+
+_NO_ITEM = object()
+_END_OF_STREAM = object()
+
+
+def bounded_map(
+    func,
+    items,
+    max_workers=DEFAULT_MAX_WORKERS,
+    ordered=True,
+    max_pending=None,
+    weight=None,
+    max_pending_weight=None,
+):
+    """Run ``func`` over ``items`` on a bounded thread pool and stream the outcomes.
+
+    At most ``max_pending`` items are submitted ahead of the consumer, so ``items`` may be a
+    lazy iterator of any length. When ``weight`` and ``max_pending_weight`` are given, the
+    total weight of submitted but not yet consumed items is also capped (a single item
+    heavier than the budget still runs, alone). An exception raised by ``func`` is returned
+    with its item instead of being raised, so one failure does not stop the others.
+
+    Args:
+        func: Callable applied to each item
+        items: Iterable of items
+        max_workers: Number of worker threads (default: 8)
+        ordered: Yield outcomes in input order (True) or as soon as they complete (False)
+        max_pending: Maximum number of submitted but not yet consumed items
+                     (default: twice ``max_workers``)
+        weight: Optional callable returning the weight of an item (e.g. its size in bytes)
+        max_pending_weight: Optional cap on the total weight of pending items
+
+    Yields:
+        tuple: (item, result, error) where exactly one of result or error is meaningful
+    """
+    max_workers = max(1, max_workers)
+    max_pending = max(1, max_pending or max_workers * 2)
+    items = iter(items)
+    pending = collections.OrderedDict()
+    pending_weight = 0
+    next_item = _NO_ITEM
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        while True:
+            while len(pending) < max_pending:
+                if next_item is _NO_ITEM:
+                    next_item = next(items, _NO_ITEM)
+                    if next_item is _NO_ITEM:
+                        break
+
+                item_weight = weight(next_item) if weight else 0
+                if pending and max_pending_weight is not None and pending_weight + item_weight > max_pending_weight:
+                    break
+
+                pending[executor.submit(func, next_item)] = (next_item, item_weight)
+                pending_weight += item_weight
+                next_item = _NO_ITEM
+
+            if not pending:
+                break
+
+            if ordered:
+                future = next(iter(pending))
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = next(f for f in pending if f in done)
+            item, item_weight = pending.pop(future)
+
+            try:
+                outcome = (item, future.result(), None)
+            except Exception as e:
+                outcome = (item, None, e)
+            yield outcome
+            pending_weight -= item_weight
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def bounded_chain(func, items, max_workers=DEFAULT_MAX_WORKERS, max_buffered=1, ordered=True):
+    """Run the generator function ``func`` over ``items`` on a bounded thread pool and chain its values.
+
+    Up to ``max_workers`` items are worked on at once, each by one thread iterating
+    ``func(item)``. Values pass through queues of at most ``max_buffered`` entries per item,
+    so a worker running ahead of the consumer blocks instead of accumulating its output:
+    memory is bounded by the number of workers, whatever the number of values per item.
+
+    When the consumer stops iterating (or an error is raised), workers stop before asking
+    ``func`` for their next value, and closing the generator waits for the values already
+    being produced, so no work goes on in the background afterwards. Generators stopped
+    early are closed by their worker.
+
+    Args:
+        func: Generator function (or any callable returning an iterable) applied to each item
+        items: Iterable of items
+        max_workers: Number of worker threads (default: 8)
+        max_buffered: Maximum number of values waiting per item being worked on (default: 1)
+        ordered: Yield the values item after item in input order (True), or interleaved as
+                 soon as any worker produces them, which keeps every worker busy (False)
+
+    Yields:
+        Values produced by ``func(item)`` for the items
+
+    Raises:
+        Exception: The exception raised by ``func`` for an item, when it reaches the consumer
+    """
+    max_workers = max(1, max_workers)
+    max_buffered = max(1, max_buffered)
+    items = iter(items)
+    stop = threading.Event()
+    shared = None if ordered else queue.Queue(maxsize=max_workers * max_buffered)
+    streams = collections.deque()
+
+    def put(stream, entry):
+        while not stop.is_set():
+            try:
+                stream.put(entry, timeout=STOP_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(item, stream):
+        values = None
+        try:
+            values = iter(func(item))
+            while not stop.is_set():
+                value = next(values, _END_OF_STREAM)
+                if value is _END_OF_STREAM:
+                    break
+                if not put(stream, (value, None)):
+                    return
+        except Exception as e:
+            put(stream, (_END_OF_STREAM, e))
+            return
+        finally:
+            # Release what a generator stopped early holds (e.g. an open response stream).
+            if hasattr(values, "close"):
+                values.close()
+        put(stream, (_END_OF_STREAM, None))
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        while True:
+            while len(streams) < max_workers:
+                item = next(items, _NO_ITEM)
+                if item is _NO_ITEM:
+                    break
+                stream = queue.Queue(maxsize=max_buffered) if ordered else shared
+                executor.submit(produce, item, stream)
+                streams.append(stream)
+
+            if not streams:
+                break
+
+            value, error = (streams[0] if ordered else shared).get()
+            if value is _END_OF_STREAM:
+                streams.popleft()
+                if error is not None:
+                    raise error
+                continue
+            yield value
+    finally:
+        stop.set()
+        executor.shutdown(wait=True)
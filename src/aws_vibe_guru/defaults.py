@@ -0,0 +1,9 @@
+"""Tuning defaults shared by the AWS modules and the CLI.
+
+Kept free of boto3 imports so that the CLI can build its options without loading the AWS SDK.
+"""
+
+DEFAULT_READ_WORKERS = 8
+DEFAULT_MAX_BUFFER_BYTES = 64 * 1024 * 1024
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_DOWNLOAD_WORKERS = 8
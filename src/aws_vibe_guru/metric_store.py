@@ -0,0 +1,123 @@
+import json
+import os
+import sqlite3
+import threading
+
+from aws_vibe_guru.cache import get_cache_dir
+
+METRIC_STORE_FILE = "metrics.sqlite3"
+
+_store = None
+_store_lock = threading.Lock()
+
+
+class MetricStore:
+    """Persistent store of CloudWatch datapoints for closed periods.
+
+    Each row holds one period bucket of one series. Buckets that CloudWatch returned no
+    datapoint for are stored with a NULL value once they are old enough that no late
+    datapoint can still arrive, so they are not requested again either. Series are scoped by
+    account and region, so one store serves every profile.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(get_cache_dir(), METRIC_STORE_FILE)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS datapoints ("
+                " series TEXT NOT NULL,"
+                " timestamp INTEGER NOT NULL,"
+                " value REAL,"
+                " PRIMARY KEY (series, timestamp)"
+                ") WITHOUT ROWID"
+            )
+
+    @staticmethod
+    def series_key(query, scope=""):
+        """Return the key identifying a series: scope, namespace, metric, dimensions, period and statistic.
+
+        Args:
+            query: Metric query built with ``aws_cloudwatch.metric_query``
+            scope: Account and region the series belongs to (e.g. "123456789012:us-east-1")
+        """
+        return json.dumps(
+            [
+                scope,
+                query["namespace"],
+                query["metric_name"],
+                sorted(query["dimensions"].items()),
+                query["period"],
+                query["statistic"],
+            ]
+        )
+
+    def load(self, series, start, end):
+        """Load stored buckets of a series in [start, end).
+
+        Args:
+            series: Series key from ``series_key``
+            start: Start epoch seconds (inclusive)
+            end: End epoch seconds (exclusive)
+
+        Returns:
+            dict: Mapping of bucket epoch seconds to value (None for buckets without data)
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT timestamp, value FROM datapoints WHERE series = ? AND timestamp >= ? AND timestamp < ?",
+                (series, start, end),
+            ).fetchall()
+        return dict(rows)
+
+    def save(self, series, buckets):
+        """Store closed buckets of a series.
+
+        Args:
+            series: Series key from ``series_key``
+            buckets: Mapping of bucket epoch seconds to value (None for buckets without data)
+        """
+        if not buckets:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO datapoints (series, timestamp, value) VALUES (?, ?, ?)",
+                [(series, timestamp, value) for timestamp, value in buckets.items()],
+            )
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+def get_metric_store():
+    """Return the process-wide metric store, or None when it is disabled or unavailable.
+
+    Set ``AWS_VIBE_GURU_METRIC_CACHE=0`` to disable the store.
+
+    Returns:
+        MetricStore: The shared store, or None
+    """
+    global _store
+
+    if os.environ.get("AWS_VIBE_GURU_METRIC_CACHE", "1") == "0":
+        return None
+
+    with _store_lock:
+        if _store is None:
+            try:
+                _store = MetricStore()
+            except (OSError, sqlite3.Error):
+                return None
+        return _store
+
+
+def close_metric_store():
+    """Close the process-wide metric store; the next ``get_metric_store`` call opens it again."""
+    global _store
+
+    with _store_lock:
+        if _store is not None:
+            _store.close()
+            _store = None
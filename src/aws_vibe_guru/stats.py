@@ -0,0 +1,189 @@
+import math
+import warnings
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_PERCENTILES = (50, 90, 95, 99)
+
+
+def _percentile_key(percentile):
+    return f"p{percentile:g}"
+
+
+def _percent_change(current, previous):
+    if previous > 0:
+        return (current - previous) / previous * 100
+    return 100 if current > 0 else 0
+
+
+def _empty_statistics(row, percentiles):
+    return {
+        "count": 0,
+        "total": 0,
+        "mean": 0,
+        "median": 0,
+        "std": 0,
+        "min": None,
+        "max": None,
+        "max_index": None,
+        "second_max_index": None,
+        "percentiles": {_percentile_key(p): 0 for p in percentiles},
+        "zscores": [None] * len(row),
+    }
+
+
+def _interpolated_percentile(sorted_values, percentile):
+    # Same linear interpolation as numpy.percentile's default method
+    rank = percentile / 100 * (len(sorted_values) - 1)
+    lower = math.floor(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+def _row_statistics(row, percentiles):
+    """Pure Python statistics of one row, used when NumPy is not installed."""
+    values = [value for value in row if value is not None]
+    if not values:
+        return _empty_statistics(row, percentiles)
+
+    max_index = second_max_index = None
+    for index, value in enumerate(row):
+        if value is None:
+            continue
+        if max_index is None or value > row[max_index]:
+            max_index, second_max_index = index, max_index
+        elif second_max_index is None or value > row[second_max_index]:
+            second_max_index = index
+
+    count = len(values)
+    total = sum(values)
+    mean = total / count
+    std = math.sqrt(sum((value - mean) ** 2 for value in values) / count)
+    sorted_values = sorted(values)
+
+    return {
+        "count": count,
+        "total": total,
+        "mean": mean,
+        "median": _interpolated_percentile(sorted_values, 50),
+        "std": std,
+        "min": sorted_values[0],
+        "max": sorted_values[-1],
+        "max_index": max_index,
+        "second_max_index": second_max_index,
+        "percentiles": {_percentile_key(p): _interpolated_percentile(sorted_values, p) for p in percentiles},
+        "zscores": [None if value is None else ((value - mean) / std if std else 0.0) for value in row],
+    }
+
+
+def _as_number(value, integral):
+    return int(value) if integral else float(value)
+
+
+def _matrix_statistics_numpy(matrix, percentiles):
+    width = max((len(row) for row in matrix), default=0)
+    padded = [row + [None] * (width - len(row)) if len(row) < width else row for row in matrix]
+    # None becomes NaN, which the nan* reductions skip
+    values = np.array(padded, dtype=float).reshape(len(matrix), width)
+
+    present = ~np.isnan(values)
+    counts = present.sum(axis=1)
+    # Whole-number rows (message counts) keep integer totals and minimums
+    integral = np.all(~present | (values == np.trunc(values)), axis=1)
+
+    with warnings.catch_warnings():
+        # Rows without any datapoint produce all-NaN slices; they are replaced below
+        warnings.simplefilter("ignore", RuntimeWarning)
+        totals = np.nansum(values, axis=1)
+        means = np.nanmean(values, axis=1)
+        stds = np.nanstd(values, axis=1)
+        medians = np.nanmedian(values, axis=1)
+        minimums = np.nanmin(values, axis=1) if width else np.full(len(matrix), np.nan)
+        percentile_values = np.nanpercentile(values, percentiles, axis=1) if width else None
+        zscores = np.where(stds[:, None] > 0, (values - means[:, None]) / stds[:, None], 0.0)
+
+    # argmax returns the first occurrence, so ties resolve to the earliest bucket
+    filled = np.where(present, values, -np.inf)
+    max_indexes = filled.argmax(axis=1) if width else np.zeros(len(matrix), dtype=int)
+    if width:
+        filled[np.arange(len(matrix)), max_indexes] = -np.inf
+    second_max_indexes = filled.argmax(axis=1) if width else max_indexes
+
+    results = []
+    for index, row in enumerate(matrix):
+        if not counts[index]:
+            results.append(_empty_statistics(row, percentiles))
+            continue
+
+        max_index = int(max_indexes[index])
+        second_max_index = int(second_max_indexes[index]) if counts[index] > 1 else None
+        row_zscores = zscores[index, : len(row)].tolist()
+        results.append(
+            {
+                "count": int(counts[index]),
+                "total": _as_number(totals[index], integral[index]),
+                "mean": float(means[index]),
+                "median": float(medians[index]),
+                "std": float(stds[index]),
+                "min": _as_number(minimums[index], integral[index]),
+                "max": row[max_index],
+                "max_index": max_index,
+                "second_max_index": second_max_index,
+                "percentiles": {
+                    _percentile_key(p): float(percentile_values[position, index])
+                    for position, p in enumerate(percentiles)
+                },
+                "zscores": [None if value is None else z for value, z in zip(row, row_zscores)],
+            }
+        )
+
+    return results
+
+
+def compute_matrix_statistics(matrix, percentiles=DEFAULT_PERCENTILES, season_length=None):
+    """Compute descriptive statistics for every row of a series×time matrix in one pass.
+
+    Each row is one series (e.g. one queue) and each column one time bucket; all rows
+    should share the same buckets, with None where a series has no datapoint. Missing
+    buckets are ignored by every statistic. With NumPy installed the whole matrix is
+    processed with vectorized operations; otherwise a pure Python fallback gives the same
+    results.
+
+    Args:
+        matrix: List of rows, each a list of numbers (or None) in time order
+        percentiles: Percentiles to compute, between 0 and 100 (default: 50, 90, 95, 99)
+        season_length: Optional number of buckets in a season (e.g. 7 for daily data);
+                       when set, the last season is compared with the one before it
+
+    Returns:
+        list: One dict per row with keys 'count', 'total', 'mean', 'median', 'std'
+              (population standard deviation), 'min', 'max', 'max_index' and
+              'second_max_index' (column of the highest and second highest values,
+              earliest first on ties), 'percentiles' (dict such as {'p90': ...}) and
+              'zscores' (list aligned with the row, None for missing buckets). With
+              ``season_length``, also 'last_season_total', 'previous_season_total' and
+              'season_change_percent' (all None when the row is shorter than two seasons).
+    """
+    matrix = [list(row) for row in matrix]
+    percentiles = tuple(percentiles)
+
+    if np is not None:
+        results = _matrix_statistics_numpy(matrix, percentiles)
+    else:
+        results = [_row_statistics(row, percentiles) for row in matrix]
+
+    if season_length:
+        for row, statistics in zip(matrix, results):
+            last_season = previous_season = change = None
+            if len(row) >= 2 * season_length:
+                last_season = sum(value or 0 for value in row[-season_length:])
+                previous_season = sum(value or 0 for value in row[-2 * season_length : -season_length])
+                change = _percent_change(last_season, previous_season)
+            statistics["last_season_total"] = last_season
+            statistics["previous_season_total"] = previous_season
+            statistics["season_change_percent"] = change
+
+    return results
@@ -0,0 +1,250 @@
+import datetime
+import json
+import threading
+import time
+
+from aws_vibe_guru.aws_clients import THROTTLING_ERROR_CODES, add_client_hook, remove_client_hook
+
+TRACE_PERCENTILES = (50, 90, 99)
+CLIENT_CREATION_OPERATION = "(client creation)"
+
+
+def _body_size(body):
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    return 0
+
+
+def _error_code(parsed):
+    return (parsed or {}).get("Error", {}).get("Code") if isinstance(parsed, dict) else None
+
+
+class Tracer:
+    """Record a span for every AWS API call made by the clients it is attached to.
+
+    The tracer registers handlers on the botocore event system of each client:
+    ``before-parameter-build`` starts the span, ``before-call`` measures the serialized
+    request, ``needs-retry`` counts the attempts (and throttled ones) and ``after-call`` /
+    ``after-call-error`` close it with the HTTP status, error code and response size. Spans
+    of concurrent calls are kept apart through botocore's per-call context. Client creation
+    time is recorded as a span of its own.
+
+    Use ``enable_tracing()`` to attach a tracer to every client of the shared factory.
+    """
+
+    def __init__(self):
+        self.spans = []
+        self.started_at = datetime.datetime.now(datetime.timezone.utc)
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._clients = []
+        self._handler_id = f"aws-vibe-guru-trace-{id(self)}"
+        self._handlers = (
+            ("before-parameter-build.*.*", self._start_call, "first"),
+            ("before-call.*.*", self._measure_request, "first"),
+            ("needs-retry.*.*", self._count_attempt, "first"),
+            ("after-call.*.*", self._end_call, "last"),
+            ("after-call-error.*.*", self._fail_call, "last"),
+        )
+
+    @property
+    def elapsed_seconds(self):
+        return time.perf_counter() - self._start
+
+    def attach(self, client, creation_seconds=None):
+        """Trace the calls of a client.
+
+        Args:
+            client: boto3 client
+            creation_seconds: Optional time it took to create the client, recorded as a span
+        """
+        events = client.meta.events
+        for event, handler, position in self._handlers:
+            register = events.register_first if position == "first" else events.register_last
+            register(event, handler, unique_id=f"{self._handler_id}-{event}")
+        with self._lock:
+            self._clients.append(client)
+
+        if creation_seconds is not None:
+            self._record(
+                {
+                    "service": client.meta.service_model.service_name,
+                    "operation": CLIENT_CREATION_OPERATION,
+                    "start": time.time() - creation_seconds,
+                    "duration_ms": creation_seconds * 1000,
+                    "status_code": None,
+                    "error": None,
+                    "attempts": 0,
+                    "retries": 0,
+                    "throttled": 0,
+                    "request_bytes": 0,
+                    "response_bytes": 0,
+                    "thread": threading.current_thread().name,
+                }
+            )
+
+    def detach(self):
+        """Unregister the handlers from every attached client."""
+        with self._lock:
+            clients, self._clients = self._clients, []
+        for client in clients:
+            for event, _, _ in self._handlers:
+                client.meta.events.unregister(event, unique_id=f"{self._handler_id}-{event}")
+
+    def _record(self, span):
+        with self._lock:
+            self.spans.append(span)
+
+    def _start_call(self, model, context, **kwargs):
+        context["trace"] = {
+            "service": model.service_model.service_name,
+            "operation": model.name,
+            "start": time.time(),
+            "perf_start": time.perf_counter(),
+            "attempts": 0,
+            "throttled": 0,
+            "request_bytes": 0,
+        }
+
+    def _measure_request(self, params, context, **kwargs):
+        if "trace" in context:
+            context["trace"]["request_bytes"] = _body_size(params.get("body"))
+
+    def _count_attempt(self, request_dict, response, caught_exception, **kwargs):
+        trace = request_dict.get("context", {}).get("trace")
+        if trace is None:
+            return
+        trace["attempts"] += 1
+        if response is not None and _error_code(response[1]) in THROTTLING_ERROR_CODES:
+            trace["throttled"] += 1
+
+    def _finish(self, context, status_code, error, response_bytes, retries):
+        trace = context.pop("trace", None)
+        if trace is None:
+            return
+        attempts = max(trace["attempts"], retries + 1)
+        self._record(
+            {
+                "service": trace["service"],
+                "operation": trace["operation"],
+                "start": trace["start"],
+                "duration_ms": (time.perf_counter() - trace["perf_start"]) * 1000,
+                "status_code": status_code,
+                "error": error,
+                "attempts": attempts,
+                "retries": attempts - 1,
+                "throttled": trace["throttled"],
+                "request_bytes": trace["request_bytes"],
+                "response_bytes": response_bytes,
+                "thread": threading.current_thread().name,
+            }
+        )
+
+    def _end_call(self, http_response, parsed, context, **kwargs):
+        metadata = parsed.get("ResponseMetadata", {}) if isinstance(parsed, dict) else {}
+        headers = getattr(http_response, "headers", None) or {}
+        self._finish(
+            context,
+            getattr(http_response, "status_code", None),
+            _error_code(parsed),
+            int(headers.get("content-length") or 0),
+            metadata.get("RetryAttempts", 0),
+        )
+
+    def _fail_call(self, exception, context, **kwargs):
+        self._finish(context, None, type(exception).__name__, 0, 0)
+
+    def summary(self):
+        """Aggregate the spans per operation.
+
+        Returns:
+            list: One dict per (service, operation), slowest total first, with keys
+                  'service', 'operation', 'calls', 'errors', 'retries', 'throttled',
+                  'total_ms', 'p50_ms', 'p90_ms', 'p99_ms', 'max_ms', 'request_bytes'
+                  and 'response_bytes'
+        """
+        from aws_vibe_guru.stats import compute_matrix_statistics
+
+        with self._lock:
+            spans = list(self.spans)
+
+        groups = {}
+        for span in spans:
+            groups.setdefault((span["service"], span["operation"]), []).append(span)
+
+        durations = [[span["duration_ms"] for span in group] for group in groups.values()]
+        rows = []
+        for (service, operation), group, statistics in zip(
+            groups, groups.values(), compute_matrix_statistics(durations, percentiles=TRACE_PERCENTILES)
+        ):
+            rows.append(
+                {
+                    "service": service,
+                    "operation": operation,
+                    "calls": len(group),
+                    "errors": sum(1 for span in group if span["error"]),
+                    "retries": sum(span["retries"] for span in group),
+                    "throttled": sum(span["throttled"] for span in group),
+                    "total_ms": statistics["total"],
+                    **{f"{key}_ms": value for key, value in statistics["percentiles"].items()},
+                    "max_ms": statistics["max"],
+                    "request_bytes": sum(span["request_bytes"] for span in group),
+                    "response_bytes": sum(span["response_bytes"] for span in group),
+                }
+            )
+
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+    def write_json(self, path):
+        """Write the spans and their summary to a JSON file for offline analysis.
+
+        Args:
+            path: Output file path
+
+        Raises:
+            ValueError: When the file cannot be written
+        """
+        with self._lock:
+            spans = list(self.spans)
+
+        report = {
+            "started_at": self.started_at.strftime("%Y-%m-%d %H:%M:%S UTC"),
+            "elapsed_seconds": self.elapsed_seconds,
+            "summary": self.summary(),
+            "spans": sorted(spans, key=lambda span: span["start"]),
+        }
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+                f.write("\n")
+        except OSError as e:
+            raise ValueError(f"Failed to write trace to '{path}': {e}") from e
+
+
+def enable_tracing(tracer=None):
+    """Trace every AWS call made through the shared client factory.
+
+    The tracer is attached to the clients already created and to every client created
+    afterwards by ``aws_clients.get_client`` or ``aws_clients.create_client``.
+
+    Args:
+        tracer: Optional existing Tracer (default: a new one)
+
+    Returns:
+        Tracer: The active tracer
+    """
+    tracer = tracer or Tracer()
+    add_client_hook(tracer.attach)
+    return tracer
+
+
+def disable_tracing(tracer):
+    """Stop tracing: detach the tracer from its clients and from new ones.
+
+    Args:
+        tracer: Tracer returned by ``enable_tracing``
+    """
+    remove_client_hook(tracer.attach)
+    tracer.detach()
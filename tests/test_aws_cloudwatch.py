@@ -0,0 +1,256 @@
+import datetime
+
+import pytest
+
+from aws_vibe_guru import aws_cloudwatch
+from aws_vibe_guru.aws_cloudwatch import from_epoch, metric_query
+from aws_vibe_guru.metric_store import MetricStore
+
+# 2024-06-01 12:07:30 UTC, inside an open minute and an open hour
+NOW = 1717243650
+HOUR = 3600
+DAY = 86400
+
+
+def _value(queue_name, timestamp):
+    return float(int(queue_name.split("-")[1]) * 1000 + timestamp // 60 % 1000)
+
+
+class FakeCloudWatch:
+    """GetMetricData over synthetic series, paged by datapoints like CloudWatch."""
+
+    class meta:
+        region_name = "us-east-1"
+
+    def __init__(self, page_size=5000, gaps=()):
+        self.page_size = page_size
+        self.gaps = set(gaps)
+        self.calls = []
+
+    def get_metric_data(self, MetricDataQueries, StartTime, EndTime, ScanBy, NextToken=None):
+        assert len(MetricDataQueries) <= aws_cloudwatch.MAX_QUERIES_PER_REQUEST
+        start, end = StartTime.timestamp(), EndTime.timestamp()
+        self.calls.append({"ids": [query["Id"] for query in MetricDataQueries], "start": start, "end": end})
+
+        points = []
+        for query in MetricDataQueries:
+            stat = query["MetricStat"]
+            period = stat["Period"]
+            assert (end - start) / period <= aws_cloudwatch.MAX_DATAPOINTS_PER_CHUNK
+            (dimension,) = stat["Metric"]["Dimensions"]
+            first = int(start) - int(start) % period
+            for bucket in range(first, min(int(end), NOW), period):
+                if bucket not in self.gaps:
+                    points.append((query["Id"], bucket, _value(dimension["Value"], bucket)))
+
+        offset = int(NextToken or 0)
+        page = points[offset : offset + self.page_size]
+        results = {}
+        for query_id, bucket, value in page:
+            result = results.setdefault(query_id, {"Id": query_id, "Timestamps": [], "Values": []})
+            result["Timestamps"].append(from_epoch(bucket))
+            result["Values"].append(value)
+        response = {"MetricDataResults": list(results.values())}
+        if offset + self.page_size < len(points):
+            response["NextToken"] = str(offset + self.page_size)
+        return response
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    monkeypatch.setattr(aws_cloudwatch.time, "time", lambda: NOW)
+
+
+@pytest.fixture
+def cloudwatch(monkeypatch, clock):
+    monkeypatch.setattr(aws_cloudwatch, "get_account_id", lambda: "123456789012")
+
+    def install(store=None, **kwargs):
+        client = FakeCloudWatch(**kwargs)
+        monkeypatch.setattr(aws_cloudwatch, "create_cloudwatch_connection", lambda *args: client)
+        monkeypatch.setattr(aws_cloudwatch, "get_metric_store", lambda: store)
+        return client
+
+    return install
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MetricStore(str(tmp_path / "metrics.sqlite3"))
+    yield store
+    store.close()
+
+
+def _queries(count, period=60):
+    return [
+        metric_query("AWS/SQS", "NumberOfMessagesSent", {"QueueName": f"queue-{index}"}, "Sum", period)
+        for index in range(count)
+    ]
+
+
+def _expected(queue_name, start, end, period=60, gaps=()):
+    first = start - start % period
+    return [
+        (bucket, _value(queue_name, bucket)) for bucket in range(first, min(end, NOW), period) if bucket not in gaps
+    ]
+
+
+def _points(series):
+    return [(int(point["timestamp"].timestamp()), point["value"]) for point in series]
+
+
+def test_queries_are_packed_500_per_request():
+    start, end = from_epoch(NOW - HOUR), from_epoch(NOW)
+
+    requests = list(aws_cloudwatch.metric_data_requests(_queries(1201), start, end))
+
+    assert [len(request["MetricDataQueries"]) for request in requests] == [500, 500, 201]
+    ids = [query["Id"] for request in requests for query in request["MetricDataQueries"]]
+    assert ids == [f"q{index}" for index in range(1201)]
+    assert {(request["StartTime"], request["EndTime"]) for request in requests} == {(start, end)}
+
+
+def test_long_windows_are_split_into_chunks_on_every_period_boundary():
+    # get_metric_data aligns the window start down to the periods before building requests
+    start = NOW - 3 * DAY - NOW % 300
+    queries = _queries(1) + _queries(1, period=300)
+
+    requests = list(aws_cloudwatch.metric_data_requests(queries, from_epoch(start), from_epoch(NOW)))
+
+    bounds = [(request["StartTime"].timestamp(), request["EndTime"].timestamp()) for request in requests]
+    assert bounds[0][0] == start and bounds[-1][1] == NOW
+    assert all(previous[1] == current[0] for previous, current in zip(bounds, bounds[1:]))
+    assert all(chunk_end % 300 == 0 for _, chunk_end in bounds[:-1])
+    assert all(
+        (chunk_end - chunk_start) / 60 <= aws_cloudwatch.MAX_DATAPOINTS_PER_CHUNK for chunk_start, chunk_end in bounds
+    )
+    assert len(requests) == 4
+
+
+def test_get_metric_data_follows_next_token_and_maps_ids_to_series(cloudwatch):
+    client = cloudwatch(page_size=1000)
+    start = NOW - 600
+
+    series = aws_cloudwatch.get_metric_data(_queries(1201), from_epoch(start), from_epoch(NOW), max_workers=3)
+
+    # 11 buckets per queue: 500 queues make 5,500 datapoints, or 6 pages of 1,000
+    assert len(client.calls) == 6 + 6 + 3
+    assert [call["ids"][0] for call in client.calls].count("q0") == 6
+    assert len(series) == 1201
+    for index in (0, 499, 500, 1200):
+        assert _points(series[index]) == _expected(f"queue-{index}", start, NOW)
+
+
+def test_get_metric_data_merges_time_chunks_in_order(cloudwatch):
+    client = cloudwatch()
+    start = NOW - 3 * DAY - 90
+
+    (series,) = aws_cloudwatch.get_metric_data(_queries(1), from_epoch(start), from_epoch(NOW), max_workers=4)
+
+    assert len(client.calls) == 4
+    assert _points(series) == _expected("queue-0", start, NOW)
+
+
+def test_plan_fetches_from_the_first_missing_or_unsettled_bucket(clock, store):
+    queries = _queries(3)
+    start, end = NOW - HOUR - NOW % 60, NOW
+    settled_before = NOW - aws_cloudwatch.METRIC_SETTLE_SECONDS
+    # The bucket still open when the settle delay is subtracted
+    first_open = settled_before - settled_before % 60
+    store.save(MetricStore.series_key(queries[1], "scope"), dict.fromkeys(range(start, first_open - 60, 60), 1.0))
+    store.save(MetricStore.series_key(queries[2], "scope"), dict.fromkeys(range(start, end, 60), 1.0))
+
+    plans, fetch_groups, _, planned_settled_before = aws_cloudwatch.plan_metric_data(
+        queries, from_epoch(start), from_epoch(end), store, "scope"
+    )
+
+    assert planned_settled_before == settled_before
+    assert [fetch_start for _, _, fetch_start, _ in plans] == [start, first_open - 60, first_open]
+    assert fetch_groups == {start: [0], first_open - 60: [1], first_open: [2]}
+
+
+def test_merge_stores_settled_buckets_and_empty_ones_only_once_final(clock, store):
+    (query,) = _queries(1)
+    key = MetricStore.series_key(query)
+    start = NOW - 4 * HOUR - NOW % 60
+    settled_before = NOW - aws_cloudwatch.METRIC_SETTLE_SECONDS
+    empty_settled_before = NOW - aws_cloudwatch.METRIC_EMPTY_SETTLE_SECONDS
+    present = range(start, NOW, 120)
+    fetched = {0: [{"timestamp": from_epoch(bucket), "value": 2.0} for bucket in present]}
+
+    (series,) = aws_cloudwatch.merge_metric_data([(key, 60, start, {})], fetched, NOW, settled_before, store)
+
+    assert _points(series) == [(bucket, 2.0) for bucket in present]
+    stored = store.load(key, start, NOW)
+    assert max(bucket for bucket, value in stored.items() if value is not None) + 60 <= settled_before
+    assert max(bucket for bucket, value in stored.items() if value is None) + 60 <= empty_settled_before
+    assert all(stored[bucket] == 2.0 for bucket in present if bucket + 60 <= settled_before)
+    assert all(stored[bucket] is None for bucket in range(start + 60, empty_settled_before - 60, 120))
+
+
+SETTLED_BEFORE = NOW - aws_cloudwatch.METRIC_SETTLE_SECONDS
+OLD_GAP = NOW - 5 * HOUR - NOW % 60
+RECENT_GAP = NOW - HOUR - NOW % 60
+
+
+@pytest.mark.parametrize(
+    "gaps, refetch_start",
+    [
+        ({OLD_GAP}, SETTLED_BEFORE - SETTLED_BEFORE % 60),
+        # The recent gap may still be filled by a late datapoint, so it is requested again
+        ({OLD_GAP, RECENT_GAP}, RECENT_GAP),
+    ],
+)
+def test_second_call_fetches_only_the_unsettled_tail(cloudwatch, store, gaps, refetch_start):
+    client = cloudwatch(store=store, gaps=gaps)
+    start = NOW - 6 * HOUR - NOW % 60
+    queries = _queries(2)
+
+    first = aws_cloudwatch.get_metric_data(queries, from_epoch(start), from_epoch(NOW))
+    assert [call["start"] for call in client.calls] == [start]
+    client.calls.clear()
+    second = aws_cloudwatch.get_metric_data(queries, from_epoch(start), from_epoch(NOW))
+
+    assert [call["start"] for call in client.calls] == [refetch_start]
+    assert len(client.calls[0]["ids"]) == 2
+    assert first == second
+    assert _points(second[1]) == _expected("queue-1", start, NOW, gaps=gaps)
+
+
+def test_get_metric_data_without_the_store_fetches_the_whole_window(cloudwatch, store):
+    client = cloudwatch(store=store)
+    start = NOW - HOUR - NOW % 60
+
+    for _ in range(2):
+        aws_cloudwatch.get_metric_data(_queries(1), from_epoch(start), from_epoch(NOW), use_cache=False)
+
+    assert [call["start"] for call in client.calls] == [start, start]
+    assert store.load(MetricStore.series_key(_queries(1)[0]), 0, NOW) == {}
+
+
+def test_series_keys_are_scoped_and_ignore_dimension_order():
+    query = metric_query("AWS/SQS", "NumberOfMessagesSent", {"A": "1", "B": "2"}, "Sum", 60)
+    reordered = metric_query("AWS/SQS", "NumberOfMessagesSent", {"B": "2", "A": "1"}, "Sum", 60)
+
+    assert MetricStore.series_key(query, "1:us-east-1") == MetricStore.series_key(reordered, "1:us-east-1")
+    assert MetricStore.series_key(query, "1:us-east-1") != MetricStore.series_key(query, "1:eu-west-1")
+    assert MetricStore.series_key(query) != MetricStore.series_key(dict(query, statistic="Maximum"))
+    assert MetricStore.series_key(query) != MetricStore.series_key(dict(query, period=300))
+
+
+def test_metric_store_loads_half_open_ranges_with_empty_buckets(store):
+    store.save("series", {0: 1.0, 60: None, 120: 3.0})
+    store.save("other", {60: 5.0})
+
+    assert store.load("series", 0, 120) == {0: 1.0, 60: None}
+    assert store.load("series", 60, 180) == {60: None, 120: 3.0}
+
+
+def test_metric_store_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("AWS_VIBE_GURU_METRIC_CACHE", "0")
+
+    assert aws_cloudwatch.get_metric_store() is None
+
+
+def test_from_epoch_is_utc():
+    assert from_epoch(0) == datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
@@ -0,0 +1,165 @@
+import datetime
+import hashlib
+import json
+
+import pytest
+from botocore.exceptions import ClientError
+
+from aws_vibe_guru import aws_s3
+
+DATA = bytes(range(256)) * 40
+
+
+class Body:
+    def __init__(self, data):
+        self.data = data
+
+    def iter_chunks(self, chunk_size):
+        for start in range(0, len(self.data), chunk_size):
+            yield self.data[start : start + chunk_size]
+
+
+class FakeS3:
+    """HeadObject and ranged, conditional GetObject over one object."""
+
+    def __init__(self, data=DATA, etag=None, **head):
+        self.data = data
+        self.etag = hashlib.md5(data).hexdigest() if etag is None else etag
+        self.head = head
+        self.gets = []
+        self.fail_on_get = None
+
+    def head_object(self, Bucket, Key):
+        response = {"ContentLength": len(self.data), "LastModified": datetime.datetime(2024, 1, 1), **self.head}
+        if self.etag:
+            response["ETag"] = f'"{self.etag}"'
+        return response
+
+    def get_object(self, Bucket, Key, Range, IfMatch=None):
+        self.gets.append({"Range": Range, "IfMatch": IfMatch})
+        if self.fail_on_get == len(self.gets):
+            raise ClientError({"Error": {"Code": "InternalError", "Message": "boom"}}, "GetObject")
+        if IfMatch is not None and IfMatch != f'"{self.etag}"':
+            raise ClientError({"Error": {"Code": "PreconditionFailed", "Message": "ETag"}}, "GetObject")
+        start, end = map(int, Range[len("bytes=") :].split("-"))
+        return {"Body": Body(self.data[start : end + 1])}
+
+
+@pytest.fixture
+def fake_s3(monkeypatch):
+    def install(*args, **kwargs):
+        client = FakeS3(*args, **kwargs)
+        monkeypatch.setattr(aws_s3, "create_s3_connection", lambda *args, **kwargs: client)
+        return client
+
+    return install
+
+
+def _download(tmp_path, **kwargs):
+    return aws_s3.download_object("bucket", "dir/data.bin", str(tmp_path), part_size=1024, max_workers=1, **kwargs)
+
+
+def test_download_object_writes_the_parts_and_checks_the_md5(fake_s3, tmp_path):
+    client = fake_s3()
+
+    result = _download(tmp_path)
+
+    assert (tmp_path / "data.bin").read_bytes() == DATA
+    assert result["parts"] == len(client.gets) == 10
+    assert result["verified"] == "md5"
+    assert {get["IfMatch"] for get in client.gets} == {f'"{client.etag}"'}
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["data.bin"]
+
+
+def test_download_object_resumes_from_the_checkpoint(fake_s3, tmp_path):
+    client = fake_s3()
+    client.fail_on_get = 4
+
+    with pytest.raises(ValueError, match="Failed to download part 3"):
+        _download(tmp_path)
+    checkpoint = json.loads((tmp_path / "data.bin.part.json").read_text())
+    assert checkpoint["done"] == [0, 1, 2]
+
+    client.gets.clear()
+    client.fail_on_get = None
+    result = _download(tmp_path)
+
+    assert (tmp_path / "data.bin").read_bytes() == DATA
+    assert result["resumed_parts"] == 3
+    assert [get["Range"] for get in client.gets] == [
+        f"bytes={index * 1024}-{index * 1024 + 1023}" for index in range(3, 10)
+    ]
+
+
+def test_download_object_stops_when_the_object_changes(fake_s3, tmp_path):
+    client = fake_s3()
+    original_get = client.get_object
+
+    def get_object(**kwargs):
+        if len(client.gets) == 2:
+            client.data = DATA[::-1]
+            client.etag = hashlib.md5(client.data).hexdigest()
+        return original_get(**kwargs)
+
+    client.get_object = get_object
+
+    with pytest.raises(ValueError, match="changed during the download"):
+        _download(tmp_path)
+
+    # The checkpoint belongs to the old ETag, so the next download starts over
+    client.gets.clear()
+    result = _download(tmp_path)
+
+    assert (tmp_path / "data.bin").read_bytes() == DATA[::-1]
+    assert result["resumed_parts"] == 0
+    assert len(client.gets) == 10
+
+
+def test_download_object_removes_a_download_failing_the_md5_check(fake_s3, tmp_path):
+    fake_s3(etag=hashlib.md5(b"something else").hexdigest())
+
+    with pytest.raises(ValueError, match="MD5"):
+        _download(tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_object_rejects_short_parts(fake_s3, tmp_path):
+    client = fake_s3()
+    original_get = client.get_object
+
+    def get_object(**kwargs):
+        response = original_get(**kwargs)
+        response["Body"].data = response["Body"].data[:-1]
+        return response
+
+    client.get_object = get_object
+
+    with pytest.raises(ValueError, match="returned 1023 bytes, expected 1024"):
+        _download(tmp_path)
+
+
+@pytest.mark.parametrize(
+    "head, verified",
+    [
+        ({"etag": ""}, "size"),
+        ({"SSECustomerAlgorithm": "AES256"}, "size"),
+        ({"ServerSideEncryption": "aws:kms"}, "size"),
+    ],
+)
+def test_download_object_checks_the_size_only_without_a_plain_md5(fake_s3, tmp_path, head, verified):
+    client = fake_s3(**head)
+
+    result = _download(tmp_path)
+
+    assert result["verified"] == verified
+    if not client.etag:
+        assert {get["IfMatch"] for get in client.gets} == {None}
+
+
+def test_download_object_reuses_the_object_info(fake_s3, tmp_path, monkeypatch):
+    fake_s3()
+    info = aws_s3.get_object_info("bucket", "dir/data.bin")
+    monkeypatch.setattr(aws_s3, "get_object_info", None)
+
+    assert _download(tmp_path, object_info=info)["size"] == len(DATA)
@@ -0,0 +1,170 @@
+import datetime
+import json
+import os
+
+import pytest
+
+from aws_vibe_guru.aws_s3_inventory import iter_inventory_objects, load_inventory_manifest
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "inventory")
+CSV_MANIFEST = os.path.join(FIXTURES_DIR, "example-bucket", "daily", "2024-01-02T01-00Z", "manifest.json")
+CSV_DATA_DIR = os.path.join(FIXTURES_DIR, "example-bucket", "daily", "data")
+
+CURRENT_KEYS = [
+    "logs/2024/app one.log",
+    "logs/2024/app-two.log",
+    "reports/q1 summary.csv",
+    "reports/a+b.csv",
+    "data/été.json",
+]
+
+
+def test_load_inventory_manifest_resolves_local_data_files():
+    inventory = load_inventory_manifest(CSV_MANIFEST)
+
+    assert inventory["source_bucket"] == "example-bucket"
+    assert inventory["file_format"] == "CSV"
+    assert inventory["file_schema"] == [
+        "Bucket",
+        "Key",
+        "VersionId",
+        "IsLatest",
+        "IsDeleteMarker",
+        "Size",
+        "LastModifiedDate",
+        "StorageClass",
+    ]
+    assert inventory["files"] == [
+        os.path.join(CSV_DATA_DIR, "part-0.csv.gz"),
+        os.path.join(CSV_DATA_DIR, "part-1.csv.gz"),
+    ]
+
+
+def test_load_inventory_manifest_falls_back_to_the_data_directory(tmp_path):
+    date_dir = tmp_path / "config" / "2024-01-02T01-00Z"
+    data_dir = tmp_path / "config" / "data"
+    date_dir.mkdir(parents=True)
+    data_dir.mkdir()
+    (data_dir / "part-0.csv.gz").write_bytes(b"")
+    manifest = date_dir / "manifest.json"
+    manifest.write_text(
+        json.dumps({"fileFormat": "CSV", "fileSchema": "Key", "files": [{"key": "x/y/part-0.csv.gz"}]})
+    )
+
+    assert load_inventory_manifest(str(manifest))["files"] == [str(data_dir / "part-0.csv.gz")]
+
+
+def test_load_inventory_manifest_rejects_unsupported_formats(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({"fileFormat": "JSON", "files": []}))
+
+    with pytest.raises(ValueError, match="Unsupported inventory format"):
+        load_inventory_manifest(str(manifest))
+
+
+def test_load_inventory_manifest_rejects_invalid_json(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text("{not json")
+
+    with pytest.raises(ValueError, match="Invalid inventory manifest"):
+        load_inventory_manifest(str(manifest))
+
+
+def test_iter_inventory_objects_skips_old_versions_and_delete_markers():
+    objects = list(iter_inventory_objects(CSV_MANIFEST))
+
+    assert [obj["key"] for obj in objects] == CURRENT_KEYS
+    assert objects[1] == {
+        "key": "logs/2024/app-two.log",
+        "size": 2048,
+        "last_modified": datetime.datetime(2024, 1, 1, 11, 15, 30, tzinfo=datetime.timezone.utc),
+        "storage_class": "STANDARD_IA",
+    }
+
+
+def test_iter_inventory_objects_decodes_url_encoded_keys():
+    objects = {obj["key"]: obj for obj in iter_inventory_objects(CSV_MANIFEST)}
+
+    assert objects["logs/2024/app one.log"]["size"] == 1024
+    assert objects["reports/q1 summary.csv"]["storage_class"] == "GLACIER"
+    assert objects["reports/a+b.csv"]["last_modified"] == datetime.datetime(
+        2024, 1, 1, 8, 0, 1, tzinfo=datetime.timezone.utc
+    )
+    assert objects["data/été.json"]["size"] == 0
+
+
+def test_iter_inventory_objects_filters_by_prefix():
+    assert [obj["key"] for obj in iter_inventory_objects(CSV_MANIFEST, prefix="reports/")] == [
+        "reports/q1 summary.csv",
+        "reports/a+b.csv",
+    ]
+
+
+def test_iter_inventory_objects_stops_at_max_keys():
+    assert [obj["key"] for obj in iter_inventory_objects(CSV_MANIFEST, max_keys=3)] == CURRENT_KEYS[:3]
+
+
+def test_iter_inventory_objects_reads_files_in_parallel():
+    objects = list(iter_inventory_objects(CSV_MANIFEST, max_workers=4))
+    assert sorted(obj["key"] for obj in objects) == sorted(CURRENT_KEYS)
+
+    limited = list(iter_inventory_objects(CSV_MANIFEST, prefix="logs/", max_keys=1, max_workers=4))
+    assert len(limited) == 1
+    assert limited[0]["key"].startswith("logs/")
+
+
+def test_iter_inventory_objects_checks_the_source_bucket():
+    assert len(list(iter_inventory_objects(CSV_MANIFEST, bucket_name="example-bucket"))) == len(CURRENT_KEYS)
+
+    with pytest.raises(ValueError, match="lists bucket 'example-bucket'"):
+        list(iter_inventory_objects(CSV_MANIFEST, bucket_name="other-bucket"))
+
+
+def test_iter_inventory_objects_reports_missing_data_files(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({"fileFormat": "CSV", "fileSchema": "Key", "files": [{"key": "missing.csv.gz"}]}))
+
+    with pytest.raises(ValueError, match="Failed to open inventory file"):
+        list(iter_inventory_objects(str(manifest)))
+
+
+def test_iter_inventory_objects_reads_parquet(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    date_dir = tmp_path / "2024-01-02T01-00Z"
+    data_dir = tmp_path / "data"
+    date_dir.mkdir()
+    data_dir.mkdir()
+    modified = datetime.datetime(2024, 1, 1, 10, 0, tzinfo=datetime.timezone.utc)
+    table = pa.table(
+        {
+            "bucket": ["example-bucket"] * 4,
+            "key": ["logs/a.log", "logs/b.log", "logs/b.log", "reports/c.csv"],
+            "is_latest": [True, False, True, True],
+            "is_delete_marker": [False, False, False, False],
+            "size": [1, 2, 3, 4],
+            "last_modified_date": [modified] * 4,
+            "storage_class": ["STANDARD", "STANDARD", "GLACIER", None],
+        }
+    )
+    pq.write_table(table, str(data_dir / "part-0.parquet"), row_group_size=2)
+    manifest = date_dir / "manifest.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "sourceBucket": "example-bucket",
+                "fileFormat": "Parquet",
+                "files": [{"key": "example-bucket/daily/data/part-0.parquet"}],
+            }
+        )
+    )
+
+    objects = list(iter_inventory_objects(str(manifest), prefix="logs/"))
+
+    assert [(obj["key"], obj["size"], obj["storage_class"]) for obj in objects] == [
+        ("logs/a.log", 1, "STANDARD"),
+        ("logs/b.log", 3, "GLACIER"),
+    ]
+    assert objects[0]["last_modified"] == modified
+    assert [obj["storage_class"] for obj in iter_inventory_objects(str(manifest), prefix="reports/")] == ["STANDARD"]
@@ -0,0 +1,111 @@
+import bisect
+import datetime
+
+import pytest
+
+from aws_vibe_guru import aws_s3
+
+MODIFIED = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class FakeS3:
+    """ListObjectsV2 over a sorted list of keys, with the paging rules of S3."""
+
+    def __init__(self, keys):
+        self.keys = sorted(keys)
+        self.calls = 0
+
+    def list_objects_v2(
+        self, Bucket, Prefix="", Delimiter=None, StartAfter=None, ContinuationToken=None, MaxKeys=1000
+    ):
+        self.calls += 1
+        index = int(ContinuationToken) if ContinuationToken else bisect.bisect_right(self.keys, StartAfter or "")
+        contents, common_prefixes = [], []
+        while index < len(self.keys) and len(contents) + len(common_prefixes) < MaxKeys:
+            key = self.keys[index]
+            index += 1
+            if not key.startswith(Prefix):
+                if key > Prefix:
+                    break
+                continue
+            folder_end = key.find(Delimiter, len(Prefix)) if Delimiter else -1
+            if folder_end >= 0:
+                folder = key[: folder_end + 1]
+                if not common_prefixes or common_prefixes[-1] != folder:
+                    common_prefixes.append(folder)
+                continue
+            contents.append({"Key": key, "Size": len(key), "LastModified": MODIFIED})
+        truncated = any(key.startswith(Prefix) for key in self.keys[index : index + 1])
+        response = {"Contents": contents, "CommonPrefixes": [{"Prefix": p} for p in common_prefixes]}
+        response["IsTruncated"] = truncated
+        if truncated:
+            response["NextContinuationToken"] = str(index)
+        return response
+
+
+@pytest.fixture
+def fake_s3(monkeypatch):
+    def install(keys):
+        client = FakeS3(keys)
+        monkeypatch.setattr(aws_s3, "create_s3_connection", lambda *args, **kwargs: client)
+        return client
+
+    return install
+
+
+def _list(max_workers, **kwargs):
+    return [obj["key"] for obj in aws_s3.iter_bucket_objects("bucket", max_workers=max_workers, **kwargs)]
+
+
+KEY_SHAPES = {
+    "date-stamped": [f"2024-01-01T{index:08d}.json" for index in range(20000)],
+    "one big folder": [f"logs/app-{index:06d}.log" for index in range(12000)],
+    "folders": [f"events/{index // 3000:03d}/{index % 3000:05d}.json" for index in range(12000)],
+    "hex": [f"{(index * 2654435761) % 2**32:08x}" for index in range(12000)],
+    "tiny": ["a", "b/c", "b/d/e"],
+}
+
+
+@pytest.mark.parametrize("shape", sorted(KEY_SHAPES))
+def test_parallel_listing_matches_the_sequential_one(fake_s3, shape):
+    client = fake_s3(KEY_SHAPES[shape])
+    sequential = _list(1)
+    sequential_calls = client.calls
+    client.calls = 0
+
+    assert _list(8) == sequential == sorted(KEY_SHAPES[shape])
+    assert client.calls <= sequential_calls * 1.6 + 2
+
+
+def test_long_shared_prefixes_are_split_across_workers(fake_s3):
+    keys = [f"2024-01-01T{index:08d}.json" for index in range(100000)]
+    client = fake_s3(keys)
+
+    partitions = aws_s3._discover_partitions("bucket", "", 16, 8)
+    sizes = [
+        len(partition)
+        if isinstance(partition, list)
+        else bisect.bisect_right(keys, partition[2] or "\U0010ffff") - bisect.bisect_right(keys, partition[1])
+        for partition in partitions
+    ]
+
+    assert sum(sizes) == len(keys)
+    assert len(partitions) >= 16
+    assert max(sizes) <= len(keys) // 8
+    assert client.calls < len(keys) // 1000 // 2
+
+
+def test_parallel_listing_respects_prefix_and_max_keys(fake_s3):
+    fake_s3(KEY_SHAPES["folders"] + KEY_SHAPES["date-stamped"])
+
+    assert _list(8, prefix="events/001/") == [f"events/001/{index:05d}.json" for index in range(3000)]
+    assert _list(8, max_keys=5) == sorted(KEY_SHAPES["date-stamped"])[:5]
+
+
+def test_summarize_bucket_objects_lists_in_parallel(fake_s3):
+    fake_s3(KEY_SHAPES["one big folder"])
+
+    summary = aws_s3.summarize_bucket_objects("bucket", max_workers=4)
+
+    assert summary["total_objects"] == 12000
+    assert summary["total_size"] == sum(map(len, KEY_SHAPES["one big folder"]))
@@ -0,0 +1,81 @@
+import re
+
+import pytest
+
+from aws_vibe_guru import aws_s3
+
+
+def _search(monkeypatch, chunks, pattern, first_match_only=False):
+    closed = []
+
+    def read_object_stream(bucket_name, object_key, encoding):
+        def stream():
+            try:
+                yield from chunks
+            finally:
+                closed.append(object_key)
+
+        return {"total_size": sum(map(len, chunks)), "is_binary": False, "chunks": stream()}
+
+    monkeypatch.setattr(aws_s3, "read_object_stream", read_object_stream)
+    records = list(
+        aws_s3._search_object("bucket", "key", re.compile(pattern, re.MULTILINE), "utf-8", first_match_only)
+    )
+    assert closed == ["key"]
+    assert [record["complete"] for record in records] == [False] * (len(records) - 1) + [True]
+    return records
+
+
+def _matches(records):
+    return [(match["line_number"], match["line"]) for record in records for match in record["matches"]]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1000])
+def test_search_object_reports_matching_lines_across_chunks(monkeypatch, chunk_size):
+    text = "alpha\nbeta error\r\ngamma\nerror at end"
+    chunks = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+
+    assert _matches(_search(monkeypatch, chunks, "error")) == [(2, "beta error"), (4, "error at end")]
+
+
+def test_search_object_yields_matches_before_the_object_is_read(monkeypatch):
+    records = _search(monkeypatch, ["one error\n", "two\n", "three error\n"], "error")
+
+    assert [(record["matches"], record["complete"]) for record in records] == [
+        ([{"line_number": 1, "line": "one error"}], False),
+        ([{"line_number": 3, "line": "three error"}], False),
+        ([], True),
+    ]
+
+
+def test_search_object_stops_at_the_first_match(monkeypatch):
+    records = _search(monkeypatch, ["one error\n", "two error\n"], "error", first_match_only=True)
+
+    assert len(records) == 1
+    assert _matches(records) == [(1, "one error")]
+
+
+def test_search_object_bounds_long_lines(monkeypatch):
+    filler = "x" * aws_s3.DEFAULT_CHUNK_SIZE
+    chunks = [filler] * 4 + ["x" * 100 + "needle" + "x" * 100] + [filler] * 4 + ["needle\nshort needle\n"]
+
+    records = _search(monkeypatch, chunks, "needle")
+
+    assert [number for number, _ in _matches(records)] == [1, 2]
+    long_line = records[0]["matches"][0]["line"]
+    assert "needle" in long_line
+    assert len(long_line) <= len("needle") + 2 * aws_s3.LONG_LINE_CONTEXT_CHARS
+    assert _matches(records)[1] == (2, "short needle")
+
+
+def test_search_object_finds_matches_across_window_boundaries(monkeypatch):
+    head = "x" * (aws_s3.MAX_SEARCH_LINE_CHARS - 3)
+    chunks = [head + "need", "le" + "x" * aws_s3.DEFAULT_CHUNK_SIZE, "x" * aws_s3.DEFAULT_CHUNK_SIZE]
+
+    assert [number for number, _ in _matches(_search(monkeypatch, chunks, "needle"))] == [1]
+
+
+def test_search_object_does_not_anchor_at_window_boundaries(monkeypatch):
+    chunks = ["x" * aws_s3.DEFAULT_CHUNK_SIZE] * 3 + ["abc\nabc"]
+
+    assert _matches(_search(monkeypatch, chunks, "^abc")) == [(2, "abc")]
@@ -0,0 +1,83 @@
+import pytest
+from botocore.exceptions import ClientError
+
+from aws_vibe_guru import aws_sqs
+
+
+def _error(code):
+    try:
+        raise ClientError({"Error": {"Code": code, "Message": code}}, "GetMetricData")
+    except ClientError as error:
+        try:
+            raise ValueError(f"Failed to get metric data: {error}") from error
+        except ValueError as wrapped:
+            return wrapped
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """Stub analyze_queues_volume with a function giving the error a batch raises (or None)."""
+
+    def install(outcome):
+        calls, sleeps = [], []
+
+        def analyze_queues_volume(queue_urls, days):
+            calls.append(list(queue_urls))
+            error = outcome(queue_urls)
+            if error:
+                raise error
+            return {queue_url: {"queue_url": queue_url} for queue_url in queue_urls}
+
+        monkeypatch.setattr(aws_sqs, "analyze_queues_volume", analyze_queues_volume)
+        monkeypatch.setattr(aws_sqs.time, "sleep", sleeps.append)
+        return calls, sleeps
+
+    return install
+
+
+QUEUES = [f"https://sqs/queue-{index}" for index in range(8)]
+
+
+def test_throttled_batches_are_retried_whole_after_a_backoff(batches):
+    throttled = iter([_error("ThrottlingException"), _error("Throttling")])
+    calls, sleeps = batches(lambda queue_urls: next(throttled, None))
+
+    results = aws_sqs._analyze_batch_volume(QUEUES, 15)
+
+    assert calls == [QUEUES] * 3
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= aws_sqs.BATCH_THROTTLE_BACKOFF_SECONDS
+    assert 0 <= sleeps[1] <= 2 * aws_sqs.BATCH_THROTTLE_BACKOFF_SECONDS
+    assert [(queue_url, error) for queue_url, _, error in results] == [(queue_url, None) for queue_url in QUEUES]
+
+
+def test_throttled_batches_fail_whole_once_the_retries_are_exhausted(batches):
+    error = _error("ThrottlingException")
+    calls, sleeps = batches(lambda queue_urls: error)
+
+    results = aws_sqs._analyze_batch_volume(QUEUES, 15)
+
+    assert calls == [QUEUES] * (aws_sqs.BATCH_THROTTLE_RETRIES + 1)
+    assert len(sleeps) == aws_sqs.BATCH_THROTTLE_RETRIES
+    assert results == [(queue_url, None, error) for queue_url in QUEUES]
+
+
+def test_invalid_queues_are_isolated_by_splitting_the_batch(batches):
+    error = _error("InvalidParameterValue")
+    calls, sleeps = batches(lambda queue_urls: error if QUEUES[5] in queue_urls else None)
+
+    results = aws_sqs._analyze_batch_volume(QUEUES, 15)
+
+    assert sleeps == []
+    assert calls == [QUEUES, QUEUES[:4], QUEUES[4:], QUEUES[4:6], QUEUES[4:5], QUEUES[5:6], QUEUES[6:]]
+    assert [queue_url for queue_url, _, result_error in results if result_error] == [QUEUES[5]]
+    assert [queue_url for queue_url, _, _ in results] == QUEUES
+
+
+def test_iter_queues_volume_yields_results_in_input_order(batches):
+    batches(lambda queue_urls: _error("InvalidParameterValue") if QUEUES[2] in queue_urls else None)
+
+    results = list(aws_sqs.iter_queues_volume(QUEUES, 15, concurrency=3))
+
+    assert [queue_url for queue_url, _, _ in results] == QUEUES
+    assert [queue_url for queue_url, analysis, _ in results if analysis is None] == [QUEUES[2]]
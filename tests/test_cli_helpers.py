@@ -0,0 +1,136 @@
+import json
+
+import pytest
+from rich.console import Console
+
+from aws_vibe_guru.cli_helpers import create_bar_chart, create_trace_table, iter_json_pretty, iter_ndjson_pretty
+
+
+def _pretty(text, chunk_size=None, **kwargs):
+    chunks = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)] if chunk_size else [text]
+    return "".join(iter_json_pretty(chunks, **kwargs))
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 3])
+def test_iter_json_pretty_reindents_and_normalizes_numbers(chunk_size):
+    text = '{"a":[1,{"b":null}],"c":"x,y:[z]","d":-1.5e3,"e":{},"f":[]}'
+
+    assert _pretty(text, chunk_size) == (
+        '{\n  "a": [\n    1,\n    {\n      "b": null\n    }\n  ],\n  "c": "x,y:[z]",\n'
+        '  "d": -1500.0,\n  "e": {},\n  "f": []\n}\n'
+    )
+    assert json.loads(_pretty(text, chunk_size)) == json.loads(text)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 5])
+def test_iter_json_pretty_matches_json_dumps(chunk_size):
+    text = (
+        '{"caf\\u00e9":"a\\/b \\"q\\" \\ud83d\\ude00\\n","n":[1E5,-0,-0.0,0.10,2.5e-7,12345678901234567890,1e400],'
+        '"plain":"é \\\\","k":{"x":[true,false,null,[],{}]}}'
+    )
+    # Out of range numbers keep their spelling instead of becoming Infinity
+    expected = json.dumps(json.loads(text), indent=2, ensure_ascii=False).replace("Infinity", "1e400")
+
+    assert _pretty(text, chunk_size) == expected + "\n"
+
+
+def test_iter_json_pretty_rejects_invalid_escapes():
+    with pytest.raises(ValueError, match="Invalid JSON string"):
+        _pretty('["\\x41"]')
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["[1 2]", '{"a" 1}', "[1,]", '{"a":1,}', "[,1]", '{"a":}', "{1:2}", "[tru]", "[1]]", '"a":1', "[1", '["a'],
+)
+@pytest.mark.parametrize("chunk_size", [None, 1])
+def test_iter_json_pretty_rejects_malformed_json(text, chunk_size):
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        _pretty(text, chunk_size)
+
+
+def test_iter_json_pretty_limits_records():
+    assert _pretty("[1,2,3]", max_records=2) == "[\n  1,\n  2\n]\n"
+    assert _pretty('{"a":1} {"b":2}', max_records=1) == '{\n  "a": 1\n}\n'
+    assert _pretty("[1,2,3]", max_records=0) == ""
+
+
+def test_iter_ndjson_pretty_limits_records():
+    text = '{"a":1}\nnot json\n{"b":2}\n'
+
+    assert "".join(iter_ndjson_pretty([text])) == '{\n  "a": 1\n}\nnot json\n{\n  "b": 2\n}\n'
+    assert "".join(iter_ndjson_pretty([text], max_records=1)) == '{\n  "a": 1\n}\n'
+    assert "".join(iter_ndjson_pretty([text], max_records=0)) == ""
+
+
+TRACE_SUMMARY = [
+    {
+        "service": service,
+        "operation": operation,
+        "calls": 1200,
+        "errors": 3,
+        "retries": 12,
+        "throttled": 4,
+        "p50_ms": 21.5,
+        "p90_ms": 88.2,
+        "p99_ms": 350.9,
+        "max_ms": 1204.7,
+        "total_ms": 45210.0,
+        "request_bytes": 3_400_000,
+        "response_bytes": 120_000_000,
+    }
+    for service, operation in [("cloudwatch", "GetMetricData"), ("sqs", "GetQueueUrl")]
+]
+
+
+@pytest.mark.parametrize("width", [80, 200])
+def test_create_trace_table_shows_every_value_within_the_width(width):
+    console = Console(width=width, record=True, color_system=None)
+    console.print(create_trace_table(TRACE_SUMMARY, 50.0, max_width=width))
+    output = console.export_text()
+
+    assert "…" not in output
+    assert max(len(line) for line in output.splitlines()) <= width
+    for text in ("cloudwatch.GetMetricData", "Calls", "Thr", "p99", "Total", "1,200", "1,204.7", "45,210"):
+        assert text in output
+
+
+def _days(count, **series):
+    return [
+        {"date": f"2024-01-{index % 28 + 1:02d}", **{key: values[index] for key, values in series.items()}}
+        for index in range(count)
+    ]
+
+
+def test_create_bar_chart_draws_one_slot_per_point():
+    lines = create_bar_chart(_days(5, value=[0, 10, 20, 30, 40]), height=4)
+
+    assert lines[0].startswith("      40 ┬")
+    assert [line.count("█") for line in lines[:4]] == [1, 2, 3, 4]
+    assert lines[5].split() == ["01-01", "01-02", "01-03", "01-04", "01-05"]
+
+
+def test_create_bar_chart_keeps_peaks_when_downsampling_to_the_width():
+    values = [1] * 100
+    values[37] = 1000
+    lines = create_bar_chart(_days(100, value=values), height=4, max_width=50)
+
+    assert max(len(line) for line in lines) <= 50
+    bars = lines[3][10:]
+    # 40 columns of 2 or 3 points each; the spike stays in the column holding point 37
+    assert len(bars) == 40
+    assert lines[0][10:].index("█") == 15 == next(column for column in range(40) if 100 * (column + 1) // 40 > 37)
+    assert lines[0].count("█") == 1
+    assert lines[4].strip() == "└" + "─" * 40
+
+
+def test_create_bar_chart_draws_series_side_by_side_with_a_legend():
+    lines = create_bar_chart(_days(3, sent=[1, 2, 3], received=[3, 2, 1]), height=3, value_keys=["sent", "received"])
+
+    assert lines[-1].split() == ["█", "sent", "▓", "received"]
+    assert lines[0].count("█") == lines[0].count("▓") == 1
+    assert lines[2].count("█") == lines[2].count("▓") == 3
+
+
+def test_create_bar_chart_without_data():
+    assert create_bar_chart([]) == []
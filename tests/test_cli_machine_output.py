@@ -0,0 +1,84 @@
+import csv
+import io
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from aws_vibe_guru import aws_sqs, cli
+
+QUEUE_URLS = {"orders": "https://sqs/orders", "payments": "https://sqs/payments"}
+
+
+def _analysis(queue_url):
+    return {"queue_url": queue_url, "max_volume": 10, "mean_volume": 5.0}
+
+
+@pytest.fixture
+def queues(monkeypatch):
+    def resolve_queue_urls(queue_names):
+        return {name: QUEUE_URLS[name] for name in queue_names if name in QUEUE_URLS}
+
+    def iter_queues_volume(queue_urls, days, concurrency):
+        for queue_url in queue_urls:
+            yield queue_url, _analysis(queue_url), None
+
+    def watch_queue_counts(queue_urls, **kwargs):
+        for iteration in range(kwargs["iterations"]):
+            yield [{"url": url, "visible": iteration, "in_flight": 0} for url in queue_urls]
+
+    monkeypatch.setattr(aws_sqs, "resolve_queue_urls", resolve_queue_urls)
+    monkeypatch.setattr(aws_sqs, "iter_queues_volume", iter_queues_volume)
+    monkeypatch.setattr(aws_sqs, "watch_queue_counts", watch_queue_counts)
+
+
+def _parse(output_format, text):
+    if output_format == "json":
+        return json.loads(text)
+    if output_format == "ndjson":
+        return [json.loads(line) for line in text.splitlines()]
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+def _invoke(output_format, *args):
+    return CliRunner().invoke(cli.app, ["--output", output_format, *args])
+
+
+@pytest.mark.parametrize("output_format", ["json", "ndjson", "csv"])
+def test_sqs_analyze_volume_writes_one_record_per_queue(queues, output_format):
+    result = _invoke(output_format, "sqs-analyze-volume", "orders", "missing", "payments")
+
+    assert result.exit_code == 0
+    records = _parse(output_format, result.stdout)
+    assert [record["queue_name"] for record in records] == ["orders", "payments"]
+    assert [str(record["max_volume"]) for record in records] == ["10", "10"]
+    assert "Queue 'missing' not found" in result.stderr
+
+
+@pytest.mark.parametrize("output_format", ["json", "ndjson", "csv"])
+def test_sqs_watch_writes_one_record_per_queue_and_refresh(queues, output_format):
+    result = _invoke(output_format, "sqs-watch", "orders", "payments", "--iterations", "2")
+
+    assert result.exit_code == 0
+    records = _parse(output_format, result.stdout)
+    assert [(record["queue_name"], str(record["visible"])) for record in records] == [
+        ("orders", "0"),
+        ("payments", "0"),
+        ("orders", "1"),
+        ("payments", "1"),
+    ]
+
+
+@pytest.mark.parametrize("command", [["sqs-analyze-volume", "orders"], ["sqs-watch", "orders", "--iterations", "1"]])
+@pytest.mark.parametrize("output_format", ["json", "ndjson", "csv"])
+def test_queue_lookup_errors_exit_with_status_1(queues, monkeypatch, command, output_format):
+    def resolve_queue_urls(queue_names):
+        raise ValueError("Failed to list queues: AccessDenied")
+
+    monkeypatch.setattr(aws_sqs, "resolve_queue_urls", resolve_queue_urls)
+
+    result = _invoke(output_format, *command)
+
+    assert result.exit_code == 1
+    assert _parse(output_format, result.stdout) == []
+    assert "Error: Failed to list queues: AccessDenied" in result.stderr
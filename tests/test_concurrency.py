@@ -0,0 +1,163 @@
+import threading
+import time
+
+import pytest
+
+from aws_vibe_guru.concurrency import bounded_chain, bounded_map
+
+WAIT_SECONDS = 5
+
+
+def test_bounded_map_yields_in_input_order():
+    def func(item):
+        time.sleep(0.01 * (5 - item))
+        return item * 10
+
+    assert list(bounded_map(func, range(5), max_workers=5)) == [(item, item * 10, None) for item in range(5)]
+
+
+def test_bounded_map_unordered_yields_as_soon_as_an_item_completes():
+    first_done = threading.Event()
+
+    def func(item):
+        if item == 0:
+            assert first_done.wait(WAIT_SECONDS)
+        return item
+
+    outcomes = []
+    for outcome in bounded_map(func, range(2), max_workers=2, ordered=False):
+        outcomes.append(outcome)
+        first_done.set()
+
+    assert outcomes == [(1, 1, None), (0, 0, None)]
+
+
+def test_bounded_map_returns_errors_with_their_item():
+    def func(item):
+        if item == 2:
+            raise KeyError(item)
+        return item
+
+    outcomes = list(bounded_map(func, range(4), max_workers=2))
+
+    assert [(item, result) for item, result, _ in outcomes] == [(0, 0), (1, 1), (2, None), (3, 3)]
+    assert [type(error) for _, _, error in outcomes] == [type(None)] * 2 + [KeyError] + [type(None)]
+
+
+def test_bounded_map_pulls_at_most_max_pending_items_ahead():
+    pulled = []
+
+    def items():
+        for item in range(100):
+            pulled.append(item)
+            yield item
+
+    outcomes = bounded_map(lambda item: item, items(), max_workers=2, max_pending=3)
+    next(outcomes)
+
+    assert pulled == [0, 1, 2]
+    outcomes.close()
+
+
+def test_bounded_map_caps_the_pending_weight():
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def func(item):
+        with lock:
+            running.append(item)
+            peak.append(sum(running))
+        time.sleep(0.02)
+        with lock:
+            running.remove(item)
+        return item
+
+    items = [4, 4, 4, 4, 20, 1, 1]
+    outcomes = list(bounded_map(func, items, max_workers=8, weight=lambda item: item, max_pending_weight=10))
+
+    assert [result for _, result, _ in outcomes] == items
+    # An item heavier than the budget still runs, alone
+    assert max(peak) == 20
+    assert all(total <= 10 for total in peak if total != 20)
+
+
+def test_bounded_map_cancels_pending_items_when_closed():
+    calls = []
+
+    def func(item):
+        calls.append(item)
+        time.sleep(0.01)
+        return item
+
+    outcomes = bounded_map(func, range(100), max_workers=2, max_pending=2)
+    assert next(outcomes) == (0, 0, None)
+    outcomes.close()
+    time.sleep(0.1)
+
+    assert len(calls) <= 3
+
+
+def _values(item, count=3):
+    for index in range(count):
+        yield f"{item}.{index}"
+
+
+@pytest.mark.parametrize("max_buffered", [1, 4])
+def test_bounded_chain_yields_item_after_item(max_buffered):
+    values = list(bounded_chain(_values, range(5), max_workers=3, max_buffered=max_buffered))
+
+    assert values == [f"{item}.{index}" for item in range(5) for index in range(3)]
+
+
+def test_bounded_chain_unordered_interleaves_the_workers():
+    second_started = threading.Event()
+
+    def func(item):
+        if item == 0:
+            assert second_started.wait(WAIT_SECONDS)
+        yield item
+        second_started.set()
+
+    assert list(bounded_chain(func, range(2), max_workers=2)) == [0, 1]
+    second_started.clear()
+    assert list(bounded_chain(func, range(2), max_workers=2, ordered=False)) == [1, 0]
+
+
+def test_bounded_chain_raises_the_error_of_an_item_after_its_values():
+    def func(item):
+        yield item
+        if item == 1:
+            raise KeyError(item)
+        yield item
+
+    values = []
+    with pytest.raises(KeyError):
+        for value in bounded_chain(func, range(4), max_workers=2):
+            values.append(value)
+
+    assert values == [0, 0, 1]
+
+
+def test_bounded_chain_stops_and_closes_the_generators_when_closed():
+    produced, closed, started = [], [], []
+
+    def func(item):
+        started.append(item)
+        try:
+            for index in range(1000):
+                produced.append(index)
+                yield index
+        finally:
+            closed.append(item)
+
+    values = bounded_chain(func, range(100), max_workers=2)
+    assert [next(values) for _ in range(3)] == [0, 1, 2]
+    values.close()
+
+    assert sorted(closed) == sorted(started) == [0, 1]
+    count = len(produced)
+    assert count < 20
+    # Nothing goes on in the background once close() returned
+    time.sleep(0.05)
+    assert len(produced) == count
@@ -0,0 +1,33 @@
+import importlib.util
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+spec = importlib.util.spec_from_file_location("check_startup", os.path.join(ROOT, "scripts", "check_startup.py"))
+check_startup = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(check_startup)
+
+
+def _loaded_modules_output(program):
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [os.path.join(ROOT, "src"), os.environ.get("PYTHONPATH")])),
+    }
+    result = subprocess.run([sys.executable, "-c", program], env=env, capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+@pytest.mark.parametrize(
+    "program, lazy_modules",
+    [
+        (check_startup.IMPORT_PROGRAM, check_startup.LAZY_MODULES + check_startup.HELP_MODULES),
+        (check_startup.HELP_PROGRAM, check_startup.LAZY_MODULES),
+    ],
+    ids=["import", "help"],
+)
+def test_cli_startup_leaves_lazy_modules_unimported(program, lazy_modules):
+    assert check_startup.imported_lazy_modules(_loaded_modules_output(program), lazy_modules) == []
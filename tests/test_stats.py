@@ -0,0 +1,106 @@
+import math
+import statistics
+
+import pytest
+
+from aws_vibe_guru import stats
+
+ROWS = [
+    [4, 8, 15, 16, 23, 42],
+    [2.5, None, 7.5, 10.0, None, 5.0],
+    [5, 3, 5, 1, None, 3],
+    [7, 7, 7, 7],
+    [None, None, None],
+    [],
+    [9],
+]
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    """Run a test against the pure Python fallback and, when installed, against NumPy."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(stats, "np", None)
+    return request.param
+
+
+def test_mean_median_and_population_std(backend):
+    first, second = stats.compute_matrix_statistics(ROWS[:2])
+
+    assert first["count"] == 6
+    assert first["total"] == 108
+    assert first["mean"] == 18
+    assert first["median"] == 15.5
+    assert first["std"] == pytest.approx(statistics.pstdev(ROWS[0]))
+    assert first["std"] != pytest.approx(statistics.stdev(ROWS[0]))
+    assert (first["min"], first["max"]) == (4, 42)
+
+    # Missing buckets are ignored by every statistic
+    assert second["count"] == 4
+    assert second["total"] == 25.0
+    assert second["mean"] == 6.25
+    assert second["median"] == 6.25
+    assert second["std"] == pytest.approx(math.sqrt(7.8125))
+
+
+def test_percentiles_are_linearly_interpolated(backend):
+    (row,) = stats.compute_matrix_statistics([ROWS[0]], percentiles=(0, 25, 90, 100))
+
+    # Ranks 0, 1.25, 4.5 and 5 over the sorted values 4, 8, 15, 16, 23, 42
+    assert row["percentiles"] == pytest.approx({"p0": 4, "p25": 9.75, "p90": 32.5, "p100": 42})
+
+
+def test_zscores_follow_the_row_and_are_zero_without_spread(backend):
+    second, constant, single = stats.compute_matrix_statistics([ROWS[1], ROWS[3], ROWS[6]])
+
+    std = math.sqrt(7.8125)
+    assert second["zscores"] == pytest.approx([-3.75 / std, None, 1.25 / std, 3.75 / std, None, -1.25 / std])
+    assert constant["std"] == 0
+    assert constant["zscores"] == [0.0] * 4
+    assert single["zscores"] == [0.0]
+
+
+def test_max_ties_resolve_to_the_earliest_bucket(backend):
+    ties, constant, single = stats.compute_matrix_statistics([ROWS[2], ROWS[3], ROWS[6]])
+
+    assert (ties["max"], ties["max_index"], ties["second_max_index"]) == (5, 0, 2)
+    assert (constant["max_index"], constant["second_max_index"]) == (0, 1)
+    assert (single["max_index"], single["second_max_index"]) == (0, None)
+
+
+def test_rows_without_datapoints(backend):
+    missing, empty = stats.compute_matrix_statistics([ROWS[4], []])
+
+    assert missing == stats._empty_statistics(ROWS[4], stats.DEFAULT_PERCENTILES)
+    assert empty["count"] == 0
+    assert empty["zscores"] == []
+
+
+def test_season_change(backend):
+    (row,) = stats.compute_matrix_statistics([[1, 2, None, 3, 4, 5]], season_length=3)
+
+    assert (row["previous_season_total"], row["last_season_total"]) == (3, 12)
+    assert row["season_change_percent"] == 300
+
+
+def _rounded(value):
+    if isinstance(value, float):
+        return round(value, 9)
+    if isinstance(value, dict):
+        return {key: _rounded(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_rounded(item) for item in value]
+    return value
+
+
+def test_numpy_matches_the_pure_python_fallback(monkeypatch):
+    pytest.importorskip("numpy")
+    percentiles = (0, 10, 50, 95, 99.9, 100)
+
+    vectorized = stats.compute_matrix_statistics(ROWS, percentiles=percentiles, season_length=2)
+    monkeypatch.setattr(stats, "np", None)
+    fallback = stats.compute_matrix_statistics(ROWS, percentiles=percentiles, season_length=2)
+
+    assert _rounded(vectorized) == _rounded(fallback)